@@ -14,10 +14,14 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA @UnusedWildImport
 
+import threading
+import time
 from fnmatch import fnmatch
 
 from obspy import Stream, UTCDateTime
-from obspy.clients.earthworm.waveserver import get_menu, read_wave_server_v
+from obspy.clients.earthworm.waveserver import (
+    WaveServerConnectionPool, get_menu, read_wave_server_v)
+from obspy.core.util.base import _parallel_map
 
 
 class Client(object):
@@ -34,8 +38,17 @@ class Client(object):
     :type debug: bool, optional
     :param debug: Enables verbose output of the connection handling (default is
         ``False``).
+    :type max_connections: int, optional
+    :param max_connections: Maximum number of persistent connections to the
+        server, which are also used to fetch data of several channels
+        concurrently (default is ``10``).
+    :type menu_cache_ttl: float, optional
+    :param menu_cache_ttl: Number of seconds the menu of the server (see
+        :meth:`get_availability`) is cached before it is requested again. By
+        default the menu is not cached.
     """
-    def __init__(self, host, port, timeout=None, debug=False):
+    def __init__(self, host, port, timeout=None, debug=False,
+                 max_connections=10, menu_cache_ttl=None):
         """
         Initializes a Earthworm Wave Server client.
 
@@ -45,6 +58,53 @@ class Client(object):
         self.port = port
         self.timeout = timeout
         self.debug = debug
+        self.max_connections = max_connections
+        self.menu_cache_ttl = menu_cache_ttl
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._menu_cache = None
+
+    def _get_pool(self):
+        """
+        Return the connection pool, a new one is created if the connection
+        settings have changed.
+        """
+        with self._pool_lock:
+            pool = self._pool
+            if pool is None or (pool.server, pool.port, pool.timeout,
+                                pool.max_connections) != (
+                    self.host, self.port, self.timeout,
+                    self.max_connections):
+                if pool is not None:
+                    pool.close()
+                pool = WaveServerConnectionPool(
+                    self.host, self.port, timeout=self.timeout,
+                    max_connections=self.max_connections)
+                self._pool = pool
+            return pool
+
+    def close(self):
+        """
+        Close all persistent connections to the server.
+        """
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+
+    def _get_menu(self):
+        """
+        Return the menu of the server, cached if requested.
+        """
+        now = time.time()
+        if self.menu_cache_ttl and self._menu_cache is not None:
+            timestamp, menu = self._menu_cache
+            if now - timestamp < self.menu_cache_ttl:
+                return menu
+        menu = self._get_pool().request(get_menu, self.host, self.port,
+                                        timeout=self.timeout)
+        self._menu_cache = (now, menu)
+        return menu
 
     def get_waveforms(self, network, station, location, channel, starttime,
                       endtime, cleanup=True):
@@ -97,20 +157,24 @@ class Client(object):
         """
         # replace wildcards in last char of channel and fetch all 3 components
         if channel[-1] in "?*":
-            st = Stream()
-            for comp in ("Z", "N", "E"):
-                channel_new = channel[:-1] + comp
-                st += self.get_waveforms(network, station, location,
-                                         channel_new, starttime, endtime,
-                                         cleanup=cleanup)
-            return st
+            requests = [(network, station, location, channel[:-1] + comp,
+                         starttime, endtime) for comp in ("Z", "N", "E")]
+            return self._get_waveforms_many(requests, cleanup=cleanup)
+        return self._get_waveforms(network, station, location, channel,
+                                   starttime, endtime, cleanup=cleanup)
+
+    def _get_waveforms(self, network, station, location, channel, starttime,
+                       endtime, cleanup=True):
+        """
+        Retrieves waveform data of a single channel without wildcards.
+        """
         if location == '':
             location = '--'
         scnl = (station, channel, network, location)
         # fetch waveform
-        tbl = read_wave_server_v(self.host, self.port, scnl, starttime,
-                                 endtime, timeout=self.timeout,
-                                 cleanup=cleanup)
+        tbl = self._get_pool().request(
+            read_wave_server_v, self.host, self.port, scnl, starttime,
+            endtime, timeout=self.timeout, cleanup=cleanup)
         # create new stream
         st = Stream()
         for tb in tbl:
@@ -120,6 +184,59 @@ class Client(object):
         st.trim(starttime, endtime)
         return st
 
+    def _get_waveforms_many(self, requests, cleanup=True):
+        """
+        Retrieves waveform data of many channels without wildcards
+        concurrently, using up to ``max_connections`` connections.
+        """
+        def _fetch(request):
+            return self._get_waveforms(*request, cleanup=cleanup)
+
+        st = Stream()
+        workers = min(self.max_connections, len(requests))
+        for st_ in _parallel_map(_fetch, requests, workers=workers):
+            st += st_
+        return st
+
+    def get_waveforms_bulk(self, bulk, cleanup=True):
+        """
+        Retrieves waveform data of many channels from Earthworm Wave Server.
+
+        The channels are requested concurrently over up to
+        ``max_connections`` persistent connections, which is much faster than
+        calling :meth:`get_waveforms` for one channel after the other.
+
+        :type bulk: list of tuple
+        :param bulk: List of (network, station, location, channel, starttime,
+            endtime) tuples. Network, station, location and channel codes may
+            contain wildcards (``*`` and ``?``), which are matched against
+            the channels available on the server (see
+            :meth:`get_availability`).
+        :type cleanup: bool
+        :param cleanup: Specifies whether perfectly aligned traces should be
+            merged or not. See :meth:`obspy.core.stream.Stream.merge` for
+            ``method=-1``.
+        :return: ObsPy :class:`~obspy.core.stream.Stream` object.
+
+        .. rubric:: Example
+
+        >>> from obspy.clients.earthworm import Client
+        >>> client = Client("pubavo1.wr.usgs.gov", 16022)
+        >>> dt = UTCDateTime() - 2000  # now - 2000 seconds
+        >>> st = client.get_waveforms_bulk(
+        ...     [('AV', 'ACH', '', 'BH?', dt, dt + 10),
+        ...      ('AV', 'ACH', '', 'EHZ', dt, dt + 10)])  # doctest: +SKIP
+        """
+        requests = []
+        for network, station, location, channel, starttime, endtime in bulk:
+            codes = (network, station, location, channel)
+            if any(char in code for code in codes for char in "*?"):
+                for item in self.get_availability(*codes):
+                    requests.append(item[:4] + (starttime, endtime))
+            else:
+                requests.append(codes + (starttime, endtime))
+        return self._get_waveforms_many(requests, cleanup=cleanup)
+
     def save_waveforms(self, filename, network, station, location, channel,
                        starttime, endtime, format="MSEED", cleanup=True):
         """
@@ -221,7 +338,8 @@ class Client(object):
         pattern = ".".join((network, station, location, channel))
         # get overview of all available data, winston wave servers can not
         # restrict the query via network, station etc. so we do that manually
-        response = get_menu(self.host, self.port, timeout=self.timeout)
+        # (possibly cached, see menu_cache_ttl)
+        response = self._get_menu()
         # reorder items and convert time info to UTCDateTime
         response = [(x[3], x[1], x[4], x[2], UTCDateTime(x[5]),
                      UTCDateTime(x[6])) for x in response]
@@ -6,13 +6,87 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA @UnusedWildImport
 
+import socket
+import socketserver
+import struct
+import threading
 import unittest
 
+import numpy as np
+
 from obspy import read
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util import NamedTemporaryFile
 from obspy.core.util.decorator import skip_on_network_error
 from obspy.clients.earthworm import Client
+from obspy.clients.earthworm.waveserver import (WaveServerConnection,
+                                                read_wave_server_v)
+
+
+def _tracebuf2(network, station, channel, starttime, data):
+    """
+    Return a little endian 4 byte integer TraceBuf2 packet.
+    """
+    rate = 100.0
+    endtime = starttime + (len(data) - 1) / rate
+    head = struct.pack(b'<2i3d7s9s4s3s2s3s2s2s', 0, len(data), starttime,
+                       endtime, rate, station.encode(), network.encode(),
+                       channel.encode(), b'--', b'20', b'i4', b'\x00\x00',
+                       b'\x00\x00')
+    return head + np.asarray(data, dtype='<i4').tobytes()
+
+
+class _FakeWaveServerHandler(socketserver.StreamRequestHandler):
+    """
+    Handles MENU and GETSCNLRAW requests on a persistent connection.
+    """
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                break
+            tokens = line.decode().split()
+            with server.lock:
+                server.requests.append(tokens[0])
+            if tokens[0] == 'MENU:':
+                entries = ' '.join(
+                    '0 %s %s %s -- %f %f i4' % (sta, cha, net, 0, 1000)
+                    for net, sta, cha in sorted(server.channels))
+                self.wfile.write(('%s %s\n' % (tokens[1], entries)).encode())
+            elif tokens[0] == 'GETSCNLRAW:':
+                rid, sta, cha, net, loc = tokens[1:6]
+                start, end = float(tokens[6]), float(tokens[7])
+                if (net, sta, cha) not in server.channels:
+                    self.wfile.write(('%s 0 %s %s %s %s FN\n' % (
+                        rid, sta, cha, net, loc)).encode())
+                    continue
+                # packets of one second covering the requested time span
+                data = b''.join(
+                    _tracebuf2(net, sta, cha, t,
+                               np.arange(100) + int(t) * 100)
+                    for t in range(int(start), int(end) + 1))
+                self.wfile.write(('%s 0 %s %s %s %s F i4 %f %f %d\n' % (
+                    rid, sta, cha, net, loc, start, end, len(data))).encode())
+                self.wfile.write(data)
+            if server.close_after_request:
+                break
+
+
+class _FakeWaveServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, channels):
+        socketserver.ThreadingTCPServer.__init__(
+            self, ('127.0.0.1', 0), _FakeWaveServerHandler)
+        self.channels = channels
+        self.connections = 0
+        self.requests = []
+        self.close_after_request = False
+        self.lock = threading.Lock()
 
 
 class ClientTestCase(unittest.TestCase):
@@ -116,9 +190,111 @@ class ClientTestCase(unittest.TestCase):
         self.assertIn('AV.ACH.--.BHZ', seeds)
 
 
+class FakeWaveServerTestCase(unittest.TestCase):
+    """
+    Test cases for connection handling against a local fake Wave Server.
+    """
+    def setUp(self):
+        channels = set(('XX', 'STA%d' % i, 'BH' + comp)
+                       for i in range(20) for comp in 'ZNE')
+        self.server = _FakeWaveServer(channels)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.port = self.server.server_address[1]
+        self.client = Client('127.0.0.1', self.port, timeout=10,
+                             max_connections=4)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_persistent_connections(self):
+        """
+        Several requests reuse the pooled connections.
+        """
+        start = UTCDateTime(10)
+        for _i in range(5):
+            st = self.client.get_waveforms('XX', 'STA1', '', 'BHZ', start,
+                                           start + 2)
+            self.assertEqual(len(st), 1)
+            self.assertEqual(st[0].id, 'XX.STA1..BHZ')
+            self.assertEqual(st[0].stats.starttime, start)
+            np.testing.assert_array_equal(st[0].data, np.arange(1000, 1201))
+        self.assertEqual(self.server.connections, 1)
+        # unknown channels return an empty stream and keep the connection
+        st = self.client.get_waveforms('XX', 'STA1', '', 'HHZ', start,
+                                       start + 2)
+        self.assertEqual(len(st), 0)
+        self.assertEqual(self.server.connections, 1)
+        # connections closed by the server are replaced transparently
+        self.server.close_after_request = True
+        for _i in range(3):
+            st = self.client.get_waveforms('XX', 'STA1', '', 'BHN', start,
+                                           start + 2)
+            self.assertEqual(len(st), 1)
+        # single requests without connection still work
+        tbl = read_wave_server_v('127.0.0.1', self.port,
+                                 ('STA2', 'BHE', 'XX', '--'), 10, 12,
+                                 cleanup=True)
+        self.assertEqual(len(tbl), 1)
+        self.assertEqual(tbl[0].ndata, 300)
+
+    def test_get_waveforms_bulk(self):
+        """
+        Tests fetching many channels at once with wildcards.
+        """
+        start = UTCDateTime(10)
+        st = self.client.get_waveforms_bulk(
+            [('XX', 'STA1?', '', 'BH*', start, start + 1),
+             ('XX', 'STA3', '', 'BHZ', start, start + 1)])
+        self.assertEqual(len(st), 10 * 3 + 1)
+        self.assertEqual(
+            sorted(tr.id for tr in st),
+            sorted(['XX.STA1%d..BH%s' % (i, comp) for i in range(10)
+                    for comp in 'ZNE'] + ['XX.STA3..BHZ']))
+        for tr in st:
+            self.assertEqual(tr.stats.npts, 101)
+        self.assertLessEqual(self.server.connections, 4)
+        # the wildcarded last character of the channel fetches ZNE in order
+        st = self.client.get_waveforms('XX', 'STA3', '', 'BH?', start,
+                                       start + 1)
+        self.assertEqual([tr.stats.channel for tr in st],
+                         ['BHZ', 'BHN', 'BHE'])
+
+    def test_menu_cache(self):
+        """
+        The menu is requested again only after the cache expired.
+        """
+        self.client.menu_cache_ttl = 60
+        for _i in range(3):
+            availability = self.client.get_availability('XX', 'STA1', '',
+                                                        'BHZ')
+            self.assertEqual(availability[0][:4], ('XX', 'STA1', '--', 'BHZ'))
+        self.assertEqual(self.server.requests.count('MENU:'), 1)
+        self.client.menu_cache_ttl = None
+        self.client.get_availability()
+        self.assertEqual(self.server.requests.count('MENU:'), 2)
+
+    def test_connection_read(self):
+        """
+        Tests reading from a raw connection.
+        """
+        connection = WaveServerConnection('127.0.0.1', self.port)
+        connection.send(b'MENU: rid SCNL')
+        line = connection.readline()
+        self.assertTrue(line.startswith(b'rid 0 STA0 BHE XX --'))
+        self.assertTrue(line.endswith(b'\n'))
+        connection.close()
+        self.assertTrue(connection.closed)
+        self.assertRaises(socket.error, connection.send, b'MENU: rid SCNL')
+
+
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(ClientTestCase, 'test'))
+    suite.addTest(unittest.makeSuite(FakeWaveServerTestCase, 'test'))
     return suite
 
 
@@ -16,6 +16,7 @@ from future.utils import native_str
 import socket
 import struct
 import sys
+import threading
 
 import numpy as np
 
@@ -204,9 +205,185 @@ def get_sock_bytes(sock, nbytes, timeout=None):
         return None
 
 
-def get_menu(server, port, scnl=None, timeout=None):
+class WaveServerConnection(object):
+    """
+    Persistent connection to a Wave Server.
+
+    Wave Servers answer any number of requests sent over the same connection,
+    so one connection can be used for many requests instead of connecting
+    for every single request. Replies are read through a buffered file
+    object, which is much faster than reading byte by byte.
+
+    :type server: str
+    :param server: Host name of the Wave Server.
+    :type port: int
+    :param port: Port of the Wave Server.
+    :type timeout: float, optional
+    :param timeout: Seconds before a connection timeout is raised.
+    """
+    def __init__(self, server, port, timeout=None):
+        self.server = server
+        self.port = port
+        self.sock = socket.create_connection((server, port), timeout)
+        self._file = self.sock.makefile('rb')
+        # number of requests sent over this connection
+        self.requests = 0
+        # whether the server closed the connection
+        self.eof = False
+        self.closed = False
+
+    def send(self, req_str):
+        """
+        Send a newline terminated request to the server.
+        """
+        if not req_str.endswith(b'\n'):
+            req_str += b'\n'
+        self.sock.sendall(req_str)
+        self.requests += 1
+
+    def readline(self):
+        """
+        Read one newline terminated line, returns ``None`` on timeout or if
+        the server closed the connection.
+        """
+        try:
+            line = self._file.readline()
+        except socket.timeout:
+            print('socket timeout in WaveServerConnection.readline()',
+                  file=sys.stderr)
+            self.close()
+            return None
+        if not line:
+            self.eof = True
+            self.close()
+            return None
+        return line
+
+    def read(self, nbytes):
+        """
+        Read ``nbytes`` bytes, returns ``None`` on timeout or if the server
+        closed the connection before.
+        """
+        try:
+            data = self._file.read(nbytes)
+        except socket.timeout:
+            print('socket timeout in WaveServerConnection.read()',
+                  file=sys.stderr)
+            self.close()
+            return None
+        if len(data) < nbytes:
+            self.eof = True
+            self.close()
+        return data or None
+
+    def close(self):
+        """
+        Close the connection.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._file.close()
+            self.sock.close()
+        except socket.error:
+            pass
+
+
+class WaveServerConnectionPool(object):
+    """
+    Thread-safe pool of persistent connections to a Wave Server.
+
+    At most ``max_connections`` connections are open at the same time,
+    :meth:`get` blocks until a connection is available.
+
+    :type server: str
+    :param server: Host name of the Wave Server.
+    :type port: int
+    :param port: Port of the Wave Server.
+    :type timeout: float, optional
+    :param timeout: Seconds before a connection timeout is raised.
+    :type max_connections: int, optional
+    :param max_connections: Maximum number of simultaneous connections.
+    """
+    def __init__(self, server, port, timeout=None, max_connections=10):
+        self.server = server
+        self.port = port
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._idle = []
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(max_connections)
+
+    def get(self):
+        """
+        Return an idle connection or open a new one.
+
+        :rtype: :class:`WaveServerConnection`
+        """
+        self._semaphore.acquire()
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        try:
+            return WaveServerConnection(self.server, self.port,
+                                        timeout=self.timeout)
+        except Exception:
+            self._semaphore.release()
+            raise
+
+    def put(self, connection):
+        """
+        Give back a connection obtained by :meth:`get`.
+
+        Closed connections are dropped.
+        """
+        if not connection.closed:
+            with self._lock:
+                self._idle.append(connection)
+        self._semaphore.release()
+
+    def request(self, func, *args, **kwargs):
+        """
+        Call ``func`` with a pooled connection as ``connection`` argument.
+
+        If the server closed a reused connection in the meantime, the request
+        is repeated once with a new connection.
+        """
+        while True:
+            connection = self.get()
+            reused = connection.requests > 0
+            try:
+                result = func(*args, connection=connection, **kwargs)
+            except Exception as e:
+                # the state of the connection is unknown, do not reuse it
+                connection.close()
+                if reused and isinstance(e, socket.error):
+                    continue
+                raise
+            finally:
+                self.put(connection)
+            if reused and connection.eof:
+                continue
+            return result
+
+    def close(self):
+        """
+        Close all idle connections.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+def get_menu(server, port, scnl=None, timeout=None, connection=None):
     """
     Return list of tanks on server
+
+    If an open :class:`WaveServerConnection` is given as ``connection``, it
+    is used for the request and kept open, otherwise a new connection is
+    opened and closed again.
     """
     rid = 'get_menu'
     if scnl:
@@ -216,10 +393,15 @@ def get_menu(server, port, scnl=None, timeout=None):
     else:
         # added SCNL not documented but required
         getstr = 'MENU: %s SCNL\n' % rid
-    sock = send_sock_req(server, port, getstr.encode('ascii', 'strict'),
-                         timeout=timeout)
-    r = get_sock_char_line(sock, timeout=timeout)
-    sock.close()
+    own_connection = connection is None
+    if own_connection:
+        connection = WaveServerConnection(server, port, timeout=timeout)
+    try:
+        connection.send(getstr.encode('ascii', 'strict'))
+        r = connection.readline()
+    finally:
+        if own_connection:
+            connection.close()
     if r:
         # XXX: we got here from bytes to utf-8 to keep the remaining code
         # intact
@@ -252,30 +434,52 @@ def get_menu(server, port, scnl=None, timeout=None):
 
 
 def read_wave_server_v(server, port, scnl, start, end, timeout=None,
-                       cleanup=False):
+                       cleanup=False, connection=None):
     """
     Reads data for specified time interval and scnl on specified waveserverV.
 
+    If an open :class:`WaveServerConnection` is given as ``connection``, it
+    is used for the request and kept open, otherwise a new connection is
+    opened and closed again.
+
     Returns list of TraceBuf2 objects
     """
     rid = 'rwserv'
     scnlstr = '%s %s %s %s' % scnl
     reqstr = 'GETSCNLRAW: %s %s %f %f\n' % (rid, scnlstr, start, end)
-    sock = send_sock_req(server, port, reqstr.encode('ascii', 'strict'),
-                         timeout=timeout)
-    r = get_sock_char_line(sock, timeout=timeout)
-    if not r:
-        return []
-    tokens = str(r.decode()).split()
-    flag = tokens[6]
-    if flag != 'F':
-        msg = 'read_wave_server_v returned flag %s - %s'
-        print(msg % (flag, RETURNFLAG_KEY[flag]), file=sys.stderr)
+    own_connection = connection is None
+    if own_connection:
+        connection = WaveServerConnection(server, port, timeout=timeout)
+    try:
+        connection.send(reqstr.encode('ascii', 'strict'))
+        r = connection.readline()
+        if not r:
+            return []
+        tokens = str(r.decode()).split()
+        flag = tokens[6]
+        if flag != 'F':
+            msg = 'read_wave_server_v returned flag %s - %s'
+            print(msg % (flag, RETURNFLAG_KEY[flag]), file=sys.stderr)
+            if flag not in ('FL', 'FR', 'FG'):
+                # not sure what else the server sends, so do not reuse
+                connection.close()
+            return []
+        nbytes = int(tokens[-1])
+        dat = connection.read(nbytes)
+    finally:
+        if own_connection:
+            connection.close()
+    if not dat:
         return []
-    nbytes = int(tokens[-1])
-    dat = get_sock_bytes(sock, nbytes, timeout=timeout)
-    sock.close()
+    return _parse_trace_bufs(dat, cleanup=cleanup)
+
 
+def _parse_trace_bufs(dat, cleanup=False):
+    """
+    Parse raw TraceBuf2 packets as returned by the Wave Server.
+
+    Returns list of TraceBuf2 objects
+    """
     tbl = []
     bytesread = 1
     p = 0
@@ -319,6 +523,9 @@ def read_wave_server_v(server, port, scnl, start, end, timeout=None,
 
         p += nbytes
 
+    if current_tb is None:
+        return tbl
+
     if len(bufs) > 1:
         current_tb.data = np.concatenate(bufs)
     else:
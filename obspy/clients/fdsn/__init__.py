@@ -232,6 +232,9 @@ Inventory created at 2017-10-09T14:26:28.466161Z
 Please see the documentation for each method for further information and
 examples.
 
+To send many queries from an :mod:`asyncio` application, see
+:class:`~obspy.clients.fdsn.async_client.AsyncClient`.
+
 .. _FDSN web service definitions: https://www.fdsn.org/webservices/
 """
 from __future__ import (absolute_import, division, print_function,
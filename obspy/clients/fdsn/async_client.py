@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""
+An FDSN web service client for :mod:`asyncio` applications.
+
+The :class:`~.AsyncClient` offers the same query methods as the blocking
+:class:`~obspy.clients.fdsn.client.Client` (or one of the routing clients)
+but returns awaitables, so that many queries can be sent from an
+:mod:`asyncio` event loop without blocking it:
+
+.. code-block:: python
+
+    import asyncio
+    from obspy import UTCDateTime
+    from obspy.clients.fdsn.async_client import AsyncClient
+
+    client = AsyncClient("IRIS")
+    t = UTCDateTime(2010, 2, 27, 6, 45)
+
+    async def main():
+        streams = await asyncio.gather(*[
+            client.get_waveforms("IU", station, "00", "LHZ", t, t + 600)
+            for station in ("ANMO", "KONO", "PAB", "TUC")])
+        for st in streams:
+            print(st)
+
+    asyncio.get_event_loop().run_until_complete(main())
+
+The requests are run by a :class:`~.RequestScheduler` in a thread pool of
+fixed size, so any number of queries can be pending without a thread per
+query. At most ``max_concurrent`` requests are sent to the same data center
+at a time, the others wait in a queue. Cancelling the awaitable of a
+request that is still waiting removes it from the queue, a request that has
+already been sent is not interrupted but its result is discarded.
+
+By default all clients share one scheduler, including the routing clients
+which send their requests to the individual data centers through it. The
+limit per data center therefore holds for all queries of an application.
+
+.. note::
+
+    This module requires Python 3.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import collections
+import functools
+import threading
+
+try:
+    import asyncio
+except ImportError:  # Python 2
+    asyncio = None
+
+try:
+    from concurrent.futures import Future, ThreadPoolExecutor
+except ImportError:  # Python 2
+    Future = ThreadPoolExecutor = None
+
+from obspy.core.compatibility import urlparse
+from .client import Client
+
+
+class RequestScheduler(object):
+    """
+    Runs blocking requests in a thread pool with a limited number of
+    concurrent requests per data center.
+
+    Requests exceeding the limit of their data center are queued without
+    occupying a thread and are started in the order they were submitted.
+
+    >>> from obspy.clients.fdsn.async_client import RequestScheduler
+    >>> scheduler = RequestScheduler(max_concurrent=2)
+    >>> future = scheduler.submit("service.iris.edu", sum, [1, 2, 3])
+    >>> future.result()
+    6
+
+    :type max_concurrent: int
+    :param max_concurrent: Maximum number of simultaneous requests per data
+        center.
+    :type max_workers: int
+    :param max_workers: Number of threads running the requests, ignored if
+        ``executor`` is given.
+    :type executor: :class:`concurrent.futures.Executor`
+    :param executor: Executor to run the requests in. By default a thread
+        pool with ``max_workers`` threads is used. Must not be an executor
+        the submitted functions themselves wait on.
+    """
+    def __init__(self, max_concurrent=4, max_workers=32, executor=None):
+        if ThreadPoolExecutor is None:
+            msg = "RequestScheduler requires Python 3."
+            raise NotImplementedError(msg)
+        self.max_concurrent = max_concurrent
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers)
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._running = collections.defaultdict(int)
+        self._pending = collections.defaultdict(collections.deque)
+
+    def submit(self, key, func, *args, **kwargs):
+        """
+        Schedule a call of ``func(*args, **kwargs)``.
+
+        :type key: str
+        :param key: Identifies the data center the request is sent to, e.g.
+            the host name of the web service.
+        :rtype: :class:`concurrent.futures.Future`
+        :returns: Future of the return value. Cancelling it before the
+            request was started removes it from the queue.
+        """
+        future = Future()
+        with self._lock:
+            self._pending[key].append((future, func, args, kwargs))
+        self._start_next(key)
+        return future
+
+    def _start_next(self, key):
+        while True:
+            with self._lock:
+                pending = self._pending[key]
+                if not pending:
+                    del self._pending[key]
+                    return
+                if self._running[key] >= self.max_concurrent:
+                    return
+                future, func, args, kwargs = pending.popleft()
+                # False if the future was cancelled while waiting
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._running[key] += 1
+            self._executor.submit(self._run, key, future, func, args, kwargs)
+
+    def _run(self, key, future, func, args, kwargs):
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                self._running[key] -= 1
+                if not self._running[key]:
+                    del self._running[key]
+            self._start_next(key)
+
+
+# scheduler used by all clients not given a scheduler explicitly
+if ThreadPoolExecutor is None:
+    DEFAULT_SCHEDULER = None
+else:
+    DEFAULT_SCHEDULER = RequestScheduler()
+
+
+class AsyncClient(object):
+    """
+    FDSN web service client returning awaitables.
+
+    All query methods take the same arguments as the corresponding methods
+    of the wrapped client and return an :class:`asyncio.Future` of their
+    result.
+
+    :type base_url: str,
+        :class:`~obspy.clients.fdsn.client.Client` or
+        :class:`~obspy.clients.fdsn.routing.routing_client.BaseRoutingClient`
+    :param base_url: Base URL of the FDSN web service or a key of the URL
+        mappings (see :class:`~obspy.clients.fdsn.client.Client`), or an
+        already initialized client or routing client to wrap.
+    :type scheduler: :class:`RequestScheduler`
+    :param scheduler: Scheduler running the requests. Defaults to the
+        scheduler shared by all clients. Routing clients send their requests
+        to the individual data centers through their own scheduler (see
+        :class:`~obspy.clients.fdsn.routing.routing_client.BaseRoutingClient`)
+        and only query the routing service in the default executor of the
+        event loop.
+    :type loop: :class:`asyncio.AbstractEventLoop`
+    :param loop: The event loop to use. Defaults to the current event loop
+        when a query method is called.
+    :param kwargs: Passed on to :class:`~obspy.clients.fdsn.client.Client`
+        if ``base_url`` is not a client. Note that the client queries the
+        available services of the data center while being initialized,
+        unless ``_discover_services=False`` is given.
+    """
+    def __init__(self, base_url="IRIS", scheduler=None, loop=None,
+                 **kwargs):
+        if asyncio is None or ThreadPoolExecutor is None:
+            msg = "AsyncClient requires Python 3."
+            raise NotImplementedError(msg)
+        from .routing.routing_client import BaseRoutingClient
+        if isinstance(base_url, (Client, BaseRoutingClient)):
+            self.client = base_url
+        else:
+            self.client = Client(base_url, **kwargs)
+        self._routing = isinstance(self.client, BaseRoutingClient)
+        self.scheduler = scheduler or DEFAULT_SCHEDULER
+        self._loop = loop
+
+    def _submit(self, name, *args, **kwargs):
+        """
+        Run a query method of the wrapped client.
+        """
+        func = getattr(self.client, name)
+        loop = self._loop or asyncio.get_event_loop()
+        if self._routing:
+            # The requests to the individual data centers are scheduled by
+            # the routing client itself and must not be run by the same
+            # threads that wait for them.
+            return loop.run_in_executor(
+                None, functools.partial(func, *args, **kwargs))
+        key = urlparse(self.client.base_url).netloc
+        return asyncio.wrap_future(
+            self.scheduler.submit(key, func, *args, **kwargs), loop=loop)
+
+    def get_waveforms(self, *args, **kwargs):
+        """
+        Query the dataselect service of the client.
+
+        See :meth:`obspy.clients.fdsn.client.Client.get_waveforms`.
+
+        :rtype: :class:`asyncio.Future`
+        """
+        return self._submit("get_waveforms", *args, **kwargs)
+
+    def get_waveforms_bulk(self, *args, **kwargs):
+        """
+        Query the dataselect service of the client with a bulk request.
+
+        See :meth:`obspy.clients.fdsn.client.Client.get_waveforms_bulk`.
+
+        :rtype: :class:`asyncio.Future`
+        """
+        return self._submit("get_waveforms_bulk", *args, **kwargs)
+
+    def get_stations(self, *args, **kwargs):
+        """
+        Query the station service of the client.
+
+        See :meth:`obspy.clients.fdsn.client.Client.get_stations`.
+
+        :rtype: :class:`asyncio.Future`
+        """
+        return self._submit("get_stations", *args, **kwargs)
+
+    def get_stations_bulk(self, *args, **kwargs):
+        """
+        Query the station service of the client with a bulk request.
+
+        See :meth:`obspy.clients.fdsn.client.Client.get_stations_bulk`.
+
+        :rtype: :class:`asyncio.Future`
+        """
+        return self._submit("get_stations_bulk", *args, **kwargs)
+
+    def get_events(self, *args, **kwargs):
+        """
+        Query the event service of the client.
+
+        See :meth:`obspy.clients.fdsn.client.Client.get_events`. Not
+        available for routing clients.
+
+        :rtype: :class:`asyncio.Future`
+        """
+        return self._submit("get_events", *args, **kwargs)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
@@ -0,0 +1,434 @@
+# -*- coding: utf-8 -*-
+"""
+Adaptive splitting of large bulk waveform requests.
+
+Data centers limit the amount of data a single request may return and long
+running requests are prone to time out. The
+:class:`~.BulkWaveformDownloader` splits a bulk request into chunks of a
+limited estimated size, downloads them concurrently and reassembles the
+results into a single :class:`~obspy.core.stream.Stream`. Chunks that are
+rejected as too large or that time out are split in halves, other
+temporary failures are retried with exponential backoff.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+from future.utils import PY2
+
+import collections
+import io
+import math
+import socket
+import time
+
+try:
+    from concurrent.futures import FIRST_COMPLETED, wait
+except ImportError:  # Python 2
+    FIRST_COMPLETED = wait = None
+
+from obspy import Stream, UTCDateTime
+from obspy.core.compatibility import urlparse
+from .async_client import DEFAULT_SCHEDULER
+from .client import convert_to_string, get_bulk_string
+from .header import (FDSNInternalServerException, FDSNNoDataException,
+                     FDSNRequestTooLargeException,
+                     FDSNServiceUnavailableException, FDSNTimeoutException)
+
+if PY2:
+    from httplib import HTTPException
+    ConnectionError = socket.error  # NOQA
+else:
+    from http.client import HTTPException
+
+
+# Highest sampling rate in Hz of each SEED band code, used to estimate the
+# size of requests.
+BAND_CODE_SAMPLING_RATES = {
+    "F": 5000, "G": 5000, "D": 1000, "C": 1000, "E": 250, "S": 80,
+    "H": 250, "B": 80, "M": 10, "L": 1, "V": 0.1, "U": 0.01,
+    "R": 0.001, "P": 0.0001, "T": 0.00001, "Q": 0.000001, "A": 5000,
+    "O": 5000}
+
+# Assume that each sample needs 4 byte, STEIM compression reduces the size to
+# about a third.
+BYTES_PER_SAMPLE = 4.0 / 3.0
+
+# Failures worth sending the same request again.
+RETRY_ERRORS = (FDSNServiceUnavailableException, FDSNInternalServerException,
+                FDSNTimeoutException, socket.timeout, ConnectionError,
+                HTTPException)
+
+
+def estimate_size(network, station, location, channel, starttime, endtime,
+                  inventory=None):
+    """
+    Estimate the size of the MiniSEED data of a single bulk request line.
+
+    The sampling rate is taken from the matching channels of ``inventory``
+    if given, otherwise the highest sampling rate of the band code of the
+    channel is assumed. A wildcard in the component code counts as three
+    channels, the size of requests with wildcards in other codes is
+    underestimated without an inventory.
+
+    >>> from obspy import UTCDateTime
+    >>> t = UTCDateTime(2018, 1, 1)
+    >>> print(estimate_size("IU", "ANMO", "00", "LHZ", t, t + 3600))
+    4800.0
+    >>> print(estimate_size("IU", "ANMO", "00", "LH?", t, t + 3600))
+    14400.0
+
+    :rtype: float
+    :returns: Estimated size in bytes.
+    """
+    duration = max(UTCDateTime(endtime) - UTCDateTime(starttime), 0)
+    if inventory is not None:
+        if location == "--":
+            location = ""
+        inv = inventory.select(network=network, station=station,
+                               location=location, channel=channel,
+                               starttime=starttime, endtime=endtime)
+        rates = [cha.sample_rate for net in inv for sta in net
+                 for cha in sta if cha.sample_rate]
+        if rates:
+            return sum(rates) * duration * BYTES_PER_SAMPLE
+    # Generic sampling rate for exotic or unknown band codes.
+    rate = BAND_CODE_SAMPLING_RATES.get(channel[:1].upper(), 1.0)
+    if "*" in channel or "?" in channel[2:]:
+        rate *= 3
+    return rate * duration * BYTES_PER_SAMPLE
+
+
+def _expand_wildcards(line, inventory):
+    """
+    Expand a request line with wildcards into one line per matching channel
+    of the inventory. Lines without matching channels are kept as they are.
+    """
+    net, sta, loc, cha, t1, t2 = line
+    if not any(c in "".join((net, sta, loc, cha)) for c in "*?"):
+        return [line]
+    inv = inventory.select(network=net, station=sta,
+                           location="" if loc == "--" else loc,
+                           channel=cha, starttime=t1, endtime=t2)
+    lines = []
+    for network in inv:
+        for station in network:
+            for channel in station:
+                new = (network.code, station.code,
+                       channel.location_code or "--", channel.code, t1, t2)
+                # several epochs of the same channel
+                if new not in lines:
+                    lines.append(new)
+    return lines or [line]
+
+
+def split_bulk(bulk, max_size, inventory=None, min_duration=60.0):
+    """
+    Split bulk request lines into chunks of limited estimated size.
+
+    If an inventory is given, lines with wildcards are expanded into one
+    line per matching channel first. Lines with an estimated size exceeding
+    ``max_size`` are split in time, but not into pieces shorter than
+    ``min_duration`` seconds.
+
+    :type bulk: list of tuples
+    :param bulk: Network, station, location, channel, starttime and endtime
+        of each request line.
+    :type max_size: float
+    :param max_size: Maximum estimated size of a chunk in bytes.
+    :type inventory: :class:`~obspy.core.inventory.inventory.Inventory`
+    :param inventory: Used to expand wildcards and to estimate the size,
+        see :func:`estimate_size`.
+    :type min_duration: float
+    :param min_duration: Minimum length in seconds of the time windows of
+        split request lines.
+    :rtype: list of lists of tuples
+    """
+    lines = []
+    for net, sta, loc, cha, t1, t2 in bulk:
+        line = (net, sta, loc, cha, UTCDateTime(t1), UTCDateTime(t2))
+        if inventory is not None:
+            lines.extend(_expand_wildcards(line, inventory))
+        else:
+            lines.append(line)
+
+    items = []
+    for net, sta, loc, cha, t1, t2 in lines:
+        size = estimate_size(net, sta, loc, cha, t1, t2, inventory=inventory)
+        pieces = max(min(int(math.ceil(size / max_size)),
+                         int((t2 - t1) // min_duration)), 1)
+        step = (t2 - t1) / pieces
+        for i in range(pieces):
+            end = t2 if i == pieces - 1 else t1 + (i + 1) * step
+            items.append(((net, sta, loc, cha, t1 + i * step, end),
+                          size / pieces))
+
+    chunks = []
+    current = []
+    current_size = 0
+    for item, size in items:
+        if current and current_size + size > max_size:
+            chunks.append(current)
+            current = []
+            current_size = 0
+        current.append(item)
+        current_size += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _halve(chunk, min_duration):
+    """
+    Split a chunk into two halves, returns ``None`` if not possible.
+    """
+    if len(chunk) > 1:
+        middle = len(chunk) // 2
+        return [chunk[:middle], chunk[middle:]]
+    net, sta, loc, cha, t1, t2 = chunk[0]
+    if t2 - t1 < 2 * min_duration:
+        return None
+    middle = t1 + (t2 - t1) / 2.0
+    return [[(net, sta, loc, cha, t1, middle)],
+            [(net, sta, loc, cha, middle, t2)]]
+
+
+def _parse_bulk(bulk, arguments):
+    """
+    Return the request lines and the arguments of a bulk request given in
+    any form supported by :func:`~obspy.clients.fdsn.client.get_bulk_string`.
+    """
+    text = get_bulk_string(bulk, arguments)
+    if hasattr(text, "decode"):
+        text = text.decode()
+    arguments = collections.OrderedDict()
+    items = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if "=" in line:
+            key, value = line.split("=", 1)
+            arguments[key.strip()] = value.strip()
+            continue
+        net, sta, loc, cha, t1, t2 = line.split()
+        items.append((net, sta, loc, cha, UTCDateTime(t1), UTCDateTime(t2)))
+    return items, arguments
+
+
+class BulkWaveformDownloader(object):
+    """
+    Downloads large bulk waveform requests in chunks of limited size.
+
+    The request lines are grouped into chunks with an estimated size (see
+    :func:`estimate_size`) of at most ``max_size`` bytes, long time windows
+    are split. The chunks are requested concurrently with a limited number
+    of concurrent requests per data center (see
+    :class:`~obspy.clients.fdsn.async_client.RequestScheduler`).
+
+    Chunks rejected by the data center as too large (HTTP 413) or that time
+    out are split in halves and requested again. Chunks failing due to
+    temporary server or connection problems are requested again after
+    ``backoff``, ``2 * backoff``, ``4 * backoff``, ... seconds, up to
+    ``max_retries`` times. Other errors are raised.
+
+    >>> from obspy import UTCDateTime
+    >>> from obspy.clients.fdsn import Client
+    >>> from obspy.clients.fdsn.bulk_download import BulkWaveformDownloader
+    >>> client = Client("IRIS")  # doctest: +SKIP
+    >>> downloader = BulkWaveformDownloader(client, max_size=50 * 1024 ** 2)
+    ... # doctest: +SKIP
+    >>> t = UTCDateTime(2018, 1, 1)
+    >>> bulk = [("IU", "*", "00", "BH?", t, t + 7 * 86400)]
+    >>> st = downloader.get_waveforms_bulk(bulk)  # doctest: +SKIP
+
+    :type client: :class:`~obspy.clients.fdsn.client.Client`
+    :param client: The client used for the requests.
+    :type max_size: float
+    :param max_size: Maximum estimated size in bytes of each request.
+    :type inventory: :class:`~obspy.core.inventory.inventory.Inventory`
+    :param inventory: Channel level inventory to estimate the size of the
+        requests from the actual sampling rates and to expand wildcards.
+    :type max_retries: int
+    :param max_retries: How often a failed request is repeated.
+    :type backoff: float
+    :param backoff: Delay in seconds before the first repetition of a failed
+        request, doubled for each further one.
+    :type min_duration: float
+    :param min_duration: Time windows are not split into pieces shorter than
+        this many seconds.
+    :type scheduler:
+        :class:`~obspy.clients.fdsn.async_client.RequestScheduler`
+    :param scheduler: Runs the requests. Defaults to the scheduler shared by
+        all clients. On Python 2 the chunks are requested one after the
+        other.
+    """
+    def __init__(self, client, max_size=20 * 1024 ** 2, inventory=None,
+                 max_retries=3, backoff=1.0, min_duration=60.0,
+                 scheduler=None):
+        self.client = client
+        self.max_size = max_size
+        self.inventory = inventory
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.min_duration = min_duration
+        self.scheduler = scheduler or DEFAULT_SCHEDULER
+
+    def get_waveforms_bulk(self, bulk, quality=None, minimumlength=None,
+                           longestonly=None, filename=None,
+                           attach_response=False):
+        """
+        Download a bulk request in chunks.
+
+        Arguments are the same as in
+        :meth:`obspy.clients.fdsn.client.Client.get_waveforms_bulk()`.
+        Traces continuing across chunks are merged again. If ``filename``
+        is given, the data of all chunks is written to the file one after
+        the other.
+        """
+        arguments = collections.OrderedDict(
+            quality=quality,
+            minimumlength=minimumlength,
+            longestonly=longestonly
+        )
+        items, arguments = _parse_bulk(bulk, arguments)
+        header = ["%s=%s" % (key, value) for key, value in arguments.items()]
+        chunks = split_bulk(items, self.max_size, inventory=self.inventory,
+                            min_duration=self.min_duration)
+
+        if filename is None:
+            st = Stream()
+            collect = st.extend
+        elif hasattr(filename, "write"):
+            collect = filename.write
+        else:
+            fh = open(filename, "wb")
+            collect = fh.write
+        try:
+            received = self._download_chunks(chunks, header, filename,
+                                             collect)
+        finally:
+            if filename is not None and not hasattr(filename, "write"):
+                fh.close()
+
+        if not received:
+            raise FDSNNoDataException("No data available for request.")
+        if filename is not None:
+            return
+        if received > 1:
+            # Merge traces continuing across the chunk boundaries.
+            st._cleanup()
+        if attach_response:
+            self.client._attach_responses(st)
+        return st
+
+    def _download_chunks(self, chunks, header, filename, collect):
+        """
+        Download all chunks and hand the result of each to ``collect``.
+
+        Failed requests are repeated after their backoff delay without
+        occupying a slot of the scheduler while waiting.
+
+        Returns the number of chunks that returned data.
+        """
+        # (time not to send the request before, chunk, attempt)
+        pending = [(0, chunk, 0) for chunk in chunks]
+        received = 0
+        if self.scheduler is None:
+            while pending:
+                not_before, chunk, attempt = pending.pop(0)
+                delay = not_before - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+                try:
+                    data = self._download_chunk(chunk, header, filename)
+                except Exception as e:
+                    pending.extend(self._retry(chunk, attempt, e))
+                    continue
+                collect(data)
+                received += 1
+            return received
+
+        key = urlparse(self.client.base_url).netloc
+        futures = {}
+        try:
+            while pending or futures:
+                now = time.time()
+                for task in [t for t in pending if t[0] <= now]:
+                    pending.remove(task)
+                    _, chunk, attempt = task
+                    future = self.scheduler.submit(
+                        key, self._download_chunk, chunk, header, filename)
+                    futures[future] = (chunk, attempt)
+                timeout = None
+                if pending:
+                    timeout = max(min(t[0] for t in pending) - now, 0)
+                if not futures:
+                    time.sleep(timeout)
+                    continue
+                done, _ = wait(list(futures), timeout=timeout,
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk, attempt = futures.pop(future)
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        pending.extend(self._retry(chunk, attempt, e))
+                        continue
+                    collect(data)
+                    received += 1
+        finally:
+            # Do not send the remaining requests after a failure.
+            for future in futures:
+                future.cancel()
+        return received
+
+    def _download_chunk(self, chunk, header, filename):
+        """
+        Download a single chunk.
+        """
+        lines = header + [
+            " ".join((net, sta, loc or "--", cha, convert_to_string(t1),
+                      convert_to_string(t2)))
+            for net, sta, loc, cha, t1, t2 in chunk]
+        bulk = "\n".join(lines)
+        if filename is None:
+            return self.client.get_waveforms_bulk(bulk)
+        buf = io.BytesIO()
+        self.client.get_waveforms_bulk(bulk, filename=buf)
+        return buf.getvalue()
+
+    def _retry(self, chunk, attempt, error):
+        """
+        Return the requests to send instead of a failed one or raise the
+        error.
+
+        :rtype: list of tuples
+        :returns: Time not to send the request before, chunk and attempt
+            of each request.
+        """
+        if isinstance(error, FDSNNoDataException):
+            return []
+        if isinstance(error, (FDSNRequestTooLargeException,
+                              FDSNTimeoutException, socket.timeout)):
+            halves = _halve(chunk, self.min_duration)
+            if halves is not None:
+                return [(0, half, attempt) for half in halves]
+            if isinstance(error, FDSNRequestTooLargeException):
+                raise error
+        elif not isinstance(error, RETRY_ERRORS):
+            raise error
+        if attempt >= self.max_retries:
+            raise error
+        return [(time.time() + self.backoff * 2 ** attempt, chunk,
+                 attempt + 1)]
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
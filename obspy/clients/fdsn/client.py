@@ -19,6 +19,7 @@ import gzip
 import io
 import os
 import re
+import shutil
 from socket import timeout as socket_timeout
 import textwrap
 import threading
@@ -30,10 +31,18 @@ from lxml import etree
 import obspy
 from obspy import UTCDateTime, read_inventory
 from obspy.core.compatibility import urlparse, collections_abc
+from obspy.io.mseed import (ObsPyMSEEDFilesizeTooSmallError,
+                            ObsPyMSEEDReadingError)
+from obspy.io.mseed.util import iter_traces
+from .connection_pool import DEFAULT_CONNECTION_POOL, keep_alive_handlers
+from .response_cache import ResponseCache
 from .header import (DEFAULT_PARAMETERS, DEFAULT_USER_AGENT, FDSNWS,
                      OPTIONAL_PARAMETERS, PARAMETER_ALIASES, URL_MAPPINGS,
                      WADL_PARAMETERS_NOT_TO_BE_PARSED, DEFAULT_SERVICES,
-                     FDSNException, FDSNRedirectException, FDSNNoDataException)
+                     FDSNException, FDSNRedirectException, FDSNNoDataException,
+                     FDSNRequestTooLargeException, FDSNTimeoutException,
+                     FDSNInternalServerException,
+                     FDSNServiceUnavailableException)
 from .wadl_parser import WADLParser
 
 if PY2:
@@ -47,6 +56,8 @@ else:
 
 
 DEFAULT_SERVICE_VERSIONS = {'dataselect': 1, 'station': 1, 'event': 1}
+# Number of bytes read at once from streamed responses.
+STREAM_CHUNK_SIZE = 2 ** 20
 
 
 class CustomRedirectHandler(urllib_request.HTTPRedirectHandler):
@@ -139,7 +150,8 @@ class Client(object):
     def __init__(self, base_url="IRIS", major_versions=None, user=None,
                  password=None, user_agent=DEFAULT_USER_AGENT, debug=False,
                  timeout=120, service_mappings=None, force_redirect=False,
-                 eida_token=None, _discover_services=True):
+                 eida_token=None, _discover_services=True,
+                 connection_pool=None, cache=None):
         """
         Initializes an FDSN Web Service client.
 
@@ -208,11 +220,32 @@ class Client(object):
             to ``False``, no service discovery is performed and default
             parameter support is assumed. This parameter is experimental and
             will likely be removed in the future.
+        :type connection_pool:
+            :class:`~obspy.clients.fdsn.connection_pool.HTTPConnectionPool`
+            or bool
+        :param connection_pool: Pool of persistent (keep-alive) HTTP
+            connections which are reused for subsequent requests to the same
+            host. By default a pool shared by all clients is used, set to
+            ``False`` to open a new connection for every request.
+        :type cache:
+            :class:`~obspy.clients.fdsn.response_cache.ResponseCache` or str
+        :param cache: Cache for the responses of the station and event
+            services, or the directory of a
+            :class:`~obspy.clients.fdsn.response_cache.ResponseCache` with
+            default settings. Repeated queries are then answered from the
+            cache as long as the responses are fresh or the server confirms
+            they did not change. By default nothing is cached.
         """
         self.debug = debug
         self.user = user
         self.timeout = timeout
         self._force_redirect = force_redirect
+        if connection_pool is None or connection_pool is True:
+            connection_pool = DEFAULT_CONNECTION_POOL
+        self._connection_pool = connection_pool
+        if cache is not None and not isinstance(cache, ResponseCache):
+            cache = ResponseCache(cache)
+        self._cache = cache
 
         # Cache for the webservice versions. This makes interactive use of
         # the client more convenient.
@@ -340,6 +373,10 @@ class Client(object):
         else:
             handlers.append(NoRedirectionHandler())
 
+        # Reuse connections if desired.
+        if self._connection_pool is not False:
+            handlers.extend(keep_alive_handlers(self._connection_pool))
+
         # Don't install globally to not mess with other codes.
         self._url_opener = urllib_request.build_opener(*handlers)
         if self.debug:
@@ -524,15 +561,8 @@ class Client(object):
         url = self._create_url_from_parameters(
             "event", DEFAULT_PARAMETERS['event'], kwargs)
 
-        data_stream = self._download(url)
-        data_stream.seek(0, 0)
-        if filename:
-            self._write_to_file_object(filename, data_stream)
-            data_stream.close()
-        else:
-            cat = obspy.read_events(data_stream, format="quakeml")
-            data_stream.close()
-            return cat
+        return self._download_and_read(
+            url, _read_quakeml_stream, filename=filename, cache=True)
 
     def get_stations(self, starttime=None, endtime=None, startbefore=None,
                      startafter=None, endbefore=None, endafter=None,
@@ -722,16 +752,8 @@ class Client(object):
         url = self._create_url_from_parameters(
             "station", DEFAULT_PARAMETERS['station'], kwargs)
 
-        data_stream = self._download(url)
-        data_stream.seek(0, 0)
-        if filename:
-            self._write_to_file_object(filename, data_stream)
-            data_stream.close()
-        else:
-            # This works with XML and StationXML data.
-            inventory = read_inventory(data_stream)
-            data_stream.close()
-            return inventory
+        return self._download_and_read(
+            url, _read_inventory_stream, filename=filename, cache=True)
 
     def get_waveforms(self, network, station, location, channel, starttime,
                       endtime, quality=None, minimumlength=None,
@@ -841,19 +863,15 @@ class Client(object):
 
         # Gzip not worth it for MiniSEED and most likely disabled for this
         # route in any case.
-        data_stream = self._download(url, use_gzip=False)
-        data_stream.seek(0, 0)
+        st = self._download_and_read(url, _read_mseed_stream,
+                                     filename=filename, use_gzip=False)
         if filename:
-            self._write_to_file_object(filename, data_stream)
-            data_stream.close()
-        else:
-            st = obspy.read(data_stream, format="MSEED")
-            data_stream.close()
-            if attach_response:
-                self._attach_responses(st)
-            self._attach_dataselect_url_to_stream(st)
-            st.trim(starttime, endtime)
-            return st
+            return
+        if attach_response:
+            self._attach_responses(st)
+        self._attach_dataselect_url_to_stream(st)
+        st.trim(starttime, endtime)
+        return st
 
     def _attach_responses(self, st):
         """
@@ -976,6 +994,15 @@ class Client(object):
             information to each trace. This can be used to remove response
             using :meth:`~obspy.core.stream.Stream.remove_response`.
 
+        .. note::
+
+            The whole request is sent at once. Data centers may reject
+            requests for too much data (raising
+            :class:`~obspy.clients.fdsn.header.FDSNRequestTooLargeException`)
+            or time out. Use
+            :class:`~obspy.clients.fdsn.bulk_download.BulkWaveformDownloader`
+            to split large requests automatically.
+
         :type bulk: str, file or list of lists
         :param bulk: Information about the requested data. See above for
             details.
@@ -1020,19 +1047,14 @@ class Client(object):
 
         url = self._build_url("dataselect", "query")
 
-        data_stream = self._download(url,
-                                     data=bulk)
-        data_stream.seek(0, 0)
+        st = self._download_and_read(url, _read_mseed_stream,
+                                     filename=filename, data=bulk)
         if filename:
-            self._write_to_file_object(filename, data_stream)
-            data_stream.close()
-        else:
-            st = obspy.read(data_stream, format="MSEED")
-            data_stream.close()
-            if attach_response:
-                self._attach_responses(st)
-            self._attach_dataselect_url_to_stream(st)
-            return st
+            return
+        if attach_response:
+            self._attach_responses(st)
+        self._attach_dataselect_url_to_stream(st)
+        return st
 
     def get_stations_bulk(self, bulk, level=None, includerestricted=None,
                           includeavailability=None, filename=None, **kwargs):
@@ -1166,25 +1188,18 @@ class Client(object):
 
         url = self._build_url("station", "query")
 
-        data_stream = self._download(url,
-                                     data=bulk)
-        data_stream.seek(0, 0)
-        if filename:
-            self._write_to_file_object(filename, data_stream)
-            data_stream.close()
-            return
-        else:
-            # Works with text and StationXML data.
-            inv = obspy.read_inventory(data_stream)
-            data_stream.close()
-            return inv
+        # Works with text and StationXML data.
+        return self._download_and_read(
+            url, _read_inventory_stream, filename=filename, data=bulk,
+            cache=True)
 
     def _write_to_file_object(self, filename_or_object, data_stream):
         if hasattr(filename_or_object, "write"):
-            filename_or_object.write(data_stream.read())
+            shutil.copyfileobj(data_stream, filename_or_object,
+                               STREAM_CHUNK_SIZE)
             return
         with open(filename_or_object, "wb") as fh:
-            fh.write(data_stream.read())
+            shutil.copyfileobj(data_stream, fh, STREAM_CHUNK_SIZE)
 
     def _create_url_from_parameters(self, service, default_params, parameters):
         """
@@ -1389,14 +1404,119 @@ class Client(object):
 
         print("\n".join(msg))
 
-    def _download(self, url, return_string=False, data=None, use_gzip=True):
+    def _download(self, url, return_string=False, data=None, use_gzip=True,
+                  stream=False):
         code, data = download_url(
             url, opener=self._url_opener, headers=self.request_headers,
             debug=self.debug, return_string=return_string, data=data,
-            timeout=self.timeout, use_gzip=use_gzip)
+            timeout=self.timeout, use_gzip=use_gzip, stream=stream)
         raise_on_error(code, data)
         return data
 
+    def _download_and_read(self, url, read_func, filename=None, data=None,
+                           use_gzip=True, cache=False):
+        """
+        Download a response and stream it into a reader function or a file.
+
+        The response is never held in memory as a whole. It is uncompressed
+        while it is being downloaded and either written to ``filename`` in
+        chunks or handed to ``read_func`` as a file-like object, so parsing
+        can start with the first bytes received.
+
+        :type url: str
+        :param url: The URL to query.
+        :type read_func: callable
+        :param read_func: Called with the file-like response to read it if
+            no ``filename`` is given, its return value is returned.
+        :type filename: str or file
+        :param filename: If given, the response is written to this file (or
+            file-like object) and ``None`` is returned.
+        :type data: bytes
+        :param data: Payload of a POST request.
+        :type use_gzip: bool
+        :param use_gzip: Whether to request gzip compression.
+        :type cache: bool
+        :param cache: Whether the response may be taken from and stored in
+            the response cache of the client, if it has one.
+        """
+        if cache and self._cache is not None:
+            return self._download_and_read_cached(url, read_func, filename,
+                                                  data, use_gzip)
+        data_stream = self._download(url, data=data, use_gzip=use_gzip,
+                                     stream=True)
+        try:
+            if filename:
+                self._write_to_file_object(filename, data_stream)
+                return None
+            return read_func(data_stream)
+        finally:
+            data_stream.close()
+
+    def _download_and_read_cached(self, url, read_func, filename, data,
+                                  use_gzip):
+        """
+        Same as :meth:`_download_and_read` but using the response cache.
+
+        A fresh cached response is used without any request, a stale one is
+        revalidated. Downloaded responses are stored in the cache while they
+        are being read, the parsed object is stored once reading succeeded.
+        """
+        cache = self._cache
+        key = cache.key(url, data=data, user=self.user)
+        meta = cache.get(key)
+        headers = dict(self.request_headers)
+        if meta is not None:
+            if cache.is_fresh(meta):
+                return self._read_from_cache(key, read_func, filename)
+            headers.update(cache.validators(meta))
+
+        response_headers = {}
+        code, data_stream = download_url(
+            url, opener=self._url_opener, headers=headers, debug=self.debug,
+            data=data, timeout=self.timeout, use_gzip=use_gzip, stream=True,
+            response_headers=response_headers)
+        if code == 304 and meta is not None:
+            # read the (empty) body, so that a persistent connection goes
+            # back to the connection pool
+            data_stream.read()
+            data_stream.close()
+            cache.refresh(key, meta, response_headers)
+            return self._read_from_cache(key, read_func, filename)
+        raise_on_error(code, data_stream)
+
+        stream = cache.writer(key, response_headers, data_stream,
+                              chunk_size=STREAM_CHUNK_SIZE)
+        if stream is None:
+            stream = data_stream
+        try:
+            if filename:
+                self._write_to_file_object(filename, stream)
+                result = None
+            else:
+                result = read_func(stream)
+            if stream is not data_stream:
+                stream.commit()
+        finally:
+            # discards the response if it has not been committed
+            stream.close()
+            data_stream.close()
+        if result is not None and stream is not data_stream:
+            cache.store_object(key, result)
+        return result
+
+    def _read_from_cache(self, key, read_func, filename):
+        """
+        Return the parsed object of a cached response or write the response
+        to ``filename``.
+        """
+        if self.debug is True:
+            print("Using cached response %s" % key)
+        if filename:
+            with self._cache.open(key) as fh:
+                self._write_to_file_object(filename, fh)
+            return None
+        return self._cache.load(key, read_func)
+
     def _build_url(self, service, resource_type, parameters={}):
         """
         Builds the correct URL.
@@ -1729,22 +1849,26 @@ def raise_on_error(code, data):
     elif code == 403:
         raise FDSNException("Authentication failed.", server_info)
     elif code == 413:
-        raise FDSNException("Request would result in too much data. "
-                            "Denied by the datacenter. Split the request "
-                            "in smaller parts", server_info)
+        raise FDSNRequestTooLargeException(
+            "Request would result in too much data. Denied by the "
+            "datacenter. Split the request in smaller parts", server_info)
     # Request URI too large.
     elif code == 414:
         msg = ("The request URI is too large. Please contact the ObsPy "
                "developers.", server_info)
         raise NotImplementedError(msg)
     elif code == 500:
-        raise FDSNException("Service responds: Internal server error",
-                            server_info)
+        raise FDSNInternalServerException(
+            "Service responds: Internal server error", server_info)
     elif code == 503:
-        raise FDSNException("Service temporarily unavailable", server_info)
+        raise FDSNServiceUnavailableException(
+            "Service temporarily unavailable", server_info)
     elif code is None:
-        if "timeout" in str(data).lower():
-            raise FDSNException("Timed Out")
+        # timeouts while connecting come wrapped in an URLError
+        reason = getattr(data, "reason", data)
+        if isinstance(reason, socket_timeout) or \
+                "timeout" in str(data).lower():
+            raise FDSNTimeoutException("Timed Out")
         else:
             raise FDSNException("Unknown Error (%s): %s" % (
                 (str(data.__class__.__name__), str(data))))
@@ -1754,7 +1878,8 @@ def raise_on_error(code, data):
 
 
 def download_url(url, opener, timeout=10, headers={}, debug=False,
-                 return_string=True, data=None, use_gzip=True):
+                 return_string=True, data=None, use_gzip=True, stream=False,
+                 response_headers=None):
     """
     Returns a pair of tuples.
 
@@ -1766,6 +1891,13 @@ def download_url(url, opener, timeout=10, headers={}, debug=False,
     specified.
 
     Performs a http GET if data=None, otherwise a http POST.
+
+    If `stream=True` the data is returned as an open file-like object that
+    reads (and if necessary uncompresses) the response while it is being
+    downloaded. It has to be read up to its end and closed by the caller.
+
+    If a dictionary is passed as `response_headers` it is updated with the
+    headers of the response, with lower case names.
     """
     if debug is True:
         print("Downloading %s %s requesting gzip compression" % (
@@ -1789,6 +1921,9 @@ def download_url(url, opener, timeout=10, headers={}, debug=False,
             msg = "HTTP error %i, reason %s, while downloading '%s': %s" % \
                   (e.code, str(e.reason), url, e.read())
             print(msg)
+        if response_headers is not None and e.headers is not None:
+            response_headers.update(
+                (k.lower(), v) for k, v in e.headers.items())
         return e.code, e
     except Exception as e:
         if debug is True:
@@ -1796,20 +1931,33 @@ def download_url(url, opener, timeout=10, headers={}, debug=False,
         return None, e
 
     code = url_obj.getcode()
+    if response_headers is not None:
+        response_headers.update(
+            (k.lower(), v) for k, v in url_obj.info().items())
 
     # Unpack gzip if necessary.
     if url_obj.info().get("Content-Encoding") == "gzip":
         if debug is True:
             print("Uncompressing gzipped response for %s" % url)
-        # Cannot directly stream to gzip from urllib!
-        # http://www.enricozini.org/2011/cazzeggio/python-gzip/
-        buf = io.BytesIO(url_obj.read())
-        buf.seek(0, 0)
-        f = gzip.GzipFile(fileobj=buf)
+        if PY2:
+            # Cannot directly stream to gzip from urllib on Python 2!
+            # http://www.enricozini.org/2011/cazzeggio/python-gzip/
+            buf = io.BytesIO(url_obj.read())
+            buf.seek(0, 0)
+            f = gzip.GzipFile(fileobj=buf)
+        else:
+            # Uncompress while reading, the response only needs to be
+            # read sequentially.
+            f = gzip.GzipFile(fileobj=url_obj, mode="rb")
     else:
         f = url_obj
 
-    if return_string is False:
+    if stream is True:
+        if PY2:
+            data = io.BytesIO(f.read())
+        else:
+            data = _ClosingStream(f, url_obj)
+    elif return_string is False:
         data = io.BytesIO(f.read())
     else:
         data = f.read()
@@ -1820,6 +1968,91 @@ def download_url(url, opener, timeout=10, headers={}, debug=False,
     return code, data
 
 
+def _read_mseed_stream(data_stream):
+    """
+    Read MiniSEED data from a response chunk by chunk while it is being
+    downloaded.
+
+    Raises an error if the response contains no MiniSEED records at all,
+    e.g. an empty response or an error page of a proxy. Like when reading a
+    file, responses shorter than the smallest possible record raise
+    :class:`~obspy.io.mseed.ObsPyMSEEDFilesizeTooSmallError`.
+
+    :rtype: :class:`~obspy.core.stream.Stream`
+    """
+    head = None
+    if hasattr(data_stream, "peek"):
+        head = data_stream.peek(128)[:128]
+    st = obspy.Stream()
+    chunks = 0
+    for chunk in iter_traces(data_stream, chunk_size=STREAM_CHUNK_SIZE):
+        st += chunk
+        chunks += 1
+    if not chunks:
+        if head == b"":
+            raise ObsPyMSEEDFilesizeTooSmallError(
+                "The response of the dataselect service is empty.")
+        msg = ("The response of the dataselect service does not contain any "
+               "MiniSEED records")
+        if head:
+            msg += ", it starts with: %r" % head[:64]
+        msg += "."
+        if head is not None and len(head) < 128:
+            raise ObsPyMSEEDFilesizeTooSmallError(msg)
+        raise ObsPyMSEEDReadingError(msg)
+    if chunks > 1:
+        # Merge traces continuing across the chunk boundaries.
+        st._cleanup()
+    for tr in st:
+        tr.stats._format = "MSEED"
+    return st
+
+
+def _read_quakeml_stream(data_stream):
+    """
+    Parse QuakeML from a response while it is being downloaded.
+
+    :rtype: :class:`~obspy.core.event.Catalog`
+    """
+    return obspy.read_events(data_stream, format="quakeml")
+
+
+def _read_inventory_stream(data_stream):
+    """
+    Read an inventory from a station service response.
+
+    StationXML is parsed while it is being downloaded, other formats (e.g.
+    the FDSN text format) are detected and read from memory.
+
+    :rtype: :class:`~obspy.core.inventory.inventory.Inventory`
+    """
+    if hasattr(data_stream, "peek"):
+        head = data_stream.peek(1024).lstrip(b"\xef\xbb\xbf \t\r\n")
+        if head.startswith(b"<"):
+            return read_inventory(data_stream, format="STATIONXML")
+        data_stream = io.BytesIO(data_stream.read())
+    return read_inventory(data_stream)
+
+
+class _ClosingStream(io.BufferedReader):
+    """
+    Buffered reader on a response that also closes the underlying response
+    object when closed.
+
+    Closing a :class:`gzip.GzipFile` does not close the file object it
+    reads from.
+    """
+    def __init__(self, raw, response):
+        io.BufferedReader.__init__(self, raw, buffer_size=STREAM_CHUNK_SIZE)
+        self._response = response
+
+    def close(self):
+        try:
+            io.BufferedReader.close(self)
+        finally:
+            self._response.close()
+
+
 def setup_query_dict(service, locs, kwargs):
     """
     """
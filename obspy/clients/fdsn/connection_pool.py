@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent (keep-alive) HTTP connections for the FDSN web service clients.
+
+The handlers in this module plug into the :mod:`urllib` opener used by
+:class:`~obspy.clients.fdsn.client.Client`. Instead of opening a new TCP
+(and possibly TLS) connection for every request, connections are kept open
+after a response has been read completely and are reused for the next
+request to the same host.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+from future.utils import PY2
+
+import socket
+import threading
+
+if PY2:
+    import httplib as http_client
+    import urllib2 as urllib_request
+else:
+    import http.client as http_client
+    import urllib.request as urllib_request
+
+
+class HTTPConnectionPool(object):
+    """
+    Thread-safe pool of idle persistent HTTP connections.
+
+    Connections are borrowed exclusively for a request and given back to the
+    pool once the response has been read completely. The pool does not limit
+    the number of simultaneous connections, but keeps at most ``maxsize``
+    idle connections per host, any surplus connection is closed.
+
+    By default all FDSN clients share one pool, use a separate instance to
+    e.g. keep more connections to a host:
+
+    >>> from obspy.clients.fdsn import Client
+    >>> from obspy.clients.fdsn.connection_pool import HTTPConnectionPool
+    >>> pool = HTTPConnectionPool(maxsize=50)
+    >>> client = Client("IRIS", connection_pool=pool)  # doctest: +SKIP
+
+    :type maxsize: int
+    :param maxsize: Maximum number of idle connections kept per host.
+    """
+    def __init__(self, maxsize=10):
+        self.maxsize = maxsize
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(v) for v in self._idle.values())
+
+    def get(self, key):
+        """
+        Return an idle connection for the given key or ``None``.
+
+        :type key: tuple
+        :param key: Identifies the host of the connection.
+        """
+        with self._lock:
+            connections = self._idle.get(key)
+            if connections:
+                return connections.pop()
+        return None
+
+    def put(self, key, connection):
+        """
+        Give back an idle connection, closes it if the pool is full.
+
+        :type key: tuple
+        :param key: Identifies the host of the connection.
+        :type connection: :class:`http.client.HTTPConnection`
+        :param connection: The idle connection.
+        """
+        with self._lock:
+            connections = self._idle.setdefault(key, [])
+            if len(connections) < self.maxsize:
+                connections.append(connection)
+                return
+        connection.close()
+
+    def clear(self):
+        """
+        Close all idle connections.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+# pool used by all clients not given a pool explicitly
+DEFAULT_CONNECTION_POOL = HTTPConnectionPool()
+
+
+class _PooledHTTPResponse(http_client.HTTPResponse):
+    """
+    HTTP response giving back its connection when it has been read.
+    """
+    _release = None
+
+    def _close_conn(self):
+        # Called when the whole body has been read.
+        http_client.HTTPResponse._close_conn(self)
+        self._release_connection(True)
+
+    def close(self):
+        if self.fp is not None:
+            # closed before the whole body was read, the connection can not
+            # be used for another request
+            self._release_connection(False)
+        http_client.HTTPResponse.close(self)
+
+    def _release_connection(self, reuse):
+        release, self._release = self._release, None
+        if release is not None:
+            release(reuse and not self.will_close)
+
+
+class _KeepAliveHandlerMixin(object):
+    """
+    Opens requests on pooled persistent connections.
+    """
+    def _open_pooled(self, connection_class, req, **kwargs):
+        host = req.host
+        if not host:
+            raise urllib_request.URLError('no host given')
+        key = (connection_class.__name__, host)
+        timeout = req.timeout
+        if timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+            timeout = socket.getdefaulttimeout()
+
+        headers = dict(req.unredirected_hdrs)
+        headers.update((k, v) for k, v in req.headers.items()
+                       if k not in headers)
+        headers = dict((name.title(), val) for name, val in headers.items())
+
+        while True:
+            connection = self._pool.get(key)
+            reused = connection is not None
+            if reused:
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+            else:
+                connection = connection_class(host, timeout=timeout,
+                                              **kwargs)
+            connection.response_class = _PooledHTTPResponse
+            try:
+                connection.request(req.get_method(), req.selector, req.data,
+                                   headers)
+                response = connection.getresponse()
+            except Exception as err:
+                connection.close()
+                # The server closed an idle connection in the meantime, try
+                # again with the next one.
+                if reused and not isinstance(err, socket.timeout):
+                    continue
+                if isinstance(err, socket.error):
+                    raise urllib_request.URLError(err)
+                raise
+            break
+
+        def release(reuse, connection=connection):
+            if reuse:
+                self._pool.put(key, connection)
+            else:
+                connection.close()
+
+        response._release = release
+        # same as in urllib.request.AbstractHTTPHandler.do_open()
+        response.url = req.get_full_url()
+        response.msg = response.reason
+        return response
+
+
+class KeepAliveHTTPHandler(_KeepAliveHandlerMixin, urllib_request.HTTPHandler):
+    """
+    :mod:`urllib` handler for ``http`` URLs using persistent connections.
+
+    On Python 2 connections are not kept open.
+
+    :type pool: :class:`HTTPConnectionPool`
+    :param pool: Pool of idle connections.
+    """
+    def __init__(self, pool=DEFAULT_CONNECTION_POOL):
+        urllib_request.HTTPHandler.__init__(self)
+        self._pool = pool
+
+    def http_open(self, req):
+        if PY2:
+            return urllib_request.HTTPHandler.http_open(self, req)
+        return self._open_pooled(http_client.HTTPConnection, req)
+
+
+if hasattr(urllib_request, 'HTTPSHandler'):
+    class KeepAliveHTTPSHandler(_KeepAliveHandlerMixin,
+                                urllib_request.HTTPSHandler):
+        """
+        :mod:`urllib` handler for ``https`` URLs using persistent
+        connections.
+
+        Requests through a proxy and all requests on Python 2 do not keep
+        the connection open.
+
+        :type pool: :class:`HTTPConnectionPool`
+        :param pool: Pool of idle connections.
+        :param context: SSL context, see :class:`http.client.HTTPSConnection`.
+        """
+        def __init__(self, pool=DEFAULT_CONNECTION_POOL, context=None):
+            urllib_request.HTTPSHandler.__init__(self, context=context)
+            self._pool = pool
+            self._ssl_context = context
+
+        def https_open(self, req):
+            if PY2 or getattr(req, '_tunnel_host', None):
+                return urllib_request.HTTPSHandler.https_open(self, req)
+            return self._open_pooled(http_client.HTTPSConnection, req,
+                                     context=self._ssl_context)
+
+
+def keep_alive_handlers(pool=DEFAULT_CONNECTION_POOL):
+    """
+    Return :mod:`urllib` handlers using persistent connections of the given
+    pool, to be passed to :func:`urllib.request.build_opener`.
+
+    :type pool: :class:`HTTPConnectionPool`
+    :param pool: Pool of idle connections.
+    :rtype: list
+    """
+    handlers = [KeepAliveHTTPHandler(pool)]
+    if hasattr(urllib_request, 'HTTPSHandler'):
+        handlers.append(KeepAliveHTTPSHandler(pool))
+    return handlers
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
@@ -35,6 +35,22 @@ class FDSNNoDataException(FDSNException):
     pass
 
 
+class FDSNRequestTooLargeException(FDSNException):
+    pass
+
+
+class FDSNTimeoutException(FDSNException):
+    pass
+
+
+class FDSNInternalServerException(FDSNException):
+    pass
+
+
+class FDSNServiceUnavailableException(FDSNException):
+    pass
+
+
 # A curated list collecting some implementations:
 # https://www.fdsn.org/webservices/datacenters/
 # https://www.orfeus-eu.org/data/eida/nodes/
@@ -39,6 +39,7 @@ import obspy
 from obspy.core.util import Enum
 
 from . import utils
+from ..bulk_download import BAND_CODE_SAMPLING_RATES
 
 # The current status of an entity.
 STATUS = Enum(["none", "needs_downloading", "downloaded", "ignore", "exists",
@@ -792,12 +793,6 @@ class ClientDownloadHelper(object):
             be a value in agreement with some data centers.
         """
         # Estimate the download size to have equally sized chunks.
-        channel_sampling_rate = {
-            "F": 5000, "G": 5000, "D": 1000, "C": 1000, "E": 250, "S": 80,
-            "H": 250, "B": 80, "M": 10, "L": 1, "V": 0.1, "U": 0.01,
-            "R": 0.001, "P": 0.0001, "T": 0.00001, "Q": 0.000001, "A": 5000,
-            "O": 5000}
-
         # Split into chunks of about equal size in terms of filesize.
         chunks = []
         chunks_curr = []
@@ -815,7 +810,7 @@ class ClientDownloadHelper(object):
                 # data to be downloaded.
                 band_code = cha.channel[0].upper()
                 try:
-                    sr = channel_sampling_rate[band_code]
+                    sr = BAND_CODE_SAMPLING_RATES[band_code]
                 except KeyError:
                     # Generic sampling rate for exotic band codes.
                     sr = 1.0
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+"""
+On-disk cache of FDSN station and event service responses.
+
+A :class:`~.ResponseCache` given to :class:`~obspy.clients.fdsn.client.Client`
+stores the responses of the station and event services together with the
+parsed :class:`~obspy.core.inventory.inventory.Inventory` or
+:class:`~obspy.core.event.Catalog` objects. Repeating a query then neither
+downloads nor parses the response again:
+
+.. code-block:: python
+
+    from obspy.clients.fdsn import Client
+    from obspy.clients.fdsn.response_cache import ResponseCache
+
+    cache = ResponseCache("/tmp/fdsn_cache", max_size=5 * 1024 ** 3,
+                          default_ttl=86400)
+    client = Client("IRIS", cache=cache)
+    inv = client.get_stations(network="IU", level="response")
+
+Responses are cached according to their ``Cache-Control`` and ``Expires``
+headers. Responses without such headers are considered fresh for
+``default_ttl`` seconds. Stale responses are revalidated with a conditional
+request (``If-None-Match`` and ``If-Modified-Since``) if the server sent an
+``ETag`` or ``Last-Modified`` header, otherwise they are downloaded again.
+The least recently used responses are evicted once the cache exceeds
+``max_size`` bytes.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import email.utils
+import hashlib
+import io
+import json
+import os
+import pickle
+import re
+import tempfile
+import threading
+import time
+
+
+# os.replace is not available on Python 2
+_replace = getattr(os, "replace", os.rename)
+
+
+def _remove(filename):
+    try:
+        os.remove(filename)
+    except OSError:
+        pass
+
+
+class ResponseCache(object):
+    """
+    Size bounded on-disk cache of web service responses.
+
+    Each response is stored as three files named after the hash of the
+    request: the uncompressed response (``.raw``), the parsed object
+    (``.pickle``, created when the response is first parsed) and the
+    metadata needed for revalidation (``.json``). Files are written to a
+    temporary file first and then moved in place, so a cache directory can
+    be shared by several processes.
+
+    :type directory: str
+    :param directory: Directory to store the responses in, created if
+        necessary.
+    :type max_size: int
+    :param max_size: Maximum total size in bytes of all cached files.
+    :type default_ttl: float
+    :param default_ttl: Time in seconds responses without ``Cache-Control``
+        or ``Expires`` header are used without revalidation.
+    """
+    def __init__(self, directory, max_size=2 * 1024 ** 3, default_ttl=0):
+        self.directory = directory
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    @staticmethod
+    def key(url, data=None, user=None):
+        """
+        Return the cache key of a request.
+
+        :type url: str
+        :param url: The requested URL.
+        :type data: bytes
+        :param data: Payload of a POST request.
+        :type user: str
+        :param user: User name the request is authenticated with.
+        """
+        h = hashlib.sha256()
+        for part in (url, user or "", data or b""):
+            if not isinstance(part, bytes):
+                part = part.encode("utf-8")
+            h.update(part)
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _path(self, key, suffix):
+        return os.path.join(self.directory, key + suffix)
+
+    def get(self, key):
+        """
+        Return the metadata of a cached response or ``None``.
+
+        Marks the response as recently used.
+        """
+        filename = self._path(key, ".json")
+        try:
+            with io.open(filename, "rt", encoding="utf-8") as fh:
+                meta = json.load(fh)
+            os.utime(filename, None)
+        except (IOError, OSError, ValueError):
+            return None
+        if not os.path.exists(self._path(key, ".raw")):
+            return None
+        return meta
+
+    @staticmethod
+    def is_fresh(meta):
+        """
+        Whether a cached response can be used without revalidation.
+        """
+        return time.time() < meta["expires"]
+
+    @staticmethod
+    def validators(meta):
+        """
+        Return the request headers to revalidate a cached response.
+        """
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last-modified"):
+            headers["If-Modified-Since"] = meta["last-modified"]
+        return headers
+
+    def _expires(self, headers):
+        """
+        Expiration time of a response from its headers, ``None`` if it must
+        not be stored.
+        """
+        now = time.time()
+        directives = [d.strip().lower()
+                      for d in headers.get("cache-control", "").split(",")]
+        if "no-store" in directives:
+            return None
+        if "no-cache" in directives:
+            return now
+        for directive in directives:
+            match = re.match(r"max-age\s*=\s*\"?(\d+)", directive)
+            if match:
+                return now + int(match.group(1))
+        if headers.get("expires"):
+            expires = email.utils.parsedate_tz(headers["expires"])
+            # invalid dates mean already expired
+            if expires is None:
+                return now
+            return email.utils.mktime_tz(expires)
+        return now + self.default_ttl
+
+    def _write_meta(self, key, meta):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with io.open(fd, "wt", encoding="utf-8") as fh:
+            fh.write(str(json.dumps(meta)))
+        _replace(tmp, self._path(key, ".json"))
+
+    def refresh(self, key, meta, headers):
+        """
+        Update the expiration time of a response revalidated with HTTP 304.
+
+        :type headers: dict
+        :param headers: Headers of the 304 response with lower case names.
+        """
+        expires = self._expires(headers)
+        # "no-store" only makes sense for full responses, keep the cached
+        # one but revalidate it every time.
+        if expires is None:
+            expires = time.time()
+        meta = dict(meta, expires=expires)
+        for name in ("etag", "last-modified"):
+            if headers.get(name):
+                meta[name] = headers[name]
+        self._write_meta(key, meta)
+
+    def writer(self, key, headers, stream, chunk_size=io.DEFAULT_BUFFER_SIZE):
+        """
+        Return a file-like object reading ``stream`` and storing everything
+        read in the cache, or ``None`` if the response must not be stored.
+
+        The response is only stored after the ``commit()`` method of the
+        returned object has been called, ``discard()`` drops it.
+
+        :type headers: dict
+        :param headers: Response headers with lower case names.
+        :type stream: file
+        :param stream: The uncompressed response.
+        """
+        expires = self._expires(headers)
+        if expires is None:
+            return None
+        meta = {"expires": expires}
+        for name in ("etag", "last-modified"):
+            if headers.get(name):
+                meta[name] = headers[name]
+        return _CachingStream(_CachingReader(self, key, meta, stream),
+                              buffer_size=chunk_size)
+
+    def _commit(self, key, meta, tmp):
+        # The old parsed object is outdated.
+        _remove(self._path(key, ".pickle"))
+        _replace(tmp, self._path(key, ".raw"))
+        self._write_meta(key, meta)
+        self._evict()
+
+    def open(self, key):
+        """
+        Open the cached raw response for reading.
+        """
+        return io.open(self._path(key, ".raw"), "rb")
+
+    def load(self, key, read_func):
+        """
+        Return the parsed object of a cached response.
+
+        Parses the raw response with ``read_func`` and stores the result if
+        no parsed object is cached yet.
+        """
+        try:
+            with io.open(self._path(key, ".pickle"), "rb") as fh:
+                return pickle.load(fh)
+        except Exception:
+            pass
+        with self.open(key) as fh:
+            obj = read_func(fh)
+        self.store_object(key, obj)
+        return obj
+
+    def store_object(self, key, obj):
+        """
+        Store the parsed object of a cached response.
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with io.open(fd, "wb") as fh:
+                pickle.dump(obj, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Objects that can not be pickled are parsed again next time.
+            _remove(tmp)
+            return
+        _replace(tmp, self._path(key, ".pickle"))
+        self._evict()
+
+    def remove(self, key):
+        """
+        Remove a response from the cache.
+        """
+        for suffix in (".json", ".raw", ".pickle"):
+            _remove(self._path(key, suffix))
+
+    def clear(self):
+        """
+        Remove all responses from the cache.
+        """
+        for key in self._entries():
+            self.remove(key)
+
+    def _entries(self):
+        """
+        Return the size and last usage of each cached response.
+        """
+        entries = {}
+        for name in os.listdir(self.directory):
+            key, suffix = os.path.splitext(name)
+            if suffix not in (".json", ".raw", ".pickle"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            size, used = entries.get(key, (0, 0))
+            if suffix == ".json":
+                used = stat.st_mtime
+            entries[key] = (size + stat.st_size, used)
+        return entries
+
+    @property
+    def size(self):
+        """
+        Total size in bytes of all cached files.
+        """
+        return sum(size for size, _ in self._entries().values())
+
+    def _evict(self):
+        """
+        Remove the least recently used responses exceeding ``max_size``.
+        """
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for size, _ in entries.values())
+            for key in sorted(entries, key=lambda k: entries[k][1]):
+                if total <= self.max_size:
+                    break
+                self.remove(key)
+                total -= entries[key][0]
+
+
+class _CachingReader(io.RawIOBase):
+    """
+    Raw stream copying everything read from a response to a temporary file
+    in the cache.
+    """
+    def __init__(self, cache, key, meta, stream):
+        io.RawIOBase.__init__(self)
+        self._cache = cache
+        self._key = key
+        self._meta = meta
+        self._stream = stream
+        fd, self._tmp = tempfile.mkstemp(dir=cache.directory, suffix=".tmp")
+        self._file = io.open(fd, "wb")
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._stream.read(len(b))
+        n = len(data)
+        b[:n] = data
+        self._file.write(data)
+        return n
+
+    def close(self):
+        if not self._file.closed:
+            self.discard()
+        io.RawIOBase.close(self)
+
+    def commit(self):
+        """
+        Read the rest of the response and store it in the cache.
+        """
+        while True:
+            data = self._stream.read(io.DEFAULT_BUFFER_SIZE * 64)
+            if not data:
+                break
+            self._file.write(data)
+        self._file.close()
+        self._cache._commit(self._key, self._meta, self._tmp)
+
+    def discard(self):
+        """
+        Do not store the response.
+        """
+        self._file.close()
+        _remove(self._tmp)
+
+
+class _CachingStream(io.BufferedReader):
+    """
+    Buffered reader on a :class:`_CachingReader`.
+    """
+    def commit(self):
+        self.raw.commit()
+
+    def discard(self):
+        self.raw.discard()
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
@@ -29,6 +29,7 @@ import obspy
 
 from ...base import HTTPClient
 from .. import client
+from ..async_client import DEFAULT_SCHEDULER
 from ..client import raise_on_error
 from ..header import FDSNException, URL_MAPPINGS, FDSNNoDataException
 
@@ -109,7 +110,9 @@ def _download_bulk(r):
     credentials = r["credentials"].get(urlparse(r["endpoint"]).netloc, {})
     try:
         c = client.Client(r["endpoint"], debug=r["debug"],
-                          timeout=r["timeout"], **credentials)
+                          timeout=r["timeout"],
+                          connection_pool=r.get("connection_pool"),
+                          **credentials)
     # This should rarely happen but better safe than sorry.
     except FDSNException as e:  # pragma: no cover
         msg = e.args[0]
@@ -149,7 +152,8 @@ def _strip_protocol(url):
 # get_events() but also others).
 class BaseRoutingClient(HTTPClient):
     def __init__(self, debug=False, timeout=120, include_providers=None,
-                 exclude_providers=None, credentials=None):
+                 exclude_providers=None, credentials=None,
+                 connection_pool=None, scheduler=None):
         """
         :type routing_type: str
         :param routing_type: The type of
@@ -174,8 +178,23 @@ class BaseRoutingClient(HTTPClient):
             center specific credentials.
             You can also use a URL mapping as for the normal FDSN client
             instead of the URL.
+        :type connection_pool:
+            :class:`~obspy.clients.fdsn.connection_pool.HTTPConnectionPool`
+            or bool
+        :param connection_pool: Pool of persistent HTTP connections used for
+            the requests to the individual data centers. By default the pool
+            shared by all FDSN clients is used, see
+            :class:`~obspy.clients.fdsn.client.Client`.
+        :type scheduler:
+            :class:`~obspy.clients.fdsn.async_client.RequestScheduler`
+        :param scheduler: Runs the requests to the individual data centers
+            with a limited number of concurrent requests per data center.
+            By default the scheduler shared by all clients is used. Not
+            available on Python 2, where one thread per data center is used.
         """
         HTTPClient.__init__(self, debug=debug, timeout=timeout)
+        self._connection_pool = connection_pool
+        self._scheduler = scheduler or DEFAULT_SCHEDULER
         self.include_providers = include_providers
         self.exclude_providers = exclude_providers
 
@@ -253,7 +272,6 @@ class BaseRoutingClient(HTTPClient):
         if data_type not in ["waveform", "station"]:  # pragma: no cover
             raise ValueError("Invalid data type.")
 
-        # One thread per data center.
         dl_requests = []
         for k, v in split.items():
             dl_requests.append({
@@ -263,9 +281,21 @@ class BaseRoutingClient(HTTPClient):
                 "bulk_str": v,
                 "data_type": data_type,
                 "kwargs": kwargs,
-                "credentials": self.credentials})
-        pool = ThreadPool(processes=len(dl_requests))
-        results = pool.map(_try_download_bulk, dl_requests)
+                "credentials": self.credentials,
+                "connection_pool": self._connection_pool})
+        if self._scheduler is None:
+            # One thread per data center.
+            pool = ThreadPool(processes=len(dl_requests))
+            results = pool.map(_try_download_bulk, dl_requests)
+            # Explitly close the thread pool as somehow this does not work
+            # automatically under linux. See #2342.
+            pool.close()
+        else:
+            futures = [
+                self._scheduler.submit(urlparse(r["endpoint"]).netloc,
+                                       _try_download_bulk, r)
+                for r in dl_requests]
+            results = [f.result() for f in futures]
 
         # Merge all results into a single object.
         if data_type == "waveform":
@@ -282,10 +312,6 @@ class BaseRoutingClient(HTTPClient):
                 continue
             collection += _i
 
-        # Explitly close the thread pool as somehow this does not work
-        # automatically under linux. See #2342.
-        pool.close()
-
         return collection
 
     def _handle_requests_http_error(self, r):
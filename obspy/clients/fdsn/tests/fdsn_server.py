@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Local HTTP server answering FDSN web service requests in tests.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+from future.utils import PY2
+
+import gzip
+import io
+import threading
+
+if PY2:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+else:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+
+
+class _FDSNRequestHandler(BaseHTTPRequestHandler):
+    def setup(self):
+        self.protocol_version = self.server.protocol_version
+        BaseHTTPRequestHandler.setup(self)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, payload=None):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, payload, self.headers))
+        service = None
+        if self.path.startswith("/fdsnws/"):
+            service = self.path.split("/")[2]
+        etag = server.etags.get(service)
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = server.get_body(self.path, payload)
+        if body is None:
+            self.send_response(204)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        if etag:
+            self.send_header("ETag", etag)
+        if server.cache_control:
+            self.send_header("Cache-Control", server.cache_control)
+        if "gzip" in self.headers.get("Accept-encoding", ""):
+            buf = io.BytesIO()
+            with gzip.GzipFile(fileobj=buf, mode="wb") as fh:
+                fh.write(body)
+            body = buf.getvalue()
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        with server.lock:
+            server.sent.append(len(body))
+        self.wfile.write(body)
+        if server.close_connections:
+            self.close_connection = True
+
+    def do_GET(self):
+        self._reply()
+
+    def do_POST(self):
+        self._reply(self.rfile.read(int(self.headers.get("Content-Length"))))
+
+
+class FDSNTestServer(ThreadingMixIn, HTTPServer):
+    """
+    HTTP server on a free local port, serving requests in a background
+    thread once started.
+
+    Responses are compressed if the client accepts gzip. All attributes can
+    be changed while the server is running.
+
+    :type bodies: dict or callable
+    :param bodies: Response body of each service (``"dataselect"``,
+        ``"station"``, ``"event"``), or a function called with the path and
+        the POST payload (or ``None``) of a request returning the body.
+        A body of ``None`` is answered with HTTP 204.
+    :type keep_alive: bool
+    :param keep_alive: Whether to keep connections open (HTTP/1.1).
+    """
+    daemon_threads = True
+
+    def __init__(self, bodies=None, keep_alive=False):
+        HTTPServer.__init__(self, ("127.0.0.1", 0), _FDSNRequestHandler)
+        self.bodies = bodies if bodies is not None else {}
+        self.protocol_version = "HTTP/1.1" if keep_alive else "HTTP/1.0"
+        self.lock = threading.Lock()
+        # ETag per service, requests with a matching If-None-Match header
+        # are answered with HTTP 304
+        self.etags = {}
+        # value of the Cache-Control header of responses
+        self.cache_control = None
+        # whether to close the connection after each response
+        self.close_connections = False
+        # number of connections opened by clients
+        self.connections = 0
+        # path, payload and headers of all requests
+        self.requests = []
+        # size of all response bodies sent
+        self.sent = []
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:%d" % self.server_address[1]
+
+    def get_body(self, path, payload):
+        if callable(self.bodies):
+            return self.bodies(path, payload)
+        return self.bodies[path.split("/")[2]]
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
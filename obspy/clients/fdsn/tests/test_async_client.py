@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+The obspy.clients.fdsn.async_client test suite.
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import collections
+import sys
+import threading
+import time
+import unittest
+
+from obspy import Stream, Trace
+from obspy.core.compatibility import mock
+from obspy.clients.fdsn import Client, RoutingClient
+from obspy.clients.fdsn.async_client import AsyncClient, RequestScheduler
+
+if sys.version_info.major >= 3:
+    import asyncio
+
+
+class _ConcurrencyCounter(object):
+    """
+    Callable sleeping a bit and recording the number of simultaneous calls
+    per key.
+    """
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.running = collections.Counter()
+        self.maximum = collections.Counter()
+        self.calls = []
+
+    def __call__(self, key, value):
+        with self.lock:
+            self.calls.append((key, value))
+            self.running[key] += 1
+            self.running["total"] += 1
+            for k in (key, "total"):
+                self.maximum[k] = max(self.maximum[k], self.running[k])
+        time.sleep(self.delay)
+        with self.lock:
+            self.running[key] -= 1
+            self.running["total"] -= 1
+        return value
+
+
+@unittest.skipIf(sys.version_info.major < 3, 'test needs Python 3')
+class RequestSchedulerTestCase(unittest.TestCase):
+    def test_limit_per_key(self):
+        """
+        At most max_concurrent requests per key are run at a time.
+        """
+        scheduler = RequestScheduler(max_concurrent=2, max_workers=10)
+        func = _ConcurrencyCounter()
+        futures = [scheduler.submit(key, func, key, i)
+                   for i in range(6) for key in ("a", "b")]
+        self.assertEqual([f.result() for f in futures],
+                         [i for i in range(6) for key in ("a", "b")])
+        self.assertEqual(func.maximum["a"], 2)
+        self.assertEqual(func.maximum["b"], 2)
+        self.assertEqual(func.maximum["total"], 4)
+        # requests of one key are started in order
+        self.assertEqual([v for k, v in func.calls if k == "a"],
+                         [0, 1, 2, 3, 4, 5])
+        self.assertFalse(scheduler._running)
+        self.assertFalse(scheduler._pending)
+
+    def test_cancel_and_errors(self):
+        """
+        Cancelled requests are not run, exceptions are passed on.
+        """
+        scheduler = RequestScheduler(max_concurrent=1)
+        event = threading.Event()
+        func = mock.Mock(return_value=1)
+        first = scheduler.submit("a", event.wait, 5)
+        second = scheduler.submit("a", func)
+        third = scheduler.submit("a", int, "abc")
+        self.assertFalse(first.cancel())
+        self.assertTrue(second.cancel())
+        event.set()
+        self.assertTrue(first.result())
+        self.assertRaises(ValueError, third.result)
+        self.assertEqual(func.call_count, 0)
+
+
+@unittest.skipIf(sys.version_info.major < 3, 'test needs Python 3')
+class AsyncClientTestCase(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.scheduler = RequestScheduler(max_concurrent=2)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_queries(self):
+        """
+        Queries are run concurrently and return the results of the client.
+        """
+        client = AsyncClient(Client("http://example.com",
+                                    _discover_services=False),
+                             scheduler=self.scheduler, loop=self.loop)
+        counter = _ConcurrencyCounter()
+        client.client.get_waveforms = mock.Mock(
+            side_effect=lambda *args, **kwargs: counter("wf", args))
+        client.client.get_events = mock.Mock(return_value="catalog")
+
+        futures = [client.get_waveforms("XX", "STA%d" % i, "", "BHZ", 0, 1)
+                   for i in range(5)]
+        futures.append(client.get_events(minmagnitude=5))
+        results = self.loop.run_until_complete(asyncio.gather(*futures))
+        self.assertEqual(results[:5], [("XX", "STA%d" % i, "", "BHZ", 0, 1)
+                                       for i in range(5)])
+        self.assertEqual(results[5], "catalog")
+        client.client.get_events.assert_called_once_with(minmagnitude=5)
+        self.assertEqual(counter.maximum["wf"], 2)
+
+    def test_cancel(self):
+        """
+        Cancelling a waiting query removes it from the queue.
+        """
+        client = AsyncClient(Client("http://example.com",
+                                    _discover_services=False),
+                             scheduler=RequestScheduler(max_concurrent=1),
+                             loop=self.loop)
+        event = threading.Event()
+        client.client.get_stations = mock.Mock(
+            side_effect=lambda **kwargs: event.wait(5))
+        first = client.get_stations(network="XX")
+        second = client.get_stations(network="YY")
+        second.cancel()
+        event.set()
+        self.assertTrue(self.loop.run_until_complete(first))
+        self.assertTrue(second.cancelled())
+        client.client.get_stations.assert_called_once_with(network="XX")
+
+    def test_routing_client(self):
+        """
+        Routing clients download from the data centers via their scheduler.
+        """
+        routing = RoutingClient("eida-routing", scheduler=self.scheduler)
+        counter = _ConcurrencyCounter()
+
+        def _download(r):
+            counter(r["endpoint"], r["bulk_str"])
+            return Stream([Trace(header={"network": r["bulk_str"]})])
+
+        split = {"http://a.example.com": "A1",
+                 "http://b.example.com": "B1"}
+        client = AsyncClient(routing, loop=self.loop)
+        with mock.patch("obspy.clients.fdsn.routing.routing_client."
+                        "_try_download_bulk", side_effect=_download), \
+                mock.patch.object(self.scheduler, "submit",
+                                  wraps=self.scheduler.submit) as p:
+            routing.get_waveforms_bulk = \
+                lambda bulk: routing._download_waveforms(split)
+            st = self.loop.run_until_complete(
+                client.get_waveforms_bulk([]))
+        self.assertEqual(sorted(tr.stats.network for tr in st),
+                         ["A1", "B1"])
+        self.assertEqual(sorted(_i[0][0] for _i in p.call_args_list),
+                         ["a.example.com", "b.example.com"])
+        self.assertEqual(counter.maximum["total"], 2)
+
+
+def suite():
+    testsuite = unittest.TestSuite()
+    testsuite.addTest(unittest.makeSuite(RequestSchedulerTestCase, 'test'))
+    testsuite.addTest(unittest.makeSuite(AsyncClientTestCase, 'test'))
+    return testsuite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -139,6 +139,9 @@ class BaseRoutingClientTestCase(unittest.TestCase):
                          set([False]))
         self.assertEqual(set(_i[1]["timeout"] for _i in p.call_args_list),
                          set([240]))
+        self.assertEqual(
+            set(_i[1]["connection_pool"] for _i in p.call_args_list),
+            set([None]))
 
         # Waveform download.
         wf_bulk = mock_instance.get_waveforms_bulk
@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+The obspy.clients.fdsn.bulk_download test suite.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import io
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from obspy import Stream, Trace, UTCDateTime, read, read_inventory
+from obspy.core.compatibility import mock
+from obspy.clients.fdsn import Client
+from obspy.clients.fdsn.async_client import (DEFAULT_SCHEDULER,
+                                             RequestScheduler)
+from obspy.clients.fdsn.bulk_download import (BulkWaveformDownloader,
+                                              estimate_size, split_bulk)
+from obspy.clients.fdsn.header import (FDSNException, FDSNNoDataException,
+                                       FDSNRequestTooLargeException,
+                                       FDSNServiceUnavailableException)
+
+
+T0 = UTCDateTime(2018, 1, 1)
+
+
+class _FakeDataselect(object):
+    """
+    Replaces Client.get_waveforms_bulk, returns one trace with a sampling
+    rate of 1 Hz per request line.
+
+    Requests with more than ``max_samples`` samples are rejected, the first
+    ``failures`` requests fail as temporarily unavailable.
+    """
+    def __init__(self, max_samples=None, failures=0):
+        self.max_samples = max_samples
+        self.failures = failures
+        self.lock = threading.Lock()
+        self.requests = []
+        self.times = []
+
+    def __call__(self, bulk, filename=None):
+        lines = bulk.splitlines()
+        with self.lock:
+            self.requests.append(lines)
+            self.times.append(time.time())
+            if self.failures:
+                self.failures -= 1
+                raise FDSNServiceUnavailableException(
+                    "Service temporarily unavailable")
+        st = Stream()
+        for line in lines:
+            if "=" in line:
+                continue
+            net, sta, loc, cha, t1, t2 = line.split()
+            t1, t2 = UTCDateTime(t1), UTCDateTime(t2)
+            if sta == "NODATA":
+                continue
+            st += Trace(data=np.arange(t1 - T0, t2 - T0, dtype=np.int32),
+                        header={"network": net, "station": sta,
+                                "location": loc.replace("--", ""),
+                                "channel": cha, "starttime": t1})
+        if not st:
+            raise FDSNNoDataException("No data available for request.")
+        if self.max_samples and \
+                sum(tr.stats.npts for tr in st) > self.max_samples:
+            raise FDSNRequestTooLargeException(
+                "Request would result in too much data.")
+        if filename is not None:
+            st.write(filename, format="MSEED")
+            return
+        return st
+
+
+class BulkDownloadTestCase(unittest.TestCase):
+    """
+    Test cases for splitting large bulk waveform requests.
+    """
+    def setUp(self):
+        self.client = Client("http://example.com", _discover_services=False)
+
+    def _downloader(self, fake, **kwargs):
+        self.client.get_waveforms_bulk = mock.Mock(side_effect=fake)
+        kwargs.setdefault("backoff", 0)
+        kwargs.setdefault("min_duration", 10)
+        return BulkWaveformDownloader(self.client, **kwargs)
+
+    def _check_stream(self, st, bulk):
+        self.assertEqual(len(st), len(bulk))
+        for net, sta, loc, cha, t1, t2 in bulk:
+            tr = st.select(network=net, station=sta, location=loc,
+                           channel=cha)[0]
+            self.assertEqual(tr.stats.starttime, t1)
+            np.testing.assert_array_equal(
+                tr.data, np.arange(t1 - T0, t2 - T0, dtype=np.int32))
+
+    def test_estimate_size(self):
+        """
+        Sizes are estimated from the band code or the inventory.
+        """
+        self.assertEqual(estimate_size("XX", "A", "", "BHZ", T0, T0 + 3),
+                         80 * 4)
+        self.assertEqual(estimate_size("XX", "A", "", "BH*", T0, T0 + 3),
+                         3 * 80 * 4)
+        # unknown band codes
+        self.assertEqual(estimate_size("XX", "A", "", "XHZ", T0, T0 + 3), 4)
+        inv = read_inventory()
+        # six 20 Hz channels
+        self.assertEqual(
+            estimate_size("GR", "*", "*", "B*", T0, T0 + 3, inventory=inv),
+            6 * 20 * 4)
+        self.assertEqual(
+            estimate_size("GR", "FUR", "--", "BHZ", T0, T0 + 3,
+                          inventory=inv), 20 * 4)
+        # only the channels operating at the time are counted
+        self.assertEqual(
+            estimate_size("BW", "RJOB", "", "EH?", T0, T0 + 3,
+                          inventory=inv), 3 * 200 * 4)
+        # fall back to the band code if the inventory has no such channel
+        self.assertEqual(
+            estimate_size("XX", "A", "", "LHZ", T0, T0 + 3, inventory=inv),
+            4)
+
+    def test_split_bulk(self):
+        """
+        Lines are packed into chunks, long time windows are split.
+        """
+        bulk = [("XX", "A%d" % i, "", "LHZ", T0, T0 + 300) for i in range(5)]
+        chunks = split_bulk(bulk, max_size=1000)
+        self.assertEqual([len(c) for c in chunks], [2, 2, 1])
+        self.assertEqual([item for c in chunks for item in c], bulk)
+
+        chunks = split_bulk([("XX", "A", "", "LHZ", T0, T0 + 3000)],
+                            max_size=1000)
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual([c[0][4] for c in chunks],
+                         [T0, T0 + 750, T0 + 1500, T0 + 2250])
+        self.assertEqual(chunks[-1][0][5], T0 + 3000)
+        # not shorter than min_duration
+        chunks = split_bulk([("XX", "A", "", "LHZ", T0, T0 + 3000)],
+                            max_size=1000, min_duration=1500)
+        self.assertEqual(len(chunks), 2)
+
+    def test_reassemble(self):
+        """
+        Chunks are downloaded and merged into one stream.
+        """
+        fake = _FakeDataselect()
+        downloader = self._downloader(fake, max_size=1000)
+        bulk = [("XX", "A%d" % i, "", "LHZ", T0, T0 + 3000)
+                for i in range(3)]
+        bulk.append(("XX", "NODATA", "", "LHZ", T0, T0 + 100))
+        st = downloader.get_waveforms_bulk(bulk, quality="B")
+        self.assertEqual(len(fake.requests), 13)
+        for lines in fake.requests:
+            self.assertEqual(lines[0], "quality=B")
+        self._check_stream(st, bulk[:3])
+
+        self.assertRaises(FDSNNoDataException, downloader.get_waveforms_bulk,
+                          [("XX", "NODATA", "", "LHZ", T0, T0 + 100)])
+
+    def test_halve_too_large_requests(self):
+        """
+        Rejected requests are split in halves until accepted.
+        """
+        fake = _FakeDataselect(max_samples=1000)
+        downloader = self._downloader(fake, max_size=1e6)
+        bulk = [("XX", "A%d" % i, "", "LHZ", T0, T0 + 1000)
+                for i in range(4)]
+        bulk.append(("XX", "B", "", "LHZ", T0, T0 + 3000))
+        st = downloader.get_waveforms_bulk(bulk)
+        self._check_stream(st, bulk)
+        for lines in fake.requests[1:]:
+            self.assertLess(len(lines), 5)
+
+        # time windows are not split below min_duration
+        downloader.min_duration = 2000
+        self.assertRaises(FDSNRequestTooLargeException,
+                          downloader.get_waveforms_bulk,
+                          [("XX", "B", "", "LHZ", T0, T0 + 3000)])
+
+    def test_retry(self):
+        """
+        Temporary failures are retried, other errors are raised.
+        """
+        fake = _FakeDataselect(failures=2)
+        downloader = self._downloader(fake, max_retries=2, backoff=0.1)
+        bulk = [("XX", "A", "", "LHZ", T0, T0 + 100)]
+        st = downloader.get_waveforms_bulk(bulk)
+        self._check_stream(st, bulk)
+        self.assertEqual(len(fake.requests), 3)
+        # exponential backoff
+        self.assertGreaterEqual(fake.times[1] - fake.times[0], 0.1)
+        self.assertGreaterEqual(fake.times[2] - fake.times[1], 0.2)
+
+        downloader.backoff = 0
+        fake.failures = 3
+        self.assertRaises(FDSNServiceUnavailableException,
+                          downloader.get_waveforms_bulk, bulk)
+
+        self.client.get_waveforms_bulk.side_effect = \
+            FDSNException("Authentication failed.")
+        self.assertRaises(FDSNException, downloader.get_waveforms_bulk,
+                          bulk)
+        self.assertEqual(self.client.get_waveforms_bulk.call_count, 7)
+
+    @unittest.skipIf(DEFAULT_SCHEDULER is None, 'test needs Python 3')
+    def test_backoff_does_not_block_scheduler(self):
+        """
+        Requests waiting to be repeated do not occupy the scheduler.
+        """
+        scheduler = RequestScheduler(max_concurrent=1)
+        fake = _FakeDataselect(failures=1)
+        downloader = self._downloader(fake, backoff=1.0, scheduler=scheduler)
+        bulk = [("XX", "A", "", "LHZ", T0, T0 + 100)]
+        thread = threading.Thread(target=downloader.get_waveforms_bulk,
+                                  args=(bulk, ))
+        thread.start()
+        while not fake.requests:
+            time.sleep(0.01)
+        # another request to the same data center during the backoff
+        t = time.time()
+        future = scheduler.submit("example.com", time.time)
+        self.assertLess(future.result(timeout=5) - t, 0.5)
+        thread.join()
+        self.assertEqual(len(fake.requests), 2)
+        self.assertGreaterEqual(fake.times[1] - fake.times[0], 1.0)
+
+    def test_expand_wildcards(self):
+        """
+        Lines with wildcards are expanded to channels of the inventory.
+        """
+        inv = read_inventory()
+        bulk = [("GR", "*", "*", "B*", T0, T0 + 600),
+                ("XX", "A", "", "LH?", T0, T0 + 600)]
+        chunks = split_bulk(bulk, max_size=20 * 600 * 4.0 / 3.0,
+                            inventory=inv)
+        self.assertEqual(
+            sorted(c[0][:4] for c in chunks),
+            sorted([("GR", sta, "--", cha, ) for sta in ("FUR", "WET")
+                    for cha in ("BHE", "BHN", "BHZ")] +
+                   [("XX", "A", "", "LH?")]))
+        self.assertEqual(max(len(c) for c in chunks), 1)
+
+    def test_filename(self):
+        """
+        The data of all chunks is written to the file.
+        """
+        fake = _FakeDataselect()
+        downloader = self._downloader(fake, max_size=1000)
+        bulk = [("XX", "A%d" % i, "", "LHZ", T0, T0 + 500)
+                for i in range(3)]
+        buf = io.BytesIO()
+        self.assertIsNone(downloader.get_waveforms_bulk(bulk, filename=buf))
+        buf.seek(0)
+        st = read(buf)
+        st.merge()
+        self._check_stream(st, bulk)
+
+    def test_sequential(self):
+        """
+        Without scheduler the chunks are downloaded one after the other.
+        """
+        fake = _FakeDataselect(max_samples=500)
+        downloader = self._downloader(fake, max_size=1000)
+        downloader.scheduler = None
+        bulk = [("XX", "A%d" % i, "", "LHZ", T0, T0 + 1000)
+                for i in range(3)]
+        self._check_stream(downloader.get_waveforms_bulk(bulk), bulk)
+
+
+def suite():
+    return unittest.makeSuite(BulkDownloadTestCase, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -266,12 +266,14 @@ class ClientTestCase(RegExTestCase):
         # Also check the full call with a mock test.
         for loc in ["", " ", "  ", "--", b"", b" ", b"  ", b"--",
                     u"", u" ", u"  ", u"--"]:
-            with mock.patch("obspy.clients.fdsn.Client._download") as p:
+            with mock.patch("obspy.clients.fdsn.Client._download",
+                            return_value=io.BytesIO()) as p:
                 self.client.get_stations(0, 0, location=loc,
                                          filename=mock.Mock())
             self.assertEqual(p.call_count, 1)
             self.assertIn("location=--", p.call_args[0][0])
-            with mock.patch("obspy.clients.fdsn.Client._download") as p:
+            with mock.patch("obspy.clients.fdsn.Client._download",
+                            return_value=io.BytesIO()) as p:
                 self.client.get_waveforms(1, 2, loc, 4, 0, 0,
                                           filename=mock.Mock())
             self.assertEqual(p.call_count, 1)
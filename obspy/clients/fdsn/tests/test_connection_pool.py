@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+The obspy.clients.fdsn.connection_pool test suite.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+from future.utils import PY2
+
+import unittest
+
+from obspy.clients.fdsn import Client
+from obspy.clients.fdsn.client import download_url
+from obspy.clients.fdsn.connection_pool import HTTPConnectionPool
+from obspy.clients.fdsn.header import FDSNNoDataException
+from obspy.clients.fdsn.tests.fdsn_server import FDSNTestServer
+
+
+def _echo(path, payload):
+    """
+    Response body repeating path and payload of the request.
+    """
+    if path.startswith("/nodata"):
+        return None
+    return (path.encode() + b"\n" + (payload or b"")) * 1000
+
+
+@unittest.skipIf(PY2, "connections are only kept open on Python 3")
+class HTTPConnectionPoolTestCase(unittest.TestCase):
+    """
+    Test cases for persistent connections of the FDSN client.
+    """
+    def setUp(self):
+        self.server = FDSNTestServer(_echo, keep_alive=True).start()
+        self.url = self.server.url
+        self.pool = HTTPConnectionPool(maxsize=2)
+        self.client = Client(self.url, _discover_services=False,
+                             connection_pool=self.pool)
+
+    def tearDown(self):
+        self.pool.clear()
+        self.server.stop()
+
+    def test_connections_are_reused(self):
+        """
+        Subsequent GET and POST requests use the same connection.
+        """
+        for i in range(5):
+            data = self.client._download(self.url + "/get%d" % i,
+                                         return_string=True)
+            self.assertEqual(data, ("/get%d\n" % i).encode() * 1000)
+            data = self.client._download(self.url + "/post", data=b"abc",
+                                         return_string=True, use_gzip=False)
+            self.assertEqual(data, b"/post\nabc" * 1000)
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(len(self.pool), 1)
+        # empty replies give back the connection as well
+        self.assertRaises(FDSNNoDataException, self.client._download,
+                          self.url + "/nodata")
+        self.client._download(self.url + "/get", return_string=True)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_closed_connections(self):
+        """
+        Connections closed by the server are replaced.
+        """
+        self.client._download(self.url + "/get", return_string=True)
+        self.server.close_connections = True
+        for _i in range(3):
+            data = self.client._download(self.url + "/get",
+                                         return_string=True)
+            self.assertEqual(data, b"/get\n" * 1000)
+        # the server closes the connection after each request without
+        # telling the client, so every second request needs to reconnect
+        self.assertEqual(self.server.connections, 3)
+
+    def test_partially_read_response(self):
+        """
+        Connections of responses closed before being read are not reused.
+        """
+        code, response = download_url(self.url + "/get",
+                                      self.client._url_opener,
+                                      return_string=True, use_gzip=False)
+        self.assertEqual(code, 200)
+        opener = self.client._url_opener
+        url_obj = opener.open(self.url + "/get", timeout=10)
+        url_obj.read(10)
+        url_obj.close()
+        self.assertEqual(len(self.pool), 0)
+        self.client._download(self.url + "/get", return_string=True)
+        self.assertEqual(self.server.connections, 2)
+
+    def test_pool_size(self):
+        """
+        At most maxsize idle connections are kept per host.
+        """
+        opener = self.client._url_opener
+        responses = [opener.open(self.url + "/get", timeout=10)
+                     for _i in range(4)]
+        self.assertEqual(self.server.connections, 4)
+        for response in responses:
+            response.read()
+        self.assertEqual(len(self.pool), 2)
+
+    def test_disabled_pool(self):
+        """
+        Without pool every request opens a new connection.
+        """
+        client = Client(self.url, _discover_services=False,
+                        connection_pool=False)
+        for _i in range(3):
+            client._download(self.url + "/get", return_string=True)
+        self.assertEqual(self.server.connections, 3)
+
+
+def suite():
+    return unittest.makeSuite(HTTPConnectionPoolTestCase, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
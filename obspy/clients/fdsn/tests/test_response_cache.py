@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+The obspy.clients.fdsn.response_cache test suite.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+from future.utils import PY2
+
+import io
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from obspy import read_events, read_inventory
+from obspy.core.compatibility import mock
+from obspy.clients.fdsn import Client
+from obspy.clients.fdsn.connection_pool import HTTPConnectionPool
+from obspy.clients.fdsn.response_cache import ResponseCache
+from obspy.clients.fdsn.tests.fdsn_server import FDSNTestServer
+
+
+class ResponseCacheTestCase(unittest.TestCase):
+    """
+    Test cases for caching station and event service responses.
+    """
+    @classmethod
+    def setUpClass(cls):
+        buf = io.BytesIO()
+        read_inventory().write(buf, format="STATIONXML")
+        cls.stationxml = buf.getvalue()
+        buf = io.BytesIO()
+        read_events().write(buf, format="QUAKEML")
+        cls.quakeml = buf.getvalue()
+
+    def setUp(self):
+        self.server = FDSNTestServer({"station": self.stationxml,
+                                      "event": self.quakeml}).start()
+        self.url = self.server.url
+        self.directory = tempfile.mkdtemp()
+        self.cache = ResponseCache(self.directory)
+        self.client = Client(self.url, _discover_services=False,
+                             connection_pool=False, cache=self.cache)
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.directory)
+
+    def _etags(self):
+        return [headers.get("If-None-Match")
+                for _, _, headers in self.server.requests]
+
+    def _files(self):
+        return sorted(os.path.splitext(name)[1]
+                      for name in os.listdir(self.directory))
+
+    def test_fresh_responses(self):
+        """
+        Fresh responses are neither downloaded nor parsed again.
+        """
+        self.server.cache_control = "public, max-age=3600"
+        inv = self.client.get_stations(network="GR", level="response")
+        self.assertEqual(inv, read_inventory(io.BytesIO(self.stationxml)))
+        self.assertEqual(self._files(), [".json", ".pickle", ".raw"])
+        with mock.patch("obspy.clients.fdsn.client._read_inventory_stream") \
+                as p:
+            inv2 = self.client.get_stations(network="GR", level="response")
+        self.assertEqual(p.call_count, 0)
+        self.assertEqual(inv2, inv)
+        self.assertEqual(len(self.server.requests), 1)
+        # other parameters are a different request
+        self.client.get_stations(network="BW", level="response")
+        self.assertEqual(len(self.server.requests), 2)
+
+        cat = self.client.get_events(minmagnitude=5)
+        self.assertEqual(self.client.get_events(minmagnitude=5), cat)
+        self.assertEqual(len(self.server.requests), 3)
+        # three responses with parsed objects
+        self.assertEqual(len(self._files()), 9)
+
+    def test_revalidation(self):
+        """
+        Stale responses are revalidated with their ETag.
+        """
+        self.server.cache_control = "no-cache"
+        self.server.etags["station"] = '"v1"'
+        inv = self.client.get_stations(network="GR")
+        with mock.patch("obspy.clients.fdsn.client._read_inventory_stream") \
+                as p:
+            self.assertEqual(self.client.get_stations(network="GR"), inv)
+        self.assertEqual(p.call_count, 0)
+        self.assertEqual(self._etags(), [None, '"v1"'])
+
+        # changed responses are downloaded and replace the cached one
+        self.server.etags["station"] = '"v2"'
+        self.server.bodies["station"] = self.stationxml.replace(
+            b"Fuerstenfeldbruck", b"Somewhere else")
+        inv = self.client.get_stations(network="GR")
+        self.assertIn("Somewhere else", str(inv.get_contents()))
+        self.assertEqual(self.client.get_stations(network="GR"), inv)
+        self.assertEqual(self._etags(), [None, '"v1"', '"v1"', '"v2"'])
+
+    @unittest.skipIf(PY2, "connections are only kept open on Python 3")
+    def test_revalidation_keeps_connection(self):
+        """
+        Revalidated responses give back the connection to the pool.
+        """
+        self.server.stop()
+        self.server = FDSNTestServer({"station": self.stationxml},
+                                     keep_alive=True).start()
+        pool = HTTPConnectionPool(maxsize=2)
+        client = Client(self.server.url, _discover_services=False,
+                        connection_pool=pool, cache=self.cache)
+        try:
+            self.server.cache_control = "no-cache"
+            self.server.etags["station"] = '"v1"'
+            inv = client.get_stations(network="GR")
+            for _ in range(3):
+                self.assertEqual(client.get_stations(network="GR"), inv)
+            self.assertEqual(self._etags(), [None] + ['"v1"'] * 3)
+            self.assertEqual(self.server.connections, 1)
+            self.assertEqual(len(pool), 1)
+        finally:
+            pool.clear()
+
+    def test_no_store_and_default_ttl(self):
+        """
+        Responses are not stored if the server forbids it, responses
+        without cache headers are fresh for default_ttl seconds.
+        """
+        self.server.cache_control = "no-store"
+        self.client.get_stations()
+        self.assertEqual(self._files(), [])
+
+        self.server.cache_control = None
+        self.client.get_stations()
+        self.client.get_stations()
+        self.assertEqual(len(self.server.requests), 3)
+        self.cache.default_ttl = 3600
+        self.client.get_stations()
+        self.client.get_stations()
+        self.assertEqual(len(self.server.requests), 4)
+
+    def test_bulk_and_filename(self):
+        """
+        POST requests are cached by their payload, cached responses are
+        written to files.
+        """
+        self.server.cache_control = "max-age=3600"
+        bulk = [("GR", "FUR", "*", "*", "*", "*")]
+        buf = io.BytesIO()
+        self.client.get_stations_bulk(bulk, filename=buf)
+        self.assertEqual(buf.getvalue(), self.stationxml)
+        # only the raw response was stored
+        self.assertEqual(self._files(), [".json", ".raw"])
+        inv = self.client.get_stations_bulk(bulk)
+        self.assertEqual(inv, read_inventory(io.BytesIO(self.stationxml)))
+        self.assertEqual(self._files(), [".json", ".pickle", ".raw"])
+        buf = io.BytesIO()
+        self.client.get_stations_bulk(bulk, filename=buf)
+        self.assertEqual(buf.getvalue(), self.stationxml)
+        self.assertEqual(len(self.server.requests), 1)
+
+        self.client.get_stations_bulk([("GR", "WET", "*", "*", "*", "*")])
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.server.requests[1][1],
+                         b"GR WET * * * *")
+
+    def test_invalid_responses_not_stored(self):
+        """
+        Responses that can not be parsed are not stored.
+        """
+        self.server.cache_control = "max-age=3600"
+        self.server.bodies["event"] = b"<xml>no quakeml</xml>"
+        self.assertRaises(Exception, self.client.get_events)
+        self.assertEqual(self._files(), [])
+
+    def test_eviction(self):
+        """
+        The least recently used responses are evicted.
+        """
+        cache = ResponseCache(self.directory, max_size=2500,
+                              default_ttl=3600)
+        now = time.time()
+        for i in range(3):
+            key = cache.key("http://example.com/%d" % i)
+            stream = cache.writer(key, {}, io.BytesIO(b"x" * 1000))
+            self.assertEqual(stream.read(), b"x" * 1000)
+            stream.commit()
+            stream.close()
+            # mark as used in the past, oldest first
+            os.utime(cache._path(key, ".json"), (now - 100 + i,) * 2)
+            self.assertIsNotNone(cache.get(cache.key(
+                "http://example.com/0")))
+        self.assertLessEqual(cache.size, 2500)
+        # the first one was used last
+        self.assertIsNotNone(cache.get(cache.key("http://example.com/0")))
+        self.assertIsNone(cache.get(cache.key("http://example.com/1")))
+        self.assertIsNotNone(cache.get(cache.key("http://example.com/2")))
+        cache.clear()
+        self.assertEqual(cache.size, 0)
+
+    def test_keys(self):
+        """
+        Requests with different payload or user have different keys.
+        """
+        key = ResponseCache.key
+        url = "http://example.com/fdsnws/station/1/query"
+        self.assertEqual(key(url), key(url, data=b""))
+        self.assertNotEqual(key(url), key(url, data=b"GR * * * * *"))
+        self.assertNotEqual(key(url), key(url, user="someone"))
+        self.assertNotEqual(key(url), key(url + "?level=response"))
+
+
+def suite():
+    return unittest.makeSuite(ResponseCacheTestCase, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+The obspy.clients.fdsn test suite for streamed responses.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import io
+import os
+import unittest
+
+import numpy as np
+
+from obspy import Stream, Trace, UTCDateTime, read_events, read_inventory
+from obspy.core.compatibility import mock
+from obspy.core.util.base import NamedTemporaryFile
+from obspy.clients.fdsn import Client
+from obspy.clients.fdsn.client import download_url
+from obspy.clients.fdsn.tests.fdsn_server import FDSNTestServer
+from obspy.io.mseed import (ObsPyMSEEDFilesizeTooSmallError,
+                            ObsPyMSEEDReadingError)
+
+
+class StreamedResponseTestCase(unittest.TestCase):
+    """
+    Test cases for parsing responses of the FDSN client while downloading.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.datapath = os.path.join(os.path.dirname(__file__), "data")
+        # two channels with many records each
+        cls.stream = Stream()
+        for channel in ("BHZ", "BHN"):
+            cls.stream += Trace(
+                data=np.arange(50000, dtype=np.int32),
+                header={"network": "XX", "station": "AAA",
+                        "channel": channel, "sampling_rate": 20,
+                        "starttime": UTCDateTime(2018, 1, 1)})
+        buf = io.BytesIO()
+        cls.stream.write(buf, format="MSEED", reclen=512, encoding="INT32")
+        cls.mseed = buf.getvalue()
+        buf = io.BytesIO()
+        read_inventory().write(buf, format="STATIONXML")
+        cls.stationxml = buf.getvalue()
+        buf = io.BytesIO()
+        read_events().write(buf, format="QUAKEML")
+        cls.quakeml = buf.getvalue()
+
+    def setUp(self):
+        self.server = FDSNTestServer({"dataselect": self.mseed,
+                                      "station": self.stationxml,
+                                      "event": self.quakeml}).start()
+        self.url = self.server.url
+        self.client = Client(self.url, _discover_services=False,
+                             connection_pool=False)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_download_url_stream(self):
+        """
+        Streamed responses are uncompressed while reading.
+        """
+        url = self.url + "/fdsnws/event/1/query"
+        code, data = download_url(url, self.client._url_opener,
+                                  stream=True)
+        self.assertEqual(code, 200)
+        self.assertEqual(data.read(100), self.quakeml[:100])
+        self.assertEqual(data.read(), self.quakeml[100:])
+        data.close()
+        # the compressed response was sent
+        self.assertLess(self.server.sent[0], len(self.quakeml))
+
+    def test_waveforms_read_in_chunks(self):
+        """
+        MiniSEED records are decoded in chunks and merged again.
+        """
+        with mock.patch("obspy.clients.fdsn.client.STREAM_CHUNK_SIZE",
+                        4096):
+            st = self.client.get_waveforms_bulk(
+                [("XX", "AAA", "", "BH?", UTCDateTime(2018, 1, 1),
+                  UTCDateTime(2018, 1, 2))])
+        self.assertEqual(len(st), 2)
+        for tr in st:
+            expected = self.stream.select(id=tr.id)[0]
+            self.assertEqual(tr.stats.starttime, expected.stats.starttime)
+            self.assertEqual(tr.stats._format, "MSEED")
+            np.testing.assert_array_equal(tr.data, expected.data)
+
+    def test_invalid_waveform_responses(self):
+        """
+        Responses without any MiniSEED records raise an error.
+        """
+        bulk = [("XX", "AAA", "", "BH?", UTCDateTime(2018, 1, 1),
+                 UTCDateTime(2018, 1, 2))]
+        # responses shorter than one record raise the same error as
+        # reading such a file
+        for body in (b"", b"<html><body>Proxy error</body></html>"):
+            self.server.bodies["dataselect"] = body
+            self.assertRaises(ObsPyMSEEDFilesizeTooSmallError,
+                              self.client.get_waveforms_bulk, bulk)
+        self.server.bodies["dataselect"] = \
+            b"<html><body>Proxy error</body></html>" * 10
+        with self.assertRaises(ObsPyMSEEDReadingError) as e:
+            self.client.get_waveforms_bulk(bulk)
+        self.assertNotIsInstance(e.exception, ObsPyMSEEDFilesizeTooSmallError)
+
+    def test_write_to_file(self):
+        """
+        Responses are written to the file while downloading.
+        """
+        with NamedTemporaryFile() as tf:
+            with mock.patch("obspy.clients.fdsn.client.STREAM_CHUNK_SIZE",
+                            4096):
+                self.client.get_waveforms_bulk(
+                    [("XX", "AAA", "", "BH?", UTCDateTime(2018, 1, 1),
+                      UTCDateTime(2018, 1, 2))], filename=tf.name)
+            with open(tf.name, "rb") as fh:
+                self.assertEqual(fh.read(), self.mseed)
+        buf = io.BytesIO()
+        self.assertIsNone(self.client.get_stations(filename=buf))
+        self.assertEqual(buf.getvalue(), self.stationxml)
+
+    def test_inventory_formats(self):
+        """
+        StationXML and FDSN text responses are both read.
+        """
+        inv = self.client.get_stations()
+        self.assertEqual(inv, read_inventory(io.BytesIO(self.stationxml)))
+        filename = os.path.join(self.datapath, "channel_level_fdsn.txt")
+        with open(filename, "rb") as fh:
+            self.server.bodies["station"] = fh.read()
+        inv = self.client.get_stations_bulk([("*", "*", "*", "*", "*", "*")])
+        self.assertEqual(inv, read_inventory(filename))
+
+    def test_events(self):
+        """
+        QuakeML is parsed from the compressed response.
+        """
+        cat = self.client.get_events()
+        self.assertEqual(cat, read_events(io.BytesIO(self.quakeml)))
+
+
+def suite():
+    return unittest.makeSuite(StreamedResponseTestCase, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
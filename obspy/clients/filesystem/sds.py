@@ -38,25 +38,36 @@ See https://www.seiscomp3.org/wiki/doc/applications/slarchive/SDS.
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
+from future.utils import native_str
 
+import fnmatch
 import glob
+import io
 import os
 import re
+import sqlite3
+import threading
 import warnings
 from datetime import timedelta
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 
-from obspy import Stream, read, UTCDateTime
+from obspy import Stream, Trace, read, UTCDateTime
+from obspy.core.compatibility import from_buffer
 from obspy.core.stream import _headonly_warning_msg
+from obspy.core.util.base import _parallel_map
 from obspy.core.util.misc import BAND_CODE
 from obspy.io.mseed import ObsPyMSEEDFilesizeTooSmallError
+from obspy.io.mseed.util import (_convert_datetime_to_mstime,
+                                 _get_record_index, _scan_records)
 
 
 SDS_FMTSTR = os.path.join(
     "{year}", "{network}", "{station}", "{channel}.{sds_type}",
     "{network}.{station}.{location}.{channel}.{sds_type}.{year}.{doy:03d}")
 FORMAT_STR_PLACEHOLDER_REGEX = r"{(\w+?)?([!:].*?)?}"
+SDS_INDEX_FILENAME = ".obspy_sds_index.sqlite"
 
 
 class Client(object):
@@ -69,7 +80,7 @@ class Client(object):
     FMTSTR = SDS_FMTSTR
 
     def __init__(self, sds_root, sds_type="D", format="MSEED",
-                 fileborder_seconds=30, fileborder_samples=5000):
+                 fileborder_seconds=30, fileborder_samples=5000, index=None):
         """
         Initialize a SDS local filesystem client.
 
@@ -106,6 +117,14 @@ class Client(object):
             code of the requested channel to sampling frequency. The maximum of
             both ``fileborder_seconds`` and ``fileborder_samples`` is used when
             determining if previous/next day should be checked for data.
+        :type index: bool or str
+        :param index: Use a persistent record-level index of the archive's
+            MiniSEED files (see :class:`SDSIndex`) to only read those records
+            from disk that are actually needed for a request. Can be set to
+            ``True`` to store the index in a file ``.obspy_sds_index.sqlite``
+            in ``sds_root`` or to the filename of the index file to use. The
+            index is built (and updated whenever files are modified) on the
+            fly. Only supported for archives in ``format="MSEED"``.
         """
         if not os.path.isdir(sds_root):
             msg = ("SDS root is not a local directory: " + sds_root)
@@ -115,9 +134,20 @@ class Client(object):
         self.format = format and format.upper()
         self.fileborder_seconds = fileborder_seconds
         self.fileborder_samples = fileborder_samples
+        if index:
+            if self.format != "MSEED":
+                msg = ("Using an index is only supported for archives in "
+                       "MiniSEED format (format='MSEED').")
+                raise ValueError(msg)
+            if index is True:
+                index = os.path.join(sds_root, SDS_INDEX_FILENAME)
+            self.index = SDSIndex(index)
+        else:
+            self.index = None
 
     def get_waveforms(self, network, station, location, channel, starttime,
-                      endtime, merge=-1, sds_type=None, **kwargs):
+                      endtime, merge=-1, sds_type=None, workers=None,
+                      **kwargs):
         """
         Read data from a local SeisComP Data Structure (SDS) directory tree.
 
@@ -153,6 +183,9 @@ class Client(object):
         :type sds_type: str
         :param sds_type: Override SDS data type identifier that was specified
             during client initialization.
+        :type workers: int
+        :param workers: Number of threads to use to read the matching files
+            concurrently. By default files are read sequentially.
         :param kwargs: Additional kwargs that get passed on to
             :func:`~obspy.core.stream.read` internally, mostly for internal
             low-level purposes used by other methods.
@@ -165,21 +198,27 @@ class Client(object):
 
         seed_pattern = ".".join((network, station, location, channel))
 
-        st = Stream()
         full_paths = self._get_filenames(
             network=network, station=station, location=location,
             channel=channel, starttime=starttime, endtime=endtime,
             sds_type=sds_type)
-        for full_path in full_paths:
+
+        def _read_file(full_path):
             try:
-                st += read(full_path, format=self.format, starttime=starttime,
-                           endtime=endtime, sourcename=seed_pattern, **kwargs)
+                return self._read_file(full_path, starttime=starttime,
+                                       endtime=endtime,
+                                       sourcename=seed_pattern, **kwargs)
             except ObsPyMSEEDFilesizeTooSmallError:
                 # just ignore small MSEED files, in use cases working with
                 # near-realtime data these are usually just being created right
                 # at request time, e.g. when fetching current data right after
                 # midnight
-                continue
+                return Stream()
+
+        st = Stream()
+        for st_ in _parallel_map(_read_file, sorted(full_paths),
+                                 workers=workers):
+            st += st_
 
         # make sure we only have the desired data, just in case the file
         # contents do not match the expected SEED id
@@ -198,6 +237,192 @@ class Client(object):
             st.merge(merge)
         return st
 
+    def slide(self, network, station, location, channel, starttime,
+              endtime, window_length, step, offset=0,
+              include_partial_windows=False, nearest_sample=True,
+              chunk_length=3600, prefetch=True, merge=-1, sds_type=None,
+              **kwargs):
+        """
+        Generator yielding equal length sliding windows of archive data.
+
+        Works like :meth:`Stream.slide() <obspy.core.stream.Stream.slide>`,
+        but without reading all data into memory first. Data is read from
+        the archive in chunks of ``chunk_length`` seconds as needed for the
+        next window. Only the data still needed for the next windows is kept
+        in memory and is reused for overlapping windows. Optionally the next
+        chunk is read in a background thread while the current windows are
+        being processed.
+
+        Like :meth:`Stream.slide() <obspy.core.stream.Stream.slide>` the
+        yielded windows are views of the data in memory. Make a copy of a
+        window if it is needed after requesting the next window or if the data
+        is modified.
+
+        >>> from obspy import UTCDateTime
+        >>> t = UTCDateTime("2015-10-12T12")
+        >>> for st in client.slide("IU", "ANMO", "*", "HH?", t, t + 86400,
+        ...                        window_length=600, step=300):
+        ...     print(st)  # doctest: +SKIP
+
+        :type network: str
+        :param network: Network code of requested data (e.g. "IU").
+            Wildcards '*' and '?' are supported.
+        :type station: str
+        :param station: Station code of requested data (e.g. "ANMO").
+            Wildcards '*' and '?' are supported.
+        :type location: str
+        :param location: Location code of requested data (e.g. "").
+            Wildcards '*' and '?' are supported.
+        :type channel: str
+        :param channel: Channel code of requested data (e.g. "HHZ").
+            Wildcards '*' and '?' are supported.
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+        :param starttime: Start of the whole time interval.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+        :param endtime: End of the whole time interval.
+        :type window_length: float
+        :param window_length: The length of each window in seconds.
+        :type step: float
+        :param step: The step between the start times of two successive
+            windows in seconds. Has to be positive.
+        :type offset: float
+        :param offset: The offset of the first window in seconds relative to
+            ``starttime``.
+        :type include_partial_windows: bool
+        :param include_partial_windows: Determines if windows that are
+            shorter then 99.9 % of the desired length are returned.
+        :type nearest_sample: bool
+        :param nearest_sample: See
+            :meth:`Stream.slide() <obspy.core.stream.Stream.slide>`.
+        :type chunk_length: float
+        :param chunk_length: Length in seconds of the chunks of data that are
+            read from the archive at once. At least the length of one window
+            is read.
+        :type prefetch: bool
+        :param prefetch: Whether to read the next chunk of data in a
+            background thread.
+        :type merge: int or None
+        :param merge: Merge operation to perform on the data, see
+            :meth:`get_waveforms`. Traces that are split at chunk borders are
+            always merged again.
+        :type sds_type: str
+        :param sds_type: Override SDS data type identifier that was specified
+            during client initialization.
+        :param kwargs: Additional kwargs that get passed on to
+            :meth:`get_waveforms`.
+        :rtype: generator of :class:`~obspy.core.stream.Stream`
+        """
+        if step <= 0:
+            msg = "'step' must be positive."
+            raise ValueError(msg)
+        if starttime >= endtime:
+            msg = ("'endtime' must be after 'starttime'.")
+            raise ValueError(msg)
+        chunk_length = max(chunk_length, window_length)
+
+        def _get_chunk(t1, t2):
+            return self.get_waveforms(
+                network, station, location, channel, t1, t2, merge=merge,
+                sds_type=sds_type, **kwargs)
+
+        def _merge(st):
+            if merge is None or merge is False:
+                st._cleanup()
+            else:
+                st.merge(merge)
+
+        pool = ThreadPool(1) if prefetch else None
+        pending = None
+        buffer_ = Stream()
+        buffer_end = starttime + offset
+        try:
+            for window_start, window_end in _iter_window_times(
+                    starttime, endtime, window_length, step, offset,
+                    include_partial_windows):
+                # read more data as needed for the next window, including one
+                # more sample after the window end for nearest sample
+                # rounding
+                while buffer_end < endtime and buffer_end < window_end + max(
+                        [tr.stats.delta for tr in buffer_] or [0]):
+                    t1 = buffer_end
+                    t2 = min(t1 + chunk_length, endtime)
+                    if pending is not None:
+                        st = pending.get()
+                        pending = None
+                    else:
+                        st = _get_chunk(t1, t2)
+                    buffer_end = t2
+                    if pool is not None and buffer_end < endtime:
+                        pending = pool.apply_async(
+                            _get_chunk,
+                            (buffer_end, min(buffer_end + chunk_length,
+                                             endtime)))
+                    # drop data not needed anymore before adding the new
+                    # data
+                    for tr in buffer_:
+                        tr.trim(starttime=window_start - tr.stats.delta)
+                    buffer_ += st
+                    _merge(buffer_)
+                window = buffer_.slice(window_start, window_end,
+                                       nearest_sample=nearest_sample)
+                # It might happen that there is a time frame where there are
+                # no windows, e.g. two traces separated by a large gap.
+                if not window:
+                    continue
+                yield window
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    def _read_file(self, filename, starttime=None, endtime=None,
+                   sourcename=None, headonly=False, **kwargs):
+        """
+        Read data from one file of the archive.
+
+        If an index is used, only the records that are needed for the
+        requested time window are read from disk and header only reads are
+        served directly from the index.
+
+        :type filename: str
+        :param filename: Full path of file in archive.
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+        :param starttime: Start of requested time window.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+        :param endtime: End of requested time window.
+        :type sourcename: str
+        :param sourcename: SEED id (can contain wildcards) of requested data.
+        :type headonly: bool
+        :param headonly: Whether to only read the headers.
+        :param kwargs: Additional kwargs that get passed on to
+            :func:`~obspy.core.stream.read`.
+        :rtype: :class:`~obspy.core.stream.Stream`
+        """
+        if self.index is not None:
+            if headonly:
+                segments = self.index.get_segments(
+                    filename, starttime=starttime, endtime=endtime)
+                if segments is not None:
+                    return _segments_to_stream(segments, sourcename)
+            else:
+                byte_ranges = self.index.get_byte_ranges(
+                    filename, starttime=starttime, endtime=endtime)
+                if byte_ranges is not None:
+                    if not byte_ranges:
+                        return Stream()
+                    chunks = []
+                    with open(filename, "rb") as fh:
+                        for start, stop in byte_ranges:
+                            fh.seek(start, 0)
+                            chunks.append(fh.read(stop - start))
+                    with io.BytesIO(b"".join(chunks)) as buf:
+                        return read(buf, format=self.format,
+                                    starttime=starttime, endtime=endtime,
+                                    sourcename=sourcename, **kwargs)
+        return read(filename, format=self.format, starttime=starttime,
+                    endtime=endtime, sourcename=sourcename, headonly=headonly,
+                    **kwargs)
+
     def _get_filenames(self, network, station, location, channel, starttime,
                        endtime, sds_type=None):
         """
@@ -398,8 +623,8 @@ class Client(object):
                 channel=channel, time=time, sds_type=sds_type)
             if os.path.isfile(filename):
                 try:
-                    st = read(filename, format=self.format, headonly=True,
-                              sourcename=seed_pattern)
+                    st = self._read_file(filename, headonly=True,
+                                         sourcename=seed_pattern)
                 except ObsPyMSEEDFilesizeTooSmallError:
                     # just ignore small MSEED files, in use cases working with
                     # near-realtime data these are usually just being created
@@ -583,6 +808,273 @@ class Client(object):
         return sorted(result)
 
 
+class SDSIndex(object):
+    """
+    Persistent record-level index of the MiniSEED files in an SDS archive.
+
+    For every indexed file the byte offset, record length, time span, sampling
+    rate, number of samples and SEED id of each data record are stored in a
+    SQLite database. Files are (re-)indexed lazily on first access and
+    whenever their modification time or size changed. Files that only got
+    appended to (the usual case for real time archives) are indexed
+    incrementally, scanning only the newly appended records.
+
+    Usually this class is not used directly but via the ``index`` option of
+    :class:`~obspy.clients.filesystem.sds.Client`.
+
+    >>> from obspy.clients.filesystem.sds import SDSIndex
+    >>> index = SDSIndex("/path/to/index.sqlite")  # doctest: +SKIP
+
+    :type filename: str
+    :param filename: Filename of the SQLite database holding the index. It is
+        created if it does not exist yet.
+    """
+    RECORD_DTYPE = np.dtype([
+        (native_str("offset"), native_str("<i8")),
+        (native_str("record_length"), native_str("<i4")),
+        (native_str("starttime"), native_str("<i8")),
+        (native_str("endtime"), native_str("<i8")),
+        (native_str("sampling_rate"), native_str("<f8")),
+        (native_str("npts"), native_str("<i8")),
+        (native_str("id"), native_str("<u2"))])
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._lock = threading.Lock()
+        # access to the connection is serialized by the lock, so it can be
+        # shared between threads
+        self._connection = sqlite3.connect(filename, timeout=60,
+                                           check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, "
+                "indexed_size INTEGER, ids TEXT, records BLOB)")
+
+    def close(self):
+        """
+        Close the connection to the index database.
+        """
+        self._connection.close()
+
+    def get_records(self, filename):
+        """
+        Get the index of all data records in a file, updating it if needed.
+
+        :type filename: str
+        :param filename: Full path of the MiniSEED file.
+        :rtype: tuple of (:class:`numpy.ndarray`, list of str)
+        :returns: Structured array with one entry per record (see
+            :attr:`RECORD_DTYPE`) and list of SEED ids that the ``id`` field
+            of the records refers to. Start and end time of records are in
+            integer microseconds since epoch. ``(None, None)`` is returned if
+            the file does not exist.
+        """
+        key = os.path.abspath(filename)
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None, None
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT mtime, size, indexed_size, ids, records FROM files "
+                "WHERE path = ?", (key, )).fetchone()
+            if row is not None:
+                mtime, size, indexed_size, ids, records = row
+                ids = ids.split("\n") if ids else []
+                records = np.frombuffer(records, dtype=self.RECORD_DTYPE)
+                if mtime == stat.st_mtime and size == stat.st_size:
+                    return records, ids
+                # usually files only get appended to, so try to only scan the
+                # newly added data
+                if stat.st_size < size:
+                    records, ids, indexed_size = None, None, 0
+            else:
+                records, ids, indexed_size = None, None, 0
+            records, ids, indexed_size = self._scan(filename, records, ids,
+                                                    indexed_size)
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO files (path, mtime, size, "
+                    "indexed_size, ids, records) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, stat.st_mtime, stat.st_size, indexed_size,
+                     "\n".join(ids), sqlite3.Binary(records.tobytes())))
+        return records, ids
+
+    def _scan(self, filename, records=None, ids=None, indexed_size=0):
+        """
+        Scan the records in a file, optionally only the part after
+        ``indexed_size`` bytes that were scanned for a previously built
+        index.
+
+        Returns the records, the SEED ids and the number of bytes scanned.
+        """
+        start = 0
+        if records is not None and len(records):
+            # start with re-scanning last previously indexed record, to make
+            # sure the file was really only appended to
+            start = int(records[-1]["offset"])
+        with open(filename, "rb") as fh:
+            fh.seek(start, 0)
+            buffer_ = from_buffer(fh.read(), dtype=np.int8)
+        if records is not None and len(records):
+            last = _get_record_index(
+                buffer_[:int(records[-1]["record_length"])])
+            if not last or last[0][1] != records[-1]["record_length"] or \
+                    last[0][2] != records[-1]["starttime"]:
+                return self._scan(filename)
+            resume = max(indexed_size - start, 0)
+        elif records is not None:
+            # nothing but non-data records so far
+            resume = indexed_size
+        else:
+            records = np.empty(0, dtype=self.RECORD_DTYPE)
+            ids = []
+            resume = 0
+        new_records, end = _scan_records(buffer_, resume)
+        new = np.empty(len(new_records), dtype=self.RECORD_DTYPE)
+        for i, (offset_, reclen, start_, end_, samp_rate, npts, seed_id) in \
+                enumerate(new_records):
+            if seed_id not in ids:
+                ids.append(seed_id)
+            new[i] = (start + offset_, reclen, start_, end_, samp_rate, npts,
+                      ids.index(seed_id))
+        records = np.concatenate([records, new])
+        return records, ids, start + end
+
+    def _select_records(self, filename, starttime=None, endtime=None):
+        """
+        Get records of a file that contain data inside given time window.
+        """
+        records, ids = self.get_records(filename)
+        if records is None or not len(records):
+            return None, None
+        # pad by one sample to be on the safe side
+        delta = np.zeros(len(records), dtype=np.float64)
+        nonzero = records["sampling_rate"] > 0
+        delta[nonzero] = 1e6 / records["sampling_rate"][nonzero]
+        mask = np.ones(len(records), dtype=np.bool_)
+        if starttime is not None:
+            mask &= (records["endtime"] + delta >=
+                     _convert_datetime_to_mstime(starttime))
+        if endtime is not None:
+            mask &= (records["starttime"] - delta <=
+                     _convert_datetime_to_mstime(endtime))
+        return records[mask], ids
+
+    def get_byte_ranges(self, filename, starttime=None, endtime=None):
+        """
+        Get byte ranges of a file that hold data in given time window.
+
+        :type filename: str
+        :param filename: Full path of the MiniSEED file.
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+        :param starttime: Start of requested time window.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+        :param endtime: End of requested time window.
+        :rtype: list of 2-tuples of int or ``None``
+        :returns: Sorted list of ``(start, stop)`` byte offsets, adjacent
+            records are combined into one range. ``None`` is returned if the
+            file does not exist or no MiniSEED records could be indexed.
+        """
+        records, _ = self._select_records(filename, starttime, endtime)
+        if records is None:
+            return None
+        byte_ranges = []
+        for start, length in sorted(zip(records["offset"].tolist(),
+                                        records["record_length"].tolist())):
+            if byte_ranges and byte_ranges[-1][1] == start:
+                byte_ranges[-1][1] = start + length
+            else:
+                byte_ranges.append([start, start + length])
+        return [tuple(x) for x in byte_ranges]
+
+    def get_segments(self, filename, starttime=None, endtime=None):
+        """
+        Get contiguous data segments of a file in given time window.
+
+        Consecutive records of the same SEED id and sampling rate are combined
+        into one segment if they are contiguous within half a sample.
+
+        :type filename: str
+        :param filename: Full path of the MiniSEED file.
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+        :param starttime: Only use records with data after given time.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+        :param endtime: Only use records with data before given time.
+        :rtype: list of 4-tuples or ``None``
+        :returns: List of ``(seed_id, starttime, sampling_rate, npts)``
+            tuples. ``None`` is returned if the file does not exist or no
+            MiniSEED records could be indexed.
+        """
+        records, ids = self._select_records(filename, starttime, endtime)
+        if records is None:
+            return None
+        if not len(records):
+            return []
+        records = records[np.lexsort((records["starttime"], records["id"]))]
+        delta = np.zeros(len(records), dtype=np.float64)
+        nonzero = records["sampling_rate"] > 0
+        delta[nonzero] = 1e6 / records["sampling_rate"][nonzero]
+        expected = records["endtime"][:-1] + delta[:-1]
+        split = ((records["id"][1:] != records["id"][:-1]) |
+                 (records["sampling_rate"][1:] !=
+                  records["sampling_rate"][:-1]) |
+                 (np.abs(records["starttime"][1:] - expected) >
+                  0.5 * delta[:-1]))
+        starts = np.concatenate([[0], np.nonzero(split)[0] + 1])
+        npts = np.add.reduceat(records["npts"], starts)
+        segments = []
+        for i, n in zip(starts.tolist(), npts.tolist()):
+            record = records[i]
+            segments.append((
+                ids[int(record["id"])],
+                UTCDateTime(ns=int(record["starttime"]) * 1000),
+                float(record["sampling_rate"]), n))
+        return segments
+
+
+def _iter_window_times(starttime, endtime, window_length, step, offset,
+                       include_partial_windows):
+    """
+    Lazily generates the same window times as
+    :func:`~obspy.core.util.misc.get_window_times` for positive steps, without
+    building up a list of all windows for potentially very long time spans.
+    """
+    first = starttime + offset
+    end = endtime - 0.001 * step
+    i = 0
+    while True:
+        window_start = first + i * step
+        if window_start >= end:
+            break
+        window_end = min(window_start + window_length, endtime)
+        i += 1
+        if not include_partial_windows and \
+                not window_end - window_start > 0.999 * window_length:
+            continue
+        yield window_start, window_end
+
+
+def _segments_to_stream(segments, sourcename=None):
+    """
+    Convert segments as returned by :meth:`SDSIndex.get_segments` to a header
+    only :class:`~obspy.core.stream.Stream`, optionally only using segments
+    matching given (wildcarded) SEED id.
+    """
+    traces = []
+    for seed_id, starttime, sampling_rate, npts in segments:
+        if sourcename is not None and \
+                not fnmatch.fnmatch(seed_id, sourcename):
+            continue
+        network, station, location, channel = seed_id.split(".")
+        header = dict(network=network, station=station, location=location,
+                      channel=channel, starttime=starttime,
+                      sampling_rate=sampling_rate, npts=npts)
+        traces.append(Trace(header=header))
+    return Stream(traces=traces)
+
+
 def _wildcarded_except(exclude=[]):
     """
     Function factory for :mod:`re` ``repl`` functions used in :func:`re.sub``,
@@ -5,6 +5,7 @@ from future.builtins import *  # NOQA
 
 import imghdr
 import inspect
+import io
 import os
 import re
 import shutil
@@ -14,8 +15,10 @@ import unittest
 import numpy as np
 
 from obspy import UTCDateTime, Trace, Stream
-from obspy.core.util.misc import TemporaryWorkingDirectory
-from obspy.clients.filesystem.sds import SDS_FMTSTR, Client
+from obspy.core.util.misc import (TemporaryWorkingDirectory,
+                                  get_window_times)
+from obspy.clients.filesystem.sds import (SDS_FMTSTR, SDS_INDEX_FILENAME,
+                                          Client)
 from obspy.scripts.sds_html_report import main as sds_report
 
 
@@ -138,6 +141,140 @@ class SDSTestCase(unittest.TestCase):
                 st = client.get_waveforms(net, sta, loc, cha, t - 200, t + 200)
                 self.assertEqual(len(st), 1)
 
+    def test_read_from_sds_with_index(self):
+        """
+        Test reading data using the record-level index gives the same results
+        as reading without index and that the index gets updated when files
+        are appended to.
+        """
+        year, doy = 2015, 123
+        t = UTCDateTime("%d-%03dT00:00:00" % (year, doy))
+        with TemporarySDSDirectory(year=year, doy=doy) as temp_sds:
+            client = Client(temp_sds.tempdir)
+            client_index = Client(temp_sds.tempdir, index=True)
+            self.assertTrue(os.path.isfile(os.path.join(
+                temp_sds.tempdir, SDS_INDEX_FILENAME)))
+            for t1, t2 in ((t - 20, t + 20), (t - 200, t + 200),
+                           (t - 80, t - 30), (t + 20, t + 40)):
+                for seed_id in ("AB.XYZ..HHZ", "*.ZZZ3.00.BH?"):
+                    st = client.get_waveforms(*(seed_id.split(".") + [t1, t2]))
+                    st2 = client_index.get_waveforms(
+                        *(seed_id.split(".") + [t1, t2]))
+                    self.assertEqual(st, st2)
+                    self.assertEqual(
+                        client.get_availability_percentage(
+                            *(seed_id.split(".") + [t1, t2])),
+                        client_index.get_availability_percentage(
+                            *(seed_id.split(".") + [t1, t2])))
+            # append data to a file, index has to pick up the new records
+            tr = Trace(data=np.arange(2000, dtype=np.int32),
+                       header=dict(network="AB", station="XYZ", channel="HHZ",
+                                   sampling_rate=10, starttime=t + 3600))
+            filename = client._get_filename("AB", "XYZ", "", "HHZ", t)
+            with open(filename, "ab") as fh:
+                tr.write(fh, format="MSEED", reclen=512)
+            st = client_index.get_waveforms("AB", "XYZ", "", "HHZ",
+                                            t + 3610, t + 3620)
+            self.assertEqual(len(st), 1)
+            self.assertEqual(st[0].stats.starttime, t + 3610)
+            self.assertEqual(st[0].stats.endtime, t + 3620)
+            np.testing.assert_array_equal(st[0].data, np.arange(100, 201))
+            # only the records with requested data should be read
+            byte_ranges = client_index.index.get_byte_ranges(
+                filename, t + 3610, t + 3620)
+            self.assertEqual(len(byte_ranges), 1)
+            self.assertLess(byte_ranges[0][1] - byte_ranges[0][0],
+                            os.path.getsize(filename) // 2)
+            self.assertEqual(
+                client.get_availability_percentage(
+                    "AB", "XYZ", "", "HHZ", t, t + 4000),
+                client_index.get_availability_percentage(
+                    "AB", "XYZ", "", "HHZ", t, t + 4000))
+            client_index.index.close()
+
+    def test_index_skips_non_data(self):
+        """
+        Test that the index skips anything that is not a data record like
+        reading does and resumes after an incomplete record at the end.
+        """
+        year, doy = 2015, 123
+        t = UTCDateTime("%d-%03dT00:00:00" % (year, doy))
+        with TemporarySDSDirectory(year=year, doy=doy) as temp_sds:
+            client = Client(temp_sds.tempdir)
+            client_index = Client(temp_sds.tempdir, index=True)
+            filename = client._get_filename("AB", "XYZ", "", "HHZ", t)
+            records = {}
+            for i, start in enumerate((t + 3600, t + 7200)):
+                tr = Trace(data=np.arange(2000, dtype=np.int32),
+                           header=dict(network="AB", station="XYZ",
+                                       channel="HHZ", sampling_rate=10,
+                                       starttime=start))
+                buf = io.BytesIO()
+                tr.write(buf, format="MSEED", reclen=512)
+                records[i] = buf.getvalue()
+            with open(filename, "ab") as fh:
+                fh.write(b"NO MSEED" * 32)
+                fh.write(records[0])
+                fh.write(records[1][:700])
+            t1, t2 = t - 100, t + 8000
+            st = client_index.get_waveforms("AB", "XYZ", "", "HHZ", t1, t2)
+            expected = client.get_waveforms("AB", "XYZ", "", "HHZ", t1, t2)
+            # only the size of the file read differs
+            for tr in st + expected:
+                tr.stats.mseed.pop("filesize")
+            self.assertEqual(st, expected)
+            # records after the garbage were read
+            self.assertIn(t + 3600, [tr.stats.starttime for tr in st])
+            # complete the last record and append the rest
+            with open(filename, "ab") as fh:
+                fh.write(records[1][700:])
+            st = client_index.get_waveforms("AB", "XYZ", "", "HHZ", t1, t2)
+            expected = client.get_waveforms("AB", "XYZ", "", "HHZ", t1, t2)
+            # only the size of the file read differs
+            for tr in st + expected:
+                tr.stats.mseed.pop("filesize")
+            self.assertEqual(st, expected)
+            self.assertEqual(st[-1].stats.endtime, t + 7200 + 199.9)
+            client_index.index.close()
+
+    def test_slide(self):
+        """
+        Test sliding window generator of SDS client against slicing windows
+        out of the fully read data.
+        """
+        year, doy = 2015, 123
+        t = UTCDateTime("%d-%03dT00:00:00" % (year, doy))
+        t1, t2 = t - 400, t + 800
+        with TemporarySDSDirectory(year=year, doy=doy) as temp_sds:
+            client = Client(temp_sds.tempdir)
+            full = client.get_waveforms("AB", "XYZ", "*", "HH?", t1, t2)
+            for kwargs in (dict(window_length=100, step=50),
+                           dict(window_length=100, step=100, offset=5),
+                           dict(window_length=30, step=70,
+                                include_partial_windows=True)):
+                expected = [
+                    full.slice(*times) for times in get_window_times(
+                        t1, t2, offset=kwargs.get("offset", 0),
+                        include_partial_windows=kwargs.get(
+                            "include_partial_windows", False),
+                        window_length=kwargs["window_length"],
+                        step=kwargs["step"])]
+                expected = [st for st in expected if st]
+                for chunk_length, prefetch in ((10, True), (120, False),
+                                               (5000, True)):
+                    got = list(client.slide(
+                        "AB", "XYZ", "*", "HH?", t1, t2,
+                        chunk_length=chunk_length, prefetch=prefetch,
+                        **kwargs))
+                    self.assertEqual(len(got), len(expected))
+                    for st, st2 in zip(got, expected):
+                        self.assertEqual(len(st), len(st2))
+                        for tr, tr2 in zip(st, st2):
+                            self.assertEqual(tr.id, tr2.id)
+                            self.assertEqual(tr.stats.starttime,
+                                             tr2.stats.starttime)
+                            np.testing.assert_array_equal(tr.data, tr2.data)
+
     def test_read_from_sds_with_wildcarded_seed_ids(self):
         """
         Test reading data with wildcarded SEED IDs.
@@ -154,6 +291,10 @@ class SDSTestCase(unittest.TestCase):
                 net, sta, loc, cha = wildcarded_seed_id.split(".")
                 st = client.get_waveforms(net, sta, loc, cha, t - 200, t + 200)
                 self.assertEqual(len(st), num_matching_ids)
+                # reading files concurrently gives the same result
+                st2 = client.get_waveforms(net, sta, loc, cha, t - 200,
+                                           t + 200, workers=4)
+                self.assertEqual(st, st2)
             # test with SDS type wildcards
             for type_wildcard in ("*", "?"):
                 net, sta, loc, cha = wildcarded_seed_id.split(".")
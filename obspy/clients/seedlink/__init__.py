@@ -11,7 +11,9 @@ For simple requests of finite time windows see
 data streams see
 :class:`~obspy.clients.seedlink.easyseedlink.EasySeedLinkClient`, or for
 lower-level packet handling see
-:class:`~obspy.clients.seedlink.slclient.SLClient`.
+:class:`~obspy.clients.seedlink.slclient.SLClient`. To receive data from many
+servers in a single :mod:`asyncio` event loop see
+:class:`~obspy.clients.seedlink.async_client.AsyncSeedLinkClient`.
 
 :copyright:
     The ObsPy Development Team (devs@obspy.org) & Anthony Lomax
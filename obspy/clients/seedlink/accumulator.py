@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Batched decoding of SeedLink packets.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import io
+import logging
+import time
+
+from obspy import Stream, read
+from .seedlinkexception import SeedLinkException
+from .slpacket import SLPacket
+
+
+# default logger
+logger = logging.getLogger('obspy.clients.seedlink')
+
+
+class PacketAccumulator(object):
+    """
+    Collects SeedLink packets and decodes them in batches.
+
+    Decoding the MiniSEED record of every SeedLink packet on its own has a
+    considerable overhead per packet and results in many tiny traces. This
+    class copies the records of incoming data packets into a preallocated
+    contiguous buffer and decodes all of them at once, when the buffer is
+    full or when ``flush_interval`` seconds have passed since the first
+    packet was buffered. Contiguous records of each stream are merged into a
+    single trace by the decoding.
+
+    >>> from obspy.clients.seedlink.accumulator import PacketAccumulator
+    >>> accumulator = PacketAccumulator(flush_interval=1.0, max_packets=100)
+    >>> for packet in packets:  # doctest: +SKIP
+    ...     for trace in accumulator.add(packet):
+    ...         print(trace)
+
+    :type flush_interval: float
+    :param flush_interval: Maximum time in seconds to keep packets before
+        decoding them.
+    :type max_packets: int
+    :param max_packets: Maximum number of packets to keep before decoding
+        them.
+    """
+    def __init__(self, flush_interval=1.0, max_packets=1000):
+        self.flush_interval = flush_interval
+        self.max_packets = max_packets
+        self._buffer = bytearray(max_packets * SLPacket.SLRECSIZE)
+        self._count = 0
+        self._first_time = None
+
+    def __len__(self):
+        return self._count
+
+    def add(self, packet):
+        """
+        Add a packet and return the traces decoded if the buffer was flushed.
+
+        ``INFO`` packets are ignored.
+
+        :type packet: :class:`~obspy.clients.seedlink.slpacket.SLPacket`
+        :param packet: The received packet.
+        :rtype: :class:`~obspy.core.stream.Stream`
+        """
+        if packet.slhead.startswith(SLPacket.INFOSIGNATURE):
+            return Stream()
+        if self._count == 0:
+            self._first_time = time.time()
+        offset = self._count * SLPacket.SLRECSIZE
+        self._buffer[offset:offset + SLPacket.SLRECSIZE] = packet.msrecord
+        self._count += 1
+        if self._count >= self.max_packets or self.due():
+            return self.flush()
+        return Stream()
+
+    def due(self):
+        """
+        Whether the buffered packets are older than the flush interval.
+
+        :rtype: bool
+        """
+        return self._count > 0 and \
+            time.time() - self._first_time >= self.flush_interval
+
+    def flush(self):
+        """
+        Decode and remove all buffered packets.
+
+        :rtype: :class:`~obspy.core.stream.Stream`
+        :returns: The decoded traces, contiguous records of each stream
+            merged into one trace.
+        """
+        if self._count == 0:
+            return Stream()
+        data = bytes(self._buffer[:self._count * SLPacket.SLRECSIZE])
+        self._count = 0
+        self._first_time = None
+        try:
+            return read(io.BytesIO(data), format='MSEED')
+        except Exception:
+            # Some record is broken, fall back to decoding one by one.
+            pass
+        st = Stream()
+        for offset in range(0, len(data), SLPacket.SLRECSIZE):
+            packet = SLPacket()
+            packet.msrecord = data[offset:offset + SLPacket.SLRECSIZE]
+            packet.trace = None
+            try:
+                st.append(packet.get_trace())
+            except SeedLinkException as e:
+                logger.error("bad packet: %s" % e)
+        return st
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
@@ -0,0 +1,506 @@
+# -*- coding: utf-8 -*-
+"""
+An asynchronous SeedLink client based on :mod:`asyncio`.
+
+The :class:`~.AsyncSeedLinkClient` receives data from any number of SeedLink
+servers (with any number of selected streams per server) in a single
+:mod:`asyncio` event loop and yields the decoded traces through an
+asynchronous iterator:
+
+.. code-block:: python
+
+    import asyncio
+    from obspy.clients.seedlink.async_client import AsyncSeedLinkClient
+
+    client = AsyncSeedLinkClient()
+    client.select_stream('geofon.gfz-potsdam.de', 'GE', 'APE', 'BH?')
+    client.select_stream('rtserve.iris.washington.edu:18000', 'IU', 'ANMO',
+                         'BHZ')
+
+    async def main():
+        async for trace in client:
+            print(trace)
+
+    asyncio.get_event_loop().run_until_complete(main())
+
+Received traces are buffered until they are consumed. If the buffer is full,
+reading from all connections is paused until the consumer caught up, so that
+a slow consumer throttles the servers (via TCP flow control) instead of
+letting the buffer grow without bounds.
+
+Lost connections are reestablished automatically, resuming each station at
+the packet after the last one received.
+
+For high packet rates, packets can be decoded in batches (see
+:class:`~obspy.clients.seedlink.accumulator.PacketAccumulator`) by specifying
+a ``flush_interval``. The client then yields merged traces of all packets of
+a stream received within that interval instead of one trace per packet.
+
+.. note::
+
+    This module requires Python 3.5 or higher.
+
+.. rubric:: Limitations
+
+Only multi-station mode is supported. Neither ``INFO`` requests nor time
+windows (``TIME`` command) are supported.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+from future.utils import native_str
+
+import collections
+import logging
+import sys
+
+try:
+    import asyncio
+except ImportError:  # Python 2
+    asyncio = None
+
+if sys.version_info.major == 2:
+    from urlparse import urlparse
+else:
+    from urllib.parse import urlparse
+
+from .accumulator import PacketAccumulator
+from .seedlinkexception import SeedLinkException
+from .slpacket import SLPacket
+
+
+# default logger
+logger = logging.getLogger('obspy.clients.seedlink')
+
+
+class AsyncSeedLinkClient(object):
+    """
+    An asynchronous SeedLink client for many servers and streams.
+
+    Streams are selected with :meth:`select_stream`, the connections are
+    established when iterating over the client (or when calling
+    :meth:`start`) in a running event loop.
+
+    :type max_buffered_traces: int
+    :param max_buffered_traces: Maximum number of received but not yet
+        consumed traces. If reached, reading from the servers is paused.
+    :type network_timeout: float
+    :param network_timeout: Reconnect if no data was received for this many
+        seconds (while not paused by a full buffer). ``0`` disables the
+        timeout.
+    :type reconnect_delay: float
+    :param reconnect_delay: Delay in seconds before reconnecting after a
+        connection was lost or could not be established.
+    :type flush_interval: float
+    :param flush_interval: If given, packets are decoded in batches and
+        merged traces are yielded every ``flush_interval`` seconds.
+    :type loop: :class:`asyncio.AbstractEventLoop`
+    :param loop: The event loop to use. Defaults to the current event loop
+        when the client is started.
+    """
+    def __init__(self, max_buffered_traces=1000, network_timeout=120.0,
+                 reconnect_delay=30.0, flush_interval=None, loop=None):
+        if asyncio is None:
+            msg = "AsyncSeedLinkClient requires Python 3.5 or higher."
+            raise NotImplementedError(msg)
+        self.max_buffered_traces = max_buffered_traces
+        self.network_timeout = network_timeout
+        self.reconnect_delay = reconnect_delay
+        self._loop = loop
+        if flush_interval is None:
+            self._accumulator = None
+        else:
+            self._accumulator = PacketAccumulator(flush_interval)
+        self._flush_handle = None
+        # (host, port) -> {(network, station): [selectors, last seqnum]}
+        self._servers = collections.OrderedDict()
+        self._connections = {}
+        self._reconnect_handles = {}
+        self._traces = collections.deque()
+        self._waiters = collections.deque()
+        self._paused = False
+        self._started = False
+        self._closed = False
+
+    def select_stream(self, server_url, net, station, selector=None):
+        """
+        Select a stream for data transfer.
+
+        Can be called as often as needed for any number of servers, but only
+        before the client is started.
+
+        :type server_url: str
+        :param server_url: The SeedLink server URL, e.g.
+            ``'geofon.gfz-potsdam.de'`` or ``'seedlink://localhost:18000'``.
+        :type net: str
+        :param net: The network code
+        :type station: str
+        :param station: The station code
+        :type selector: str
+        :param selector: SeedLink selector(s), e.g. ``'BHZ'`` or
+            ``'00BH? 10HH?'``. All streams of the station if not given.
+        """
+        if self._started:
+            msg = ('Adding streams is not supported after the client has '
+                   'been started.')
+            raise SeedLinkException(msg)
+        server = _parse_server_url(server_url)
+        stations = self._servers.setdefault(server,
+                                            collections.OrderedDict())
+        selectors, _ = stations.setdefault((net, station), [[], -1])
+        if selector:
+            selectors.extend(selector.split())
+
+    def start(self):
+        """
+        Connect to all servers.
+
+        Called automatically when iterating over the client.
+        """
+        if self._started:
+            return
+        if not self._servers:
+            msg = ('No streams specified. Use select_stream() to select a '
+                   'stream.')
+            raise SeedLinkException(msg)
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        self._started = True
+        for server in self._servers:
+            self._connect(server)
+        if self._accumulator is not None:
+            self._flush_handle = self._loop.call_later(
+                self._accumulator.flush_interval, self._flush)
+
+    def close(self):
+        """
+        Close all connections.
+
+        Traces already received can still be consumed, after that the
+        iteration stops.
+        """
+        self._closed = True
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._accumulator is not None:
+            for trace in self._accumulator.flush():
+                self._put(trace)
+        for handle in self._reconnect_handles.values():
+            handle.cancel()
+        self._reconnect_handles.clear()
+        for protocol in list(self._connections.values()):
+            if protocol.transport is not None:
+                protocol.transport.close()
+        self._connections.clear()
+        if not self._traces:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if not waiter.done():
+                    waiter.set_exception(StopAsyncIteration())
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        self.start()
+        future = self._loop.create_future()
+        if self._traces:
+            future.set_result(self._traces.popleft())
+            if self._paused and \
+                    len(self._traces) <= self.max_buffered_traces // 2:
+                self._resume_reading()
+        elif self._closed:
+            future.set_exception(StopAsyncIteration())
+        else:
+            self._waiters.append(future)
+        return future
+
+    def _put(self, trace):
+        """
+        Hand a received trace to a waiting consumer or buffer it.
+        """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(trace)
+                return
+        self._traces.append(trace)
+        if not self._paused and \
+                len(self._traces) >= self.max_buffered_traces:
+            self._paused = True
+            for protocol in self._connections.values():
+                protocol.pause_reading()
+
+    def _add_packet(self, packet):
+        """
+        Decode a received packet or hand it to the accumulator.
+        """
+        if self._accumulator is None:
+            try:
+                traces = [packet.get_trace()]
+            except SeedLinkException as e:
+                logger.error("bad packet: %s" % e)
+                return
+        else:
+            traces = self._accumulator.add(packet)
+        for trace in traces:
+            self._put(trace)
+
+    def _flush(self):
+        """
+        Periodically decode accumulated packets.
+        """
+        if self._accumulator.due():
+            for trace in self._accumulator.flush():
+                self._put(trace)
+        self._flush_handle = self._loop.call_later(
+            self._accumulator.flush_interval, self._flush)
+
+    def _resume_reading(self):
+        self._paused = False
+        for protocol in list(self._connections.values()):
+            protocol.resume_reading()
+            # a protocol might fill up the buffer again right away
+            if self._paused:
+                break
+
+    def _connect(self, server):
+        self._reconnect_handles.pop(server, None)
+        host, port = server
+        protocol = _SeedLinkProtocol(self, server, self._servers[server])
+        task = self._loop.create_task(
+            self._loop.create_connection(lambda: protocol, host, port))
+
+        def connected(task):
+            if task.cancelled():
+                return
+            exc = task.exception()
+            if exc is not None:
+                msg = "connection to %s:%d failed: %s"
+                logger.error(msg % (host, port, exc))
+                self._schedule_reconnect(server)
+            elif self._closed:
+                protocol.transport.close()
+
+        task.add_done_callback(connected)
+
+    def _connection_made(self, protocol):
+        self._connections[protocol.server] = protocol
+        if self._paused:
+            protocol.pause_reading()
+
+    def _connection_lost(self, protocol, exc):
+        if self._connections.get(protocol.server) is protocol:
+            del self._connections[protocol.server]
+        if not self._closed:
+            msg = "connection to %s:%d lost (%s)"
+            logger.warning(msg % (protocol.server[0], protocol.server[1],
+                                  exc or "closed by server"))
+            self._schedule_reconnect(protocol.server)
+
+    def _schedule_reconnect(self, server):
+        if self._closed:
+            return
+        msg = "reconnecting to %s:%d in %s seconds"
+        logger.info(msg % (server[0], server[1], self.reconnect_delay))
+        self._reconnect_handles[server] = self._loop.call_later(
+            self.reconnect_delay, self._connect, server)
+
+
+class _SeedLinkProtocol(object):
+    """
+    :mod:`asyncio` protocol handling a single SeedLink connection.
+
+    All commands are sent at once after connecting, the responses are then
+    checked in order before switching to reading data packets.
+    """
+    PACKET_SIZE = SLPacket.SLHEADSIZE + SLPacket.SLRECSIZE
+
+    def __init__(self, client, server, stations):
+        self.client = client
+        self.server = server
+        self.stations = stations
+        self.transport = None
+        self._buffer = bytearray()
+        self._expected_responses = collections.deque()
+        self._paused = False
+        self._last_data_time = None
+        self._timeout_handle = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self._last_data_time = self.client._loop.time()
+        if self.client.network_timeout:
+            self._timeout_handle = self.client._loop.call_later(
+                self.client.network_timeout, self._check_timeout)
+
+        commands = [b"HELLO\r"]
+        # HELLO is answered with two lines
+        self._expected_responses.extend([("HELLO", None)] * 2)
+        for (net, station), (selectors, seqnum) in self.stations.items():
+            commands.append(
+                ("STATION %s %s\r" % (station, net)).encode('ascii'))
+            self._expected_responses.append(("STATION", (net, station)))
+            for selector in selectors:
+                commands.append(("SELECT %s\r" % selector).encode('ascii'))
+                self._expected_responses.append(("SELECT", selector))
+            if seqnum >= 0:
+                # resume at the packet after the last one received
+                commands.append(("DATA %06X\r" %
+                                 ((seqnum + 1) % 0x1000000)).encode('ascii'))
+            else:
+                commands.append(b"DATA\r")
+            self._expected_responses.append(("DATA", (net, station)))
+        # no response to END, the server starts sending data
+        commands.append(b"END\r")
+        transport.write(b"".join(commands))
+        self.client._connection_made(self)
+
+    def connection_lost(self, exc):
+        if self._timeout_handle is not None:
+            self._timeout_handle.cancel()
+            self._timeout_handle = None
+        self.client._connection_lost(self, exc)
+
+    def eof_received(self):
+        # let the transport close itself
+        return False
+
+    def pause_writing(self):
+        pass
+
+    def resume_writing(self):
+        pass
+
+    def pause_reading(self):
+        if not self._paused:
+            self._paused = True
+            self.transport.pause_reading()
+
+    def resume_reading(self):
+        if self._paused:
+            self._paused = False
+            self._last_data_time = self.client._loop.time()
+            # handle packets left over when being paused
+            self._read_packets()
+            if not self._paused and not self.transport.is_closing():
+                self.transport.resume_reading()
+
+    def data_received(self, data):
+        self._last_data_time = self.client._loop.time()
+        self._buffer.extend(data)
+        while self._expected_responses:
+            index = self._buffer.find(b"\r\n")
+            if index < 0:
+                return
+            line = bytes(self._buffer[:index])
+            del self._buffer[:index + 2]
+            self._handle_response(line)
+        self._read_packets()
+
+    def _handle_response(self, line):
+        command, argument = self._expected_responses.popleft()
+        line = line.decode('ascii', 'replace')
+        host, port = self.server
+        if command == "HELLO":
+            logger.debug("%s:%d: %s" % (host, port, line))
+        elif line == "ERROR":
+            if command == "SELECT":
+                msg = "%s:%d: selector %s not accepted" % (
+                    host, port, argument)
+            else:
+                msg = "%s:%d: %s command for station %s not accepted" % (
+                    host, port, command, ".".join(argument))
+            logger.error(msg)
+        elif line != "OK":
+            msg = "%s:%d: invalid response to %s command: %s"
+            logger.error(msg % (host, port, command, line))
+            self.transport.close()
+
+    def _read_packets(self):
+        buffer_ = self._buffer
+        offset = 0
+        while not self._paused:
+            remaining = len(buffer_) - offset
+            if remaining >= len(SLPacket.SIGNATURE) and \
+                    buffer_[offset:offset + 2] != SLPacket.SIGNATURE:
+                response = bytes(buffer_[offset:offset + 10])
+                if response.startswith(SLPacket.ENDSIGNATURE):
+                    msg = "%s:%d: end of data"
+                    logger.info(msg % self.server)
+                elif response.startswith(SLPacket.ERRORSIGNATURE[:5]):
+                    msg = "%s:%d: server reported an error"
+                    logger.error(msg % self.server)
+                else:
+                    msg = "%s:%d: invalid data received: %r"
+                    logger.error(msg % (self.server + (response,)))
+                offset = len(buffer_)
+                self.transport.close()
+                break
+            if remaining < self.PACKET_SIZE:
+                break
+            packet = SLPacket(buffer_, offset)
+            offset += self.PACKET_SIZE
+            if packet.slhead.startswith(SLPacket.INFOSIGNATURE):
+                # no INFO requests are sent, so these are unexpected
+                continue
+            # station and network code from the fixed section of data header
+            msrecord = packet.msrecord
+            station = self.stations.get((
+                msrecord[18:20].decode('ascii', 'replace').strip(),
+                msrecord[8:13].decode('ascii', 'replace').strip()))
+            seqnum = packet.get_sequence_number()
+            if station is not None and seqnum >= 0:
+                station[1] = seqnum
+            self.client._add_packet(packet)
+            if self.client._paused:
+                self.pause_reading()
+        del buffer_[:offset]
+
+    def _check_timeout(self):
+        now = self.client._loop.time()
+        if self._paused:
+            self._last_data_time = now
+        elif now - self._last_data_time >= self.client.network_timeout:
+            msg = "%s:%d: network timeout (%s seconds), reconnecting"
+            logger.warning(msg % (self.server + (
+                self.client.network_timeout,)))
+            self.transport.abort()
+            return
+        self._timeout_handle = self.client._loop.call_later(
+            self.client.network_timeout, self._check_timeout)
+
+
+def _parse_server_url(server_url):
+    """
+    Return host and port of a SeedLink server URL.
+
+    >>> print(*_parse_server_url('geofon.gfz-potsdam.de'))
+    geofon.gfz-potsdam.de 18000
+    >>> print(*_parse_server_url('seedlink://localhost:18001'))
+    localhost 18001
+    """
+    if not isinstance(server_url, (str, native_str)):
+        raise ValueError('Expected string for SeedLink server URL')
+    if '://' not in server_url and not server_url.startswith('//'):
+        server_url = '//' + server_url
+    parsed_url = urlparse(server_url, scheme='seedlink')
+    if not parsed_url.scheme == 'seedlink':
+        msg = 'Unsupported scheme %s (expected "seedlink")' % \
+            parsed_url.scheme
+        raise SeedLinkException(msg)
+    if not parsed_url.hostname:
+        raise SeedLinkException('No host name provided')
+    return parsed_url.hostname, parsed_url.port or 18000
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
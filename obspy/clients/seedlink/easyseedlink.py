@@ -66,6 +66,7 @@ else:
 
 import lxml
 
+from .accumulator import PacketAccumulator
 from .client.seedlinkconnection import SeedLinkConnection
 from .client.slstate import SLState
 from .slpacket import SLPacket
@@ -122,6 +123,15 @@ class EasySeedLinkClient(object):
     :type autoconnect: bool
     :param autoconnect: Connect to the server when the client object is
                         created; default is True.
+    :type flush_interval: float
+    :param flush_interval: If given, received packets are collected and
+        decoded in batches (see
+        :class:`~obspy.clients.seedlink.accumulator.PacketAccumulator`).
+        :meth:`~.EasySeedLinkClient.on_data` is then called with merged
+        traces of all packets of a stream received in the given number of
+        seconds (checked when packets arrive) instead of once per packet,
+        which greatly reduces the processing overhead for high packet
+        rates.
 
     .. warning::
 
@@ -133,7 +143,7 @@ class EasySeedLinkClient(object):
         timeout, ...). This might be intended behavior in some situations.
     """
 
-    def __init__(self, server_url, autoconnect=True):
+    def __init__(self, server_url, autoconnect=True, flush_interval=None):
         # Catch invalid server_url parameters
         if not isinstance(server_url, (str, native_str)):
             raise ValueError('Expected string for SeedLink server URL')
@@ -170,6 +180,11 @@ class EasySeedLinkClient(object):
 
         self.__capabilities = None
 
+        if flush_interval is None:
+            self.__accumulator = None
+        else:
+            self.__accumulator = PacketAccumulator(flush_interval)
+
     def connect(self):
         """
         Connect to the SeedLink server.
@@ -405,6 +420,9 @@ class EasySeedLinkClient(object):
             data = self.conn.collect()
 
             if data == SLPacket.SLTERMINATE:
+                if self.__accumulator is not None:
+                    for trace in self.__accumulator.flush():
+                        self.on_data(trace)
                 self.on_terminate()
                 break
             elif data == SLPacket.SLERROR:
@@ -416,6 +434,12 @@ class EasySeedLinkClient(object):
             #     there is no way that self.conn.collect() can ever return None
             assert(isinstance(data, SLPacket))
 
+            if self.__accumulator is not None:
+                # Decode in batches, INFO packets are skipped
+                for trace in self.__accumulator.add(data):
+                    self.on_data(trace)
+                continue
+
             packet_type = data.get_type()
 
             # Ignore in-stream INFO packets (not supported)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+The obspy.clients.seedlink.accumulator test suite.
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import io
+import unittest
+
+import numpy as np
+
+from obspy import Trace, UTCDateTime
+from obspy.clients.seedlink.accumulator import PacketAccumulator
+from obspy.clients.seedlink.slpacket import SLPacket
+
+
+class PacketAccumulatorTestCase(unittest.TestCase):
+    def setUp(self):
+        # interleaved packets of two stations
+        self.traces = []
+        records = []
+        for station in ('AAA', 'BBB'):
+            tr = Trace(data=np.arange(5000, dtype=np.int32),
+                       header={'network': 'XX', 'station': station,
+                               'channel': 'BHZ', 'sampling_rate': 20,
+                               'starttime': UTCDateTime(2018, 1, 1)})
+            buf = io.BytesIO()
+            tr.write(buf, format='MSEED', reclen=512, encoding='INT32')
+            data = buf.getvalue()
+            records.append([data[i:i + 512]
+                            for i in range(0, len(data), 512)])
+            self.traces.append(tr)
+        self.packets = [
+            SLPacket(("SL%06X" % i).encode('ascii') + record, 0)
+            for i, record in enumerate(
+                r for pair in zip(*records) for r in pair)]
+
+    def test_merged_traces(self):
+        """
+        Contiguous packets of each stream are decoded into one trace.
+        """
+        accumulator = PacketAccumulator(flush_interval=3600,
+                                        max_packets=1000)
+        for packet in self.packets:
+            self.assertEqual(len(accumulator.add(packet)), 0)
+        self.assertEqual(len(accumulator), len(self.packets))
+        self.assertFalse(accumulator.due())
+        st = accumulator.flush()
+        self.assertEqual(len(accumulator), 0)
+        self.assertEqual(len(st), 2)
+        for tr, expected in zip(sorted(st, key=lambda tr: tr.id),
+                                self.traces):
+            self.assertEqual(tr.id, expected.id)
+            self.assertEqual(tr.stats.starttime, expected.stats.starttime)
+            np.testing.assert_array_equal(tr.data, expected.data)
+        self.assertEqual(len(accumulator.flush()), 0)
+
+    def test_flush_when_full_or_due(self):
+        """
+        Packets are decoded when the buffer is full or the interval passed.
+        """
+        accumulator = PacketAccumulator(flush_interval=3600, max_packets=4)
+        results = [len(accumulator.add(packet))
+                   for packet in self.packets[:8]]
+        # two stations, so two traces each time four packets are decoded
+        self.assertEqual(results, [0, 0, 0, 2, 0, 0, 0, 2])
+        accumulator = PacketAccumulator(flush_interval=0, max_packets=4)
+        self.assertEqual(len(accumulator.add(self.packets[0])), 1)
+        # INFO packets are ignored
+        info = SLPacket(b"SLINFO  " + b"\x00" * 512, 0)
+        self.assertEqual(len(accumulator.add(info)), 0)
+        self.assertEqual(len(accumulator), 0)
+
+    def test_broken_record(self):
+        """
+        Broken records are skipped, all others are still decoded.
+        """
+        accumulator = PacketAccumulator(flush_interval=3600,
+                                        max_packets=1000)
+        broken = SLPacket(b"SL000000" + b"\x00" * 512, 0)
+        for packet in self.packets[:2] + [broken] + self.packets[2:4]:
+            accumulator.add(packet)
+        st = accumulator.flush()
+        self.assertEqual(sum(tr.stats.npts for tr in st),
+                         sum(p.get_trace().stats.npts
+                             for p in self.packets[:4]))
+
+
+def suite():
+    return unittest.makeSuite(PacketAccumulatorTestCase, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
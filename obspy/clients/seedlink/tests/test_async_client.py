@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+The obspy.clients.seedlink.async_client test suite.
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import io
+import sys
+import unittest
+
+import numpy as np
+
+from obspy import Trace, UTCDateTime
+from obspy.clients.seedlink.async_client import AsyncSeedLinkClient
+
+if sys.version_info >= (3, 5):
+    import asyncio
+
+
+def _make_records(network, station, count):
+    """
+    Return a list of 512 byte MiniSEED records with 100 samples each.
+    """
+    records = []
+    for i in range(count):
+        tr = Trace(data=np.arange(100, dtype=np.int32) + i,
+                   header={'network': network, 'station': station,
+                           'channel': 'BHZ', 'sampling_rate': 1.0,
+                           'starttime': UTCDateTime(2018, 1, 1) + 100 * i})
+        buf = io.BytesIO()
+        tr.write(buf, format='MSEED', reclen=512)
+        records.append(buf.getvalue())
+    return records
+
+
+class _FakeSeedLinkServer(object):
+    """
+    Protocol of a minimal SeedLink server sending a fixed list of records.
+
+    Closes the connection after sending ``close_after`` packets.
+    """
+    def __init__(self, records, commands, close_after=None):
+        self.records = records
+        self.commands = commands
+        self.close_after = close_after
+        self.transport = None
+        self.buffer = b""
+        self.start = 0
+
+    def __call__(self):
+        return self
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.buffer = b""
+
+    def data_received(self, data):
+        self.buffer += data
+        while b"\r" in self.buffer:
+            command, self.buffer = self.buffer.split(b"\r", 1)
+            self.commands.append(command)
+            if command == b"HELLO":
+                self.transport.write(b"SeedLink v3.1 (fake)\r\nObsPy\r\n")
+            elif command.startswith(b"DATA "):
+                self.start = int(command.split()[1], 16)
+                self.transport.write(b"OK\r\n")
+            elif command == b"END":
+                self.send_records()
+            elif command.startswith(b"SELECT BAD"):
+                self.transport.write(b"ERROR\r\n")
+            else:
+                self.transport.write(b"OK\r\n")
+
+    def send_records(self):
+        stop = len(self.records)
+        if self.close_after is not None:
+            stop = min(stop, self.start + self.close_after)
+        for seqnum in range(self.start, stop):
+            self.transport.write(("SL%06X" % seqnum).encode('ascii') +
+                                 self.records[seqnum])
+        if stop < len(self.records):
+            self.transport.close()
+
+    def connection_lost(self, exc):
+        pass
+
+    def eof_received(self):
+        pass
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'test needs Python >= 3.5')
+class AsyncSeedLinkClientTestCase(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.servers = []
+
+    def tearDown(self):
+        for server in self.servers:
+            server.close()
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.loop.close()
+
+    def _start_server(self, protocol):
+        server = self.loop.run_until_complete(
+            self.loop.create_server(protocol, '127.0.0.1', 0))
+        self.servers.append(server)
+        return 'seedlink://127.0.0.1:%d' % server.sockets[0].getsockname()[1]
+
+    def _next(self, client):
+        return self.loop.run_until_complete(
+            asyncio.wait_for(client.__anext__(), 5))
+
+    def test_multiple_servers(self):
+        """
+        Traces from several servers are received in one event loop.
+        """
+        commands_1 = []
+        commands_2 = []
+        url_1 = self._start_server(
+            _FakeSeedLinkServer(_make_records('XX', 'AAA', 3), commands_1))
+        url_2 = self._start_server(
+            _FakeSeedLinkServer(_make_records('YY', 'BBB', 4), commands_2))
+        client = AsyncSeedLinkClient(loop=self.loop)
+        client.select_stream(url_1, 'XX', 'AAA', 'BHZ BAD')
+        client.select_stream(url_2, 'YY', 'BBB')
+        traces = [self._next(client) for _ in range(7)]
+        self.assertEqual(
+            sorted((tr.id, tr.stats.starttime) for tr in traces),
+            [('XX.AAA..BHZ', UTCDateTime(2018, 1, 1) + 100 * i)
+             for i in range(3)] +
+            [('YY.BBB..BHZ', UTCDateTime(2018, 1, 1) + 100 * i)
+             for i in range(4)])
+        for tr in traces:
+            i = int(tr.stats.starttime - UTCDateTime(2018, 1, 1)) // 100
+            np.testing.assert_array_equal(tr.data, np.arange(100) + i)
+        # all commands are sent at once, the rejected selector is skipped
+        self.assertEqual(commands_1, [b"HELLO", b"STATION AAA XX",
+                                      b"SELECT BHZ", b"SELECT BAD", b"DATA",
+                                      b"END"])
+        self.assertEqual(commands_2, [b"HELLO", b"STATION BBB YY", b"DATA",
+                                      b"END"])
+        # iteration stops after closing the client
+        client.close()
+        with self.assertRaises(StopAsyncIteration):
+            self._next(client)
+
+    def test_batched_decoding(self):
+        """
+        Packets are decoded in batches into merged traces.
+        """
+        url = self._start_server(
+            _FakeSeedLinkServer(_make_records('XX', 'AAA', 10), []))
+        client = AsyncSeedLinkClient(flush_interval=0.1, loop=self.loop)
+        client.select_stream(url, 'XX', 'AAA')
+        tr = self._next(client)
+        self.assertEqual(tr.stats.starttime, UTCDateTime(2018, 1, 1))
+        self.assertEqual(tr.stats.npts, 1000)
+        client.close()
+
+    def test_backpressure(self):
+        """
+        Reading is paused while the buffer of received traces is full.
+        """
+        url = self._start_server(
+            _FakeSeedLinkServer(_make_records('XX', 'AAA', 10), []))
+        client = AsyncSeedLinkClient(max_buffered_traces=4, loop=self.loop)
+        client.select_stream(url, 'XX', 'AAA')
+        client.start()
+        self.loop.run_until_complete(asyncio.sleep(0.2))
+        self.assertEqual(len(client._traces), 4)
+        self.assertTrue(client._paused)
+        starttimes = [self._next(client).stats.starttime for _ in range(10)]
+        self.assertEqual(starttimes, [UTCDateTime(2018, 1, 1) + 100 * i
+                                      for i in range(10)])
+        self.assertFalse(client._paused)
+        client.close()
+
+    def test_resume_after_reconnect(self):
+        """
+        After a lost connection data is requested from the next packet on.
+        """
+        commands = []
+        url = self._start_server(_FakeSeedLinkServer(
+            _make_records('XX', 'AAA', 5), commands, close_after=3))
+        client = AsyncSeedLinkClient(reconnect_delay=0, loop=self.loop)
+        client.select_stream(url, 'XX', 'AAA')
+        starttimes = [self._next(client).stats.starttime for _ in range(5)]
+        self.assertEqual(starttimes, [UTCDateTime(2018, 1, 1) + 100 * i
+                                      for i in range(5)])
+        self.assertIn(b"DATA 000003", commands)
+        client.close()
+
+
+def suite():
+    return unittest.makeSuite(AsyncSeedLinkClientTestCase, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
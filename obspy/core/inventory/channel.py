@@ -16,7 +16,8 @@ from future.utils import python_2_unicode_compatible
 
 from obspy.core.util.obspy_types import FloatWithUncertainties
 from . import BaseNode
-from .util import Azimuth, ClockDrift, Dip, Distance, Latitude, Longitude
+from .util import (Azimuth, ClockDrift, Dip, Distance, Latitude, Longitude,
+                   _structure_changed)
 
 
 @python_2_unicode_compatible
@@ -198,6 +199,42 @@ class Channel(BaseNode):
     def _repr_pretty_(self, p, cycle):
         p.text(str(self))
 
+    def __eq__(self, other):
+        # make sure lazily loaded responses are compared by content
+        if isinstance(other, self.__class__):
+            self.response
+            other.response
+        return super(Channel, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    @property
+    def response(self):
+        loader = self.__dict__.get("_response_loader")
+        if loader is not None:
+            self._response = loader()
+            self._response_loader = None
+        return self._response
+
+    @response.setter
+    def response(self, value):
+        self._response = value
+        self._response_loader = None
+
+    def _set_lazy_response(self, loader):
+        """
+        Set a response that is only created on first access.
+
+        :type loader: callable
+        :param loader: Callable without arguments returning the
+            :class:`~obspy.core.inventory.response.Response` (or ``None``) of
+            the channel. Should be picklable so that the channel can still be
+            pickled and copied without creating the response.
+        """
+        self._response = None
+        self._response_loader = loader
+
     @property
     def location_code(self):
         return self._location_code
@@ -205,6 +242,7 @@ class Channel(BaseNode):
     @location_code.setter
     def location_code(self, value):
         self._location_code = value.strip()
+        _structure_changed()
 
     @property
     def longitude(self):
@@ -14,6 +14,7 @@ from __future__ import (absolute_import, division, print_function,
 from future.builtins import *  # NOQA
 from future.utils import python_2_unicode_compatible
 
+import bisect
 import copy
 import fnmatch
 import textwrap
@@ -26,8 +27,9 @@ from obspy.core.util.decorator import map_example_filename, uncompress_file
 from obspy.core.util.misc import buffered_load_entry_point
 from obspy.core.util.obspy_types import ObsPyException, ZeroSamplingRate
 
-from .network import Network
-from .util import _unified_content_strings, _textwrap, _response_plot_label
+from .network import Network, _channel_metadata
+from .util import (_NodeList, _get_structure_version, _structure_changed,
+                   _unified_content_strings, _textwrap, _response_plot_label)
 
 # Make sure this is consistent with obspy.io.stationxml! Importing it
 # from there results in hard to resolve cyclic imports.
@@ -403,7 +405,94 @@ class Inventory(ComparingObject):
         if any([not isinstance(x, Network) for x in value]):
             msg = "networks can only contain Network objects."
             raise ValueError(msg)
-        self._networks = value
+        self._networks = _NodeList(value)
+        _structure_changed()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # index of channels is rebuilt when needed
+        state.pop("_channel_index", None)
+        return state
+
+    def _build_channel_index(self):
+        """
+        Build the index of all channel epochs by SEED ID.
+
+        :rtype: tuple of two dicts
+        :returns: The epochs of each SEED ID sorted by start time, each epoch
+            as a tuple of start time and end time (in nanoseconds), position
+            in the inventory, network, station and channel. For SEED IDs with
+            more than one epoch also the running maximum of the end times.
+        """
+        epochs = {}
+        position = 0
+        for net in self.networks:
+            for sta in net.stations:
+                for cha in sta.channels:
+                    seed_id = "%s.%s.%s.%s" % (net.code, sta.code,
+                                               cha.location_code, cha.code)
+                    item = (_to_ns(cha.start_date, float("-inf")),
+                            _to_ns(cha.end_date, float("inf")), position,
+                            net, sta, cha)
+                    try:
+                        epochs[seed_id].append(item)
+                    except KeyError:
+                        epochs[seed_id] = [item]
+                    position += 1
+        max_ends = {}
+        for seed_id, items in epochs.items():
+            if len(items) == 1:
+                continue
+            items.sort(key=lambda x: (x[0], x[2]))
+            max_end = float("-inf")
+            max_ends[seed_id] = ends = []
+            for item in items:
+                max_end = max(max_end, item[1])
+                ends.append(max_end)
+        return epochs, max_ends
+
+    def _get_channels(self, seed_id, datetime=None):
+        """
+        Return all channels with given SEED ID operating at given time.
+
+        Uses an index of all channel epochs by SEED ID that is built on first
+        use and rebuilt once networks, stations or channels of any inventory
+        were added, removed, replaced, renamed or had their time span
+        changed.
+
+        :type seed_id: str
+        :param seed_id: SEED ID string of channels to look up.
+        :type datetime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+        :param datetime: Time the channels have to operate at. All channels
+            with given SEED ID are returned if not given.
+        :rtype: list of tuples
+        :returns: List of (network, station, channel) tuples in order of
+            appearance in the inventory.
+        """
+        version = _get_structure_version()
+        index = self.__dict__.get("_channel_index")
+        if index is None or index[0] != version:
+            index = self._channel_index = \
+                (version, ) + self._build_channel_index()
+        epochs = index[1].get(seed_id)
+        if epochs is None:
+            return []
+        if datetime is None:
+            matches = list(epochs)
+        else:
+            t = _to_ns(datetime, None)
+            max_ends = index[2].get(seed_id, [epochs[0][1]])
+            matches = []
+            # all epochs starting at or before the given time, stop as soon
+            # as none of the remaining ones ends after it
+            inf = float("inf")
+            i = bisect.bisect_right(epochs, (t, inf, inf))
+            while i > 0 and max_ends[i - 1] >= t:
+                i -= 1
+                if epochs[i][1] >= t:
+                    matches.append(epochs[i])
+        matches.sort(key=lambda x: x[2])
+        return [epoch[3:] for epoch in matches]
 
     def get_response(self, seed_id, datetime):
         """
@@ -429,16 +518,9 @@ class Inventory(ComparingObject):
         :rtype: :class:`~obspy.core.inventory.response.Response`
         :returns: Response for time series specified by input arguments.
         """
-        network, _, _, _ = seed_id.split(".")
-
-        responses = []
-        for net in self.networks:
-            if net.code != network:
-                continue
-            try:
-                responses.append(net.get_response(seed_id, datetime))
-            except Exception:
-                pass
+        responses = [cha.response
+                     for _, _, cha in self._get_channels(seed_id, datetime)
+                     if cha.response is not None]
         if len(responses) > 1:
             msg = "Found more than one matching response. Returning first."
             warnings.warn(msg)
@@ -459,16 +541,14 @@ class Inventory(ComparingObject):
         :return: Dictionary containing coordinates and orientation (latitude,
             longitude, elevation, azimuth, dip)
         """
-        network, _, _, _ = seed_id.split(".")
-
         metadata = []
-        for net in self.networks:
-            if net.code != network:
+        for net, sta, cha in self._get_channels(seed_id, datetime):
+            # check network and station time span only if datetime is given
+            if datetime is not None and not (
+                    _operates_at(net, datetime) and
+                    _operates_at(sta, datetime)):
                 continue
-            try:
-                metadata.append(net.get_channel_metadata(seed_id, datetime))
-            except Exception:
-                pass
+            metadata.append(_channel_metadata(sta, cha))
         if len(metadata) > 1:
             msg = ("Found more than one matching channel metadata. "
                    "Returning first.")
@@ -1118,6 +1198,28 @@ class Inventory(ComparingObject):
         return fig
 
 
+def _to_ns(datetime, default):
+    """
+    Return a point in time in nanoseconds or ``default`` if it is not set.
+    """
+    if datetime is None:
+        return default
+    if not isinstance(datetime, obspy.UTCDateTime):
+        datetime = obspy.UTCDateTime(datetime)
+    return datetime.ns
+
+
+def _operates_at(node, datetime):
+    """
+    Check if a network or station operates at given time.
+    """
+    if node.start_date and node.start_date > datetime:
+        return False
+    if node.end_date and node.end_date < datetime:
+        return False
+    return True
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod(exclude_empty=True)
@@ -22,7 +22,8 @@ from obspy.core.util.obspy_types import ObsPyException, ZeroSamplingRate
 
 from .station import Station
 from .util import (
-    BaseNode, _unified_content_strings, _textwrap, _response_plot_label)
+    BaseNode, _NodeList, _structure_changed, _unified_content_strings,
+    _textwrap, _response_plot_label)
 
 
 @python_2_unicode_compatible
@@ -186,7 +187,8 @@ class Network(BaseNode):
         if any([not isinstance(x, Station) for x in values]):
             msg = "stations can only contain Station objects."
             raise ValueError(msg)
-        self._stations = values
+        self._stations = _NodeList(values)
+        _structure_changed()
 
     def __short_str__(self):
         return "%s" % self.code
@@ -271,19 +273,7 @@ class Network(BaseNode):
                         # skip if end date before given datetime
                         if cha.end_date and cha.end_date < datetime:
                             continue
-                    # prepare coordinates
-                    data = {}
-                    for key in ('latitude', 'longitude', 'elevation'):
-                        value = getattr(cha, key, None)
-                        # if channel latitude/longitude/elevation is not given
-                        # use station information
-                        if value is None:
-                            value = getattr(sta, key, None)
-                        data[key] = value
-                    data['local_depth'] = cha.depth
-                    data['azimuth'] = cha.azimuth
-                    data['dip'] = cha.dip
-                    metadata.append(data)
+                    metadata.append(_channel_metadata(sta, cha))
         if len(metadata) > 1:
             msg = ("Found more than one matching channel metadata. "
                    "Returning first.")
@@ -681,6 +671,28 @@ class Network(BaseNode):
         return fig
 
 
+def _channel_metadata(station, channel):
+    """
+    Return coordinates and orientation of a channel.
+
+    :rtype: dict
+    :return: Dictionary containing coordinates and orientation (latitude,
+        longitude, elevation, local_depth, azimuth, dip)
+    """
+    data = {}
+    for key in ('latitude', 'longitude', 'elevation'):
+        value = getattr(channel, key, None)
+        # if channel latitude/longitude/elevation is not given use station
+        # information
+        if value is None:
+            value = getattr(station, key, None)
+        data[key] = value
+    data['local_depth'] = channel.depth
+    data['azimuth'] = channel.azimuth
+    data['dip'] = channel.dip
+    return data
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod(exclude_empty=True)
@@ -15,7 +15,10 @@ from future.builtins import *  # NOQA
 
 import copy
 import ctypes as C  # NOQA
-from collections import defaultdict
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict, defaultdict
 from copy import deepcopy
 import itertools
 from math import pi
@@ -35,6 +38,72 @@ from obspy.core.util.obspy_types import (ComplexWithUncertainties,
 from .util import Angle, Frequency
 
 
+class _EvalrespCache(object):
+    """
+    Thread safe least recently used cache for evaluated frequency responses.
+
+    The cache is bounded by the total size of the cached arrays.
+
+    :type maxsize: int
+    :param maxsize: Maximum total size of cached arrays in bytes.
+    """
+    def __init__(self, maxsize=64 * 1024 ** 2):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        """
+        Return cached array for given key or ``None``.
+        """
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return None
+            # reinsert as most recently used item
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Add an array to the cache, dropping least recently used items if the
+        cache gets too large.
+        """
+        if value.nbytes > self.maxsize:
+            return
+        with self._lock:
+            if key in self._data:
+                self._size -= self._data.pop(key).nbytes
+            self._data[key] = value
+            self._size += value.nbytes
+            while self._size > self.maxsize:
+                _, dropped = self._data.popitem(last=False)
+                self._size -= dropped.nbytes
+
+    def clear(self):
+        """
+        Remove all items from the cache and reset statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+
+# cache of responses evaluated by Response.get_evalresp_response()
+_EVALRESP_CACHE = _EvalrespCache()
+
+
 class ResponseStage(ComparingObject):
     """
     From the StationXML Definition:
@@ -1648,16 +1717,44 @@ class Response(ComparingObject):
             used (disregarding all later stages).
         :rtype: tuple of two arrays
         :returns: frequency response and corresponding frequencies
+
+        .. note::
+            Evaluated responses are kept in a cache (bounded in memory) and
+            reused when the same response is evaluated again with the same
+            parameters, e.g. when removing the response of many traces of one
+            channel. Responses are identified by their content, so modifying
+            a response in place does not give outdated results.
         """
         # Calculate the output frequencies.
         fy = 1 / (t_samp * 2.0)
         # start at zero to get zero for offset/ DC of fft
         freqs = np.linspace(0, fy, nfft // 2 + 1).astype(np.float64)
 
+        key = self._get_evalresp_cache_key(t_samp, nfft, output, start_stage,
+                                           end_stage)
+        if key is not None:
+            response = _EVALRESP_CACHE.get(key)
+            if response is not None:
+                return response.copy(), freqs
         response = self.get_evalresp_response_for_frequencies(
             freqs, output=output, start_stage=start_stage, end_stage=end_stage)
+        if key is not None:
+            _EVALRESP_CACHE.put(key, response.copy())
         return response, freqs
 
+    def _get_evalresp_cache_key(self, *args):
+        """
+        Key for the cache of evaluated responses, identifying the response
+        by a digest of its pickled content.
+
+        Returns ``None`` if the response can not be pickled.
+        """
+        try:
+            digest = hashlib.sha1(pickle.dumps(self, protocol=2)).digest()
+        except Exception:
+            return None
+        return (digest, ) + args
+
     def __str__(self):
         i_s = self.instrument_sensitivity
         if i_s:
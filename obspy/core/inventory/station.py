@@ -24,7 +24,8 @@ from obspy import UTCDateTime
 from obspy.core.util.obspy_types import ObsPyException, ZeroSamplingRate
 
 from .util import (BaseNode, Equipment, Operator, Distance, Latitude,
-                   Longitude, _unified_content_strings, _textwrap, Site)
+                   Longitude, _NodeList, _structure_changed,
+                   _unified_content_strings, _textwrap, Site)
 
 
 @python_2_unicode_compatible
@@ -125,6 +126,15 @@ class Station(BaseNode):
             historical_code=historical_code,
             data_availability=data_availability)
 
+    @property
+    def channels(self):
+        return self._channels
+
+    @channels.setter
+    def channels(self, values):
+        self._channels = _NodeList(values)
+        _structure_changed()
+
     @property
     def total_number_of_channels(self):
         return self._total_number_of_channels
@@ -23,6 +23,58 @@ from obspy.core.util.obspy_types import (FloatWithUncertaintiesAndUnit,
                                          FloatWithUncertaintiesFixedUnit)
 
 
+# Incremented whenever networks, stations or channels of any inventory are
+# added, removed or replaced or their codes or time spans are changed. Lookup
+# indices of inventories are valid as long as the version does not change.
+_structure_version = 0
+
+
+def _structure_changed():
+    """
+    Note a change of the structure of an inventory.
+    """
+    global _structure_version
+    _structure_version += 1
+
+
+def _get_structure_version():
+    return _structure_version
+
+
+def _notify(method):
+    def wrapper(self, *args, **kwargs):
+        _structure_changed()
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+class _NodeList(list):
+    """
+    List of networks, stations or channels noting all modifications of the
+    list itself, see :func:`_structure_changed`.
+    """
+    __slots__ = ()
+
+    append = _notify(list.append)
+    extend = _notify(list.extend)
+    insert = _notify(list.insert)
+    remove = _notify(list.remove)
+    pop = _notify(list.pop)
+    sort = _notify(list.sort)
+    reverse = _notify(list.reverse)
+    __setitem__ = _notify(list.__setitem__)
+    __delitem__ = _notify(list.__delitem__)
+    __iadd__ = _notify(list.__iadd__)
+    __imul__ = _notify(list.__imul__)
+    if hasattr(list, "clear"):
+        clear = _notify(list.clear)
+    # Python 2 only
+    if hasattr(list, "__setslice__"):
+        __setslice__ = _notify(list.__setslice__)
+        __delslice__ = _notify(list.__delslice__)
+
+
 class BaseNode(ComparingObject):
     """
     From the StationXML definition:
@@ -78,6 +130,25 @@ class BaseNode(ComparingObject):
             msg = "A code is required"
             raise ValueError(msg)
         self._code = str(value).strip()
+        _structure_changed()
+
+    @property
+    def start_date(self):
+        return self._start_date
+
+    @start_date.setter
+    def start_date(self, value):
+        self._start_date = value
+        _structure_changed()
+
+    @property
+    def end_date(self):
+        return self._end_date
+
+    @end_date.setter
+    def end_date(self, value):
+        self._end_date = value
+        _structure_changed()
 
     @property
     def alternate_code(self):
@@ -25,10 +25,11 @@ from glob import glob, has_magic
 import numpy as np
 
 from obspy.core import compatibility
-from obspy.core.trace import Trace
+from obspy.core.trace import Trace, _TraceMerger, _get_processing_info
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util.base import (ENTRY_POINTS, _get_function_from_entry_point,
-                                  _read_from_plugin, _generic_reader)
+                                  _read_from_plugin, _generic_reader,
+                                  _parallel_map)
 from obspy.core.util.decorator import (map_example_filename,
                                        raise_if_masked, uncompress_file)
 from obspy.core.util.misc import get_window_times, buffered_load_entry_point
@@ -42,7 +43,7 @@ _headonly_warning_msg = (
 @map_example_filename("pathname_or_url")
 def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
          endtime=None, nearest_sample=True, dtype=None, apply_calib=False,
-         check_compression=True, **kwargs):
+         check_compression=True, workers=None, executor=None, **kwargs):
     """
     Read waveform files into an ObsPy Stream object.
 
@@ -87,6 +88,18 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
     :param check_compression: Check for compression on file and decompress
         if needed. This may be disabled for a moderate speed up.
     :type check_compression: bool, optional
+    :type workers: int, optional
+    :param workers: If ``pathname_or_url`` matches multiple files, read them
+        concurrently using a pool with the given number of threads. The
+        resulting traces are always in the same order as when reading the
+        files sequentially. MiniSEED decoding in libmseed releases the GIL, so
+        multiple threads can considerably speed up reading many files.
+    :param executor: If ``pathname_or_url`` matches multiple files, read them
+        using the given pool object, e.g. a
+        :class:`multiprocessing.Pool` or a
+        :class:`concurrent.futures.ProcessPoolExecutor`. Anything providing a
+        ``map(func, iterable)`` method can be used. Takes precedence over
+        ``workers``.
     :param kwargs: Additional keyword arguments passed to the underlying
         waveform reader method.
     :return: An ObsPy :class:`~obspy.core.stream.Stream` object.
@@ -207,7 +220,8 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
         # if no pathname or URL specified, return example stream
         st = _create_example_stream(headonly=headonly)
     else:
-        st = _generic_reader(pathname_or_url, _read, **kwargs)
+        st = _generic_reader(pathname_or_url, _read, workers=workers,
+                             executor=executor, **kwargs)
 
     if len(st) == 0:
         # try to give more specific information why the stream is empty
@@ -1920,58 +1934,45 @@ class Stream(object):
         The ``method`` argument controls the handling of overlapping data
         values.
         """
-        def listsort(order, current):
-            """
-            Helper method for keeping trace's ordering
-            """
-            try:
-                return order.index(current)
-            except ValueError:
-                return -1
-
         self._cleanup(**kwargs)
         if method == -1:
             return
         # check sampling rates and dtypes
         self._merge_checks()
         # remember order of traces
-        order = [id(i) for i in self.traces]
+        order = dict((id(tr), i) for i, tr in enumerate(self.traces))
         # order matters!
         self.sort(keys=['network', 'station', 'location', 'channel',
                         'starttime', 'endtime'])
         # build up dictionary with with lists of traces with same ids
         traces_dict = {}
-        # using pop() and try-except saves memory
-        try:
-            while True:
-                trace = self.traces.pop(0)
-                # skip empty traces
-                if len(trace) == 0:
-                    continue
-                _id = trace.get_id()
-                if _id not in traces_dict:
-                    traces_dict[_id] = [trace]
-                else:
-                    traces_dict[_id].append(trace)
-        except IndexError:
-            pass
+        for trace in self.traces:
+            # skip empty traces
+            if len(trace) == 0:
+                continue
+            traces_dict.setdefault(trace.get_id(), []).append(trace)
         # clear traces of current stream
         self.traces = []
         # loop through ids
         for _id in traces_dict.keys():
-            cur_trace = traces_dict[_id].pop(0)
+            trace_list = traces_dict[_id]
+            cur_trace = trace_list[0]
+            # the merged data is written into one preallocated array
+            endtime = max(tr.stats.endtime for tr in trace_list)
+            capacity = int(round((endtime - cur_trace.stats.starttime) *
+                                 cur_trace.stats.sampling_rate)) + 1
+            merger = _TraceMerger(
+                cur_trace, method=method, fill_value=fill_value,
+                interpolation_samples=interpolation_samples,
+                capacity=capacity)
             # loop through traces of same id
-            for _i in range(len(traces_dict[_id])):
-                trace = traces_dict[_id].pop(0)
-                # disable sanity checks because there are already done
-                cur_trace = cur_trace.__add__(
-                    trace, method, fill_value=fill_value, sanity_checks=False,
-                    interpolation_samples=interpolation_samples)
-            self.traces.append(cur_trace)
+            for trace in trace_list[1:]:
+                merger.add(trace)
+            self.traces.append(merger.get_trace())
 
         # trying to restore order, newly created traces are placed at
         # start
-        self.traces.sort(key=lambda x: listsort(order, id(x)))
+        self.traces.sort(key=lambda x: order.get(id(x), -1))
         return self
 
     def simulate(self, paz_remove=None, paz_simulate=None,
@@ -2078,7 +2079,7 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         return self
 
     @raise_if_masked
-    def filter(self, type, **options):
+    def filter(self, type, workers=None, **options):
         """
         Filter the data of all traces in the Stream.
 
@@ -2086,6 +2087,10 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         :param type: String that specifies which filter is applied (e.g.
             ``"bandpass"``). See the `Supported Filter`_ section below for
             further details.
+        :type workers: int
+        :param workers: Number of threads to use for filtering traces with
+            the Butterworth filters (see note below). By default all data is
+            filtered in the calling thread.
         :param options: Necessary keyword arguments for the respective filter
             that will be passed on. (e.g. ``freqmin=1.0``, ``freqmax=20.0`` for
             ``"bandpass"``)
@@ -2099,6 +2104,14 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             This also makes an entry with information on the applied processing
             in ``stats.processing`` of every trace.
 
+        .. note::
+
+            The Butterworth filters (``'bandpass'``, ``'bandstop'``,
+            ``'lowpass'`` and ``'highpass'``) are applied to all traces with
+            the same sampling rate, number of samples and data type at once,
+            designing the filter only once. Results are the same as when
+            filtering trace by trace.
+
         .. rubric:: _`Supported Filter`
 
         ``'bandpass'``
@@ -2138,7 +2151,43 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             st.filter("highpass", freq=1.0)
             st.plot()
         """
-        for tr in self:
+        from obspy.signal.filter import bandpass, bandstop, highpass, lowpass
+        func = _get_function_from_entry_point('filter', type.lower())
+        traces = self.traces
+        if func in (bandpass, bandstop, highpass, lowpass):
+            # group traces that can be filtered together as a 2-D array,
+            # everything else is filtered trace by trace
+            groups = {}
+            traces = []
+            for tr in self:
+                if isinstance(tr.data, np.ma.masked_array) or \
+                        not tr.stats.npts:
+                    traces.append(tr)
+                    continue
+                key = (tr.stats.sampling_rate, tr.stats.npts, tr.data.dtype)
+                groups.setdefault(key, []).append(tr)
+            # filter in blocks of a limited number of samples, stacking all
+            # traces at once is slower due to the large temporary arrays
+            blocks = []
+            for group in groups.values():
+                size = max(1, 2 ** 19 // group[0].stats.npts)
+                blocks.extend(group[i:i + size]
+                              for i in range(0, len(group), size))
+
+            def _filter_block(block):
+                data = np.vstack([tr.data for tr in block])
+                data = func(data, df=block[0].stats.sampling_rate, **options)
+                # every trace owns its (contiguous) data, views on the block
+                # would keep the whole block alive
+                return [row.copy() for row in data]
+
+            for block, data in zip(blocks, _parallel_map(
+                    _filter_block, blocks, workers=workers)):
+                info = _get_processing_info(block[0].filter, type, **options)
+                for tr, tr_data in zip(block, data):
+                    tr.data = tr_data
+                    tr._internal_add_processing_info(info)
+        for tr in traces:
             tr.filter(type, **options)
         return self
 
@@ -2900,25 +2949,20 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
                         'starttime', 'endtime'])
         # build up dictionary with lists of traces with same ids
         traces_dict = {}
-        # using pop() and try-except saves memory
-        try:
-            while True:
-                trace = self.traces.pop(0)
-                # add trace to respective list or create that list
-                traces_dict.setdefault(trace.id, []).append(trace)
-        except IndexError:
-            pass
+        for trace in self.traces:
+            # add trace to respective list or create that list
+            traces_dict.setdefault(trace.id, []).append(trace)
         # clear traces of current stream
         self.traces = []
         # loop through ids
         for id_ in traces_dict.keys():
             trace_list = traces_dict[id_]
-            cur_trace = trace_list.pop(0)
+            cur_trace = trace_list[0]
+            merger = _TraceMerger(cur_trace)
             delta = cur_trace.stats.delta
             allowed_micro_shift = misalignment_threshold * delta
             # work through all traces of same id
-            while trace_list:
-                trace = trace_list.pop(0)
+            for trace in trace_list[1:]:
                 # `gap` is the deviation (in seconds) of the actual start
                 # time of the second trace from the expected start time
                 # (for the ideal case of directly adjacent and perfectly
@@ -2980,21 +3024,25 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
                     # if consistent: add them together
                     if np.array_equal(cur_trace.slice(t1, t2).data,
                                       trace.slice(t1, t2).data):
-                        cur_trace += trace
+                        merger.add(trace)
+                        cur_trace = merger.trace
                     # if not consistent: leave them alone
                     else:
-                        self.traces.append(cur_trace)
+                        self.traces.append(merger.get_trace())
                         cur_trace = trace
+                        merger = _TraceMerger(cur_trace)
                 # traces are perfectly adjacent: add them together
                 elif trace.stats.starttime == cur_trace.stats.endtime + \
                         cur_trace.stats.delta:
-                    cur_trace += trace
+                    merger.add(trace)
+                    cur_trace = merger.trace
                 # no common parts (gap):
                 # leave traces alone and add current to list
                 else:
-                    self.traces.append(cur_trace)
+                    self.traces.append(merger.get_trace())
                     cur_trace = trace
-            self.traces.append(cur_trace)
+                    merger = _TraceMerger(cur_trace)
+            self.traces.append(merger.get_trace())
         self.traces = [tr for tr in self.traces if tr.stats.npts]
         return self
 
@@ -18,6 +18,7 @@ import builtins
 import copy
 import io
 import os
+import time
 import unittest
 import warnings
 
@@ -117,6 +118,125 @@ class InventoryTestCase(unittest.TestCase):
                                     UTCDateTime('2010-01-01T12:00'))
         self.assertEqual(response, response_n2_s1)
 
+    def test_get_response_channel_index(self):
+        """
+        Tests that channel lookups stay correct when the inventory is
+        modified after the internal channel index has been built.
+        """
+        t = UTCDateTime('2010-01-01T12:00')
+
+        def _channel(code, response):
+            return Channel(code=code, location_code='', latitude=0.0,
+                           longitude=0.0, elevation=0.0, depth=0.0,
+                           response=response)
+
+        def _station(code, channels):
+            return Station(code=code, latitude=0.0, longitude=0.0,
+                           elevation=0.0, channels=channels)
+
+        resp_a = Response('A')
+        inv = Inventory(networks=[Network('N1', stations=[
+            _station('S1', [_channel('BHZ', resp_a)])])], source='TEST')
+        self.assertEqual(inv.get_response('N1.S1..BHZ', t), resp_a)
+        self.assertRaises(Exception, inv.get_response, 'N2.S1..BHZ', t)
+        # add a network
+        resp_b = Response('B')
+        inv += Inventory(networks=[Network('N2', stations=[
+            _station('S1', [_channel('BHZ', resp_b)])])], source='TEST')
+        self.assertEqual(inv.get_response('N2.S1..BHZ', t), resp_b)
+        # append a station to an existing network
+        resp_c = Response('C')
+        inv[0].stations.append(_station('S2', [_channel('BHZ', resp_c)]))
+        self.assertEqual(inv.get_response('N1.S2..BHZ', t), resp_c)
+        # append a channel to an existing station
+        resp_d = Response('D')
+        inv[0][0].channels.append(_channel('BHN', resp_d))
+        self.assertEqual(inv.get_response('N1.S1..BHN', t), resp_d)
+        # rename a station in place
+        inv[0][0].code = 'S3'
+        self.assertEqual(inv.get_response('N1.S3..BHZ', t), resp_a)
+        self.assertRaises(Exception, inv.get_response, 'N1.S1..BHZ', t)
+        # replace a station in place
+        resp_e = Response('E')
+        inv[0].stations[1] = _station('S2', [_channel('BHZ', resp_e)])
+        self.assertEqual(inv.get_response('N1.S2..BHZ', t), resp_e)
+        # change the time span of a channel
+        inv[0][1][0].start_date = t + 10
+        self.assertRaises(Exception, inv.get_response, 'N1.S2..BHZ', t)
+        self.assertEqual(inv.get_response('N1.S2..BHZ', t + 10), resp_e)
+        # add another epoch of a channel
+        resp_f = Response('F')
+        cha = _channel('BHZ', resp_f)
+        cha.end_date = t + 10
+        inv[0][1].channels.insert(0, cha)
+        self.assertEqual(inv.get_response('N1.S2..BHZ', t), resp_f)
+        self.assertEqual(inv.get_response('N1.S2..BHZ', t + 20), resp_e)
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('ignore')
+            # overlapping epochs return the first one of the inventory
+            self.assertEqual(inv.get_response('N1.S2..BHZ', t + 10), resp_f)
+        # lookups do not rebuild an unchanged index
+        index = inv._channel_index
+        self.assertRaises(Exception, inv.get_response, 'N9.S9..BHZ', t)
+        self.assertEqual(inv.get_response('N1.S2..BHZ', t), resp_f)
+        self.assertIs(inv._channel_index, index)
+        # coordinates use the same lookup
+        self.assertEqual(inv.get_coordinates('N2.S1..BHZ', t)['latitude'],
+                         0.0)
+        # index is not carried over into copies
+        inv2 = copy.deepcopy(inv)
+        self.assertFalse(hasattr(inv2, '_channel_index'))
+        self.assertEqual(inv2.get_response('N1.S2..BHZ', t + 20), resp_e)
+
+    def test_channel_lookup_large_inventory(self):
+        """
+        Looking up channels in a large inventory does not scan all channels.
+        """
+        t = UTCDateTime(2010, 1, 1)
+
+        def _inventory(num_networks, num_stations):
+            networks = []
+            for i in range(num_networks):
+                stations = []
+                for j in range(num_stations):
+                    channels = [
+                        Channel(code=code, location_code='', latitude=1.0,
+                                longitude=2.0, elevation=0.0, depth=0.0,
+                                start_date=t, response=Response(code))
+                        for code in ('BHZ', 'BHN', 'BHE', 'HHZ', 'HHN',
+                                     'HHE')]
+                    stations.append(Station(code='S%03d' % j, latitude=0.0,
+                                            longitude=0.0, elevation=0.0,
+                                            channels=channels))
+                networks.append(Network('N%02d' % i, stations=stations))
+            return Inventory(networks=networks, source='TEST')
+
+        def _lookup_time(inv, seed_id):
+            # index is built on first use
+            inv.get_response(seed_id, t + 10)
+            start = time.time()
+            for _ in range(200):
+                inv.get_response(seed_id, t + 10)
+                inv.get_coordinates(seed_id, t + 10)
+            return time.time() - start
+
+        small = _inventory(1, 1)
+        # 20 networks with 500 stations each, 60000 channels
+        large = _inventory(20, 500)
+        self.assertEqual(
+            large.get_response('N19.S499..HHE', t + 10).resource_id, 'HHE')
+        self.assertEqual(
+            large.get_coordinates('N07.S123..BHN', t + 10)['latitude'], 1.0)
+        self.assertRaises(Exception, large.get_response, 'N07.S123..BHN',
+                          t - 10)
+        # best of a few runs to be robust against a busy machine, a linear
+        # scan of all channels is more than a hundred times slower
+        time_small = min(_lookup_time(small, 'N00.S000..BHZ')
+                         for _ in range(3))
+        time_large = min(_lookup_time(large, 'N10.S250..BHZ')
+                         for _ in range(3))
+        self.assertLess(time_large, 10 * time_small + 0.01)
+
     def test_get_coordinates(self):
         """
         Test extracting coordinates
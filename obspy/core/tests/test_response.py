@@ -25,7 +25,8 @@ from matplotlib import rcParams
 
 from obspy import UTCDateTime, read_inventory
 from obspy.core.inventory.response import (
-    _pitick2latex, PolesZerosResponseStage, PolynomialResponseStage)
+    _EVALRESP_CACHE, _EvalrespCache, _pitick2latex, PolesZerosResponseStage,
+    PolynomialResponseStage)
 from obspy.core.util import MATPLOTLIB_VERSION
 from obspy.core.util.misc import CatchOutput
 from obspy.core.util.obspy_types import ComplexWithUncertainties
@@ -526,6 +527,45 @@ class ResponseTestCase(unittest.TestCase):
             resp.instrument_sensitivity.frequency,
             1.0)
 
+    def test_evalresp_response_cache(self):
+        """
+        Tests caching of evaluated responses.
+        """
+        _EVALRESP_CACHE.clear()
+        resp = read_inventory()[0][0][0].response
+        resp_1, freqs_1 = resp.get_evalresp_response(0.01, 1024)
+        self.assertEqual(_EVALRESP_CACHE.misses, 1)
+        # modifying returned array must not change the cached array
+        resp_1_copy = resp_1.copy()
+        resp_1 *= 2
+        # same response and parameters are served from cache, also for a
+        # copy of the response
+        for resp_ in (resp, resp.__class__(**resp.__dict__)):
+            resp_2, freqs_2 = resp_.get_evalresp_response(0.01, 1024)
+            np.testing.assert_array_equal(resp_1_copy, resp_2)
+            np.testing.assert_array_equal(freqs_1, freqs_2)
+        self.assertEqual(_EVALRESP_CACHE.hits, 2)
+        self.assertEqual(_EVALRESP_CACHE.misses, 1)
+        # other parameters or a modified response are evaluated again
+        resp.get_evalresp_response(0.01, 1024, output="ACC")
+        resp.get_evalresp_response(0.02, 1024)
+        resp.response_stages[0].stage_gain *= 2
+        resp_3, _ = resp.get_evalresp_response(0.01, 1024)
+        np.testing.assert_allclose(resp_3, resp_1_copy * 2)
+        self.assertEqual(_EVALRESP_CACHE.hits, 2)
+        self.assertEqual(_EVALRESP_CACHE.misses, 4)
+        # cache is limited in size, least recently used items are dropped
+        cache = _EvalrespCache(maxsize=3 * resp_3.nbytes)
+        for i in range(5):
+            cache.put(i, resp_3)
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get(1))
+        self.assertIsNotNone(cache.get(2))
+        cache.put(5, resp_3)
+        self.assertIsNotNone(cache.get(2))
+        self.assertIsNone(cache.get(3))
+        _EVALRESP_CACHE.clear()
+
 
 def suite():
     return unittest.makeSuite(ResponseTestCase, 'test')
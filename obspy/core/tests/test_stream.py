@@ -1154,6 +1154,68 @@ class StreamTestCase(unittest.TestCase):
             (4 * 1440 - 1) * trace1.stats.delta
         self.assertEqual(st[0].stats.endtime, endtime)
 
+    def test_merge_many_fragmented_traces(self):
+        """
+        Merging many traces at once has to give the same result as adding
+        up the traces one by one with Trace.__add__().
+        """
+        np.random.seed(815)
+        base = np.random.randint(-50, 50, 2000)
+        t = UTCDateTime(2000, 1, 1)
+        traces = []
+        for _ in range(150):
+            start = np.random.randint(0, 1900)
+            data = base[start:start + np.random.randint(1, 100)].copy()
+            # some traces with overlaps that do not match
+            if np.random.rand() < 0.3:
+                data += np.random.randint(0, 3, len(data))
+            # some traces with masked samples
+            if np.random.rand() < 0.1:
+                data = np.ma.masked_array(data,
+                                          np.random.rand(len(data)) < 0.3)
+            traces.append(Trace(data=data, header={
+                'starttime': t + start * 0.1, 'sampling_rate': 10}))
+        traces.sort(key=lambda tr: (tr.stats.starttime, tr.stats.endtime))
+        for method, interpolation_samples in ((0, 0), (1, 0), (1, 2),
+                                              (1, -1)):
+            for fill_value in (None, 0, 'latest', 'interpolate'):
+                kwargs = dict(method=method, fill_value=fill_value,
+                              interpolation_samples=interpolation_samples)
+                st = Stream([tr.copy() for tr in traces])
+                st.merge(**kwargs)
+                # any merge starts with a cleanup merge
+                st2 = Stream([tr.copy() for tr in traces])
+                st2._cleanup()
+                st2.sort(keys=['starttime', 'endtime'])
+                expected = st2[0]
+                for tr in st2[1:]:
+                    expected = expected.__add__(tr, **kwargs)
+                self.assertEqual(len(st), 1)
+                self.assertEqual(st[0].stats, expected.stats)
+                self.assertEqual(type(st[0].data), type(expected.data))
+                np.testing.assert_array_equal(
+                    np.ma.getmaskarray(st[0].data),
+                    np.ma.getmaskarray(expected.data))
+                np.testing.assert_array_equal(
+                    np.ma.getdata(st[0].data), np.ma.getdata(expected.data))
+
+    def test_merge_does_not_share_nested_stats(self):
+        """
+        The merged trace has its own copy of nested header entries.
+        """
+        t = UTCDateTime(2000, 1, 1)
+        traces = [Trace(data=np.arange(10, dtype=np.int32),
+                        header={'starttime': t + i, 'sampling_rate': 10,
+                                'mseed': AttribDict({'dataquality': 'D'})})
+                  for i in range(3)]
+        st = Stream(traces[:])
+        st.merge()
+        self.assertEqual(len(st), 1)
+        self.assertEqual(st[0].stats.npts, 30)
+        st[0].stats.mseed.dataquality = 'Q'
+        for tr in traces:
+            self.assertEqual(tr.stats.mseed.dataquality, 'D')
+
     def test_merge_overlaps_method_1(self):
         """
         Test merging with method = 1.
@@ -1904,6 +1966,30 @@ class StreamTestCase(unittest.TestCase):
             self.assertRaises(UserWarning, read, '/path/to/slist_float.ascii',
                               headonly=True, starttime=0, endtime=1)
 
+    def test_read_multiple_files_in_parallel(self):
+        """
+        Reading multiple files with a thread pool or a given executor has to
+        give the same result in the same order as reading sequentially.
+        """
+        path = os.path.dirname(__file__)
+        mseed_path = os.path.join(path, "..", "..", "io", "mseed", "tests",
+                                  "data")
+        filename = os.path.join(mseed_path, 'BW.BGLD.__.EHE.D.2008.001*')
+        st = read(filename)
+        self.assertGreater(len(st), 1)
+        self.assertEqual(st, read(filename, workers=4))
+        self.assertEqual(st, read(filename, workers=1))
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(3)
+        try:
+            self.assertEqual(st, read(filename, executor=pool))
+        finally:
+            pool.close()
+            pool.join()
+        # exceptions in workers are raised
+        self.assertRaises(Exception, read, filename, format="GSE2",
+                          workers=4)
+
     def test_read_url_via_network(self):
         """
         Testing read function with an URL fetching data via network connection
@@ -2656,6 +2742,38 @@ class StreamTestCase(unittest.TestCase):
             self.assertEqual(e.exception.args[0],
                              'Can not write empty stream to file.')
 
+    def test_filter_same_as_trace_by_trace(self):
+        """
+        Stream.filter() filters traces of equal length together, results and
+        processing information have to be the same as when filtering trace by
+        trace.
+        """
+        st = read()
+        st += read()[:2].decimate(2, no_filter=True)
+        st += Trace(data=np.arange(300, dtype=np.int32),
+                    header={'sampling_rate': 100.0})
+        st += Trace(data=np.ma.masked_array(np.arange(10.0), mask=[1] * 10),
+                    header={'sampling_rate': 100.0})
+        for type_, kwargs in (('bandpass', dict(freqmin=1, freqmax=5)),
+                              ('highpass', dict(freq=1, zerophase=True)),
+                              ('lowpass_cheby_2', dict(freq=3))):
+            for workers in (None, 2):
+                st1 = st[:-1].copy()
+                st1.filter(type_, workers=workers, **kwargs)
+                st2 = st[:-1].copy()
+                for tr in st2:
+                    tr.filter(type_, **kwargs)
+                self.assertEqual(st1, st2)
+                # traces filtered together do not share a block of data
+                if type_ == 'lowpass_cheby_2':
+                    continue
+                for tr in st1:
+                    self.assertIsNone(tr.data.base)
+                    self.assertTrue(tr.data.flags.c_contiguous)
+            # masked data is still refused
+            self.assertRaises(NotImplementedError, st.copy().filter, type_,
+                              **kwargs)
+
 
 def suite():
     suite = unittest.TestSuite()
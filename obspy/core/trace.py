@@ -219,11 +219,10 @@ class Stats(AttribDict):
         p.text(str(self))
 
 
-@decorator
-def _add_processing_info(func, *args, **kwargs):
+def _get_processing_info(func, *args, **kwargs):
     """
-    This is a decorator that attaches information about a processing call as a
-    string to the Trace.stats.processing list.
+    Return the information string about a processing call as it is attached
+    to the Trace.stats.processing list by :func:`_add_processing_info`.
     """
     callargs = inspect.getcallargs(func, *args, **kwargs)
     callargs.pop("self")
@@ -240,7 +239,16 @@ def _add_processing_info(func, *args, **kwargs):
         ["%s=%s" % (k, repr(v)) if not isinstance(v, native_str) else
          "%s='%s'" % (k, v) for k, v in kwargs_.items()]
     arguments.sort()
-    info = info % "::".join(arguments)
+    return info % "::".join(arguments)
+
+
+@decorator
+def _add_processing_info(func, *args, **kwargs):
+    """
+    This is a decorator that attaches information about a processing call as a
+    string to the Trace.stats.processing list.
+    """
+    info = _get_processing_info(func, *args, **kwargs)
     self = args[0]
     result = func(*args, **kwargs)
     # Attach after executing the function to avoid having it attached
@@ -2950,6 +2958,252 @@ def _data_sanity_checks(value):
         raise ValueError(msg)
 
 
+class _TraceMerger(object):
+    """
+    Successively merges traces of the same id into one trace.
+
+    Gives the same result as successive calls to
+    :meth:`Trace.__add__() <obspy.core.trace.Trace.__add__>` (with disabled
+    sanity checks), but writes the data into a preallocated (and if needed
+    growing) buffer instead of concatenating the complete data for every
+    added trace. This makes merging many short traces linear instead of
+    quadratic in the total number of samples. Cases that are not handled
+    directly (e.g. masked input data) are passed on to
+    :meth:`Trace.__add__() <obspy.core.trace.Trace.__add__>`.
+
+    :type trace: :class:`~obspy.core.trace.Trace`
+    :param trace: First trace. Traces that are added later on are expected
+        to not start before the current start time (e.g. to be sorted by
+        start time).
+    :type capacity: int
+    :param capacity: Number of samples to preallocate, e.g. the expected
+        number of samples of the merged trace.
+    """
+    def __init__(self, trace, method=0, fill_value=None,
+                 interpolation_samples=0, capacity=0):
+        self.method = method
+        self.fill_value = fill_value
+        self.interpolation_samples = interpolation_samples
+        self._capacity = capacity
+        self._trace = trace
+        # buffer is only set up when the first trace gets added
+        self._buffer = None
+        self._mask = None
+        self._npts = 0
+        self._dirty = False
+
+    @property
+    def trace(self):
+        """
+        Current merged trace.
+
+        Its data is a view on the internal buffer and only valid until the
+        next trace is added, use :meth:`get_trace` to retrieve the final
+        trace.
+        """
+        if self._dirty:
+            data = self._buffer[:self._npts]
+            if self._mask is not None:
+                data = np.ma.masked_array(data, mask=self._mask[:self._npts])
+            self._trace.data = data
+            self._dirty = False
+        return self._trace
+
+    def get_trace(self):
+        """
+        Return the merged trace, see :meth:`trace`.
+        """
+        trace = self.trace
+        if self._buffer is None:
+            return trace
+        data = trace.data
+        if isinstance(data, np.ma.masked_array) and \
+                not np.ma.count_masked(data):
+            data = data.compressed()
+        elif len(self._buffer) != self._npts:
+            # do not keep the unused part of the buffer alive
+            data = data.copy()
+        trace.data = data
+        self._buffer = None
+        self._mask = None
+        return trace
+
+    def _setup_buffer(self, npts):
+        """
+        Set up (or grow) the buffer to be able to hold at least ``npts``
+        samples.
+        """
+        if self._buffer is None:
+            trace = self.trace
+            data = trace.data
+            self._npts = len(data)
+            capacity = max(npts, self._capacity)
+            self._buffer = np.empty(capacity, dtype=data.dtype)
+            if isinstance(data, np.ma.masked_array):
+                self._buffer[:self._npts] = data.data
+                self._mask = np.zeros(capacity, dtype=np.bool_)
+                self._mask[:self._npts] = np.ma.getmaskarray(data)
+            else:
+                self._buffer[:self._npts] = data
+            # like Trace.__add__() the merged trace is a new object with a
+            # copy of the header of the first trace
+            self._trace = trace.__class__(header=deepcopy(trace.stats))
+            self._dirty = True
+        elif npts > len(self._buffer):
+            capacity = max(npts, 2 * len(self._buffer))
+            buffer_ = np.empty(capacity, dtype=self._buffer.dtype)
+            buffer_[:self._npts] = self._buffer[:self._npts]
+            self._buffer = buffer_
+            if self._mask is not None:
+                mask = np.zeros(capacity, dtype=np.bool_)
+                mask[:self._npts] = self._mask[:self._npts]
+                self._mask = mask
+
+    def _write(self, index, data):
+        """
+        Write data (ndarray or masked array) into buffer at given index.
+        """
+        end = index + len(data)
+        if isinstance(data, np.ma.masked_array):
+            if self._mask is None:
+                self._mask = np.zeros(len(self._buffer), dtype=np.bool_)
+            self._buffer[index:end] = data.data
+            self._mask[index:end] = np.ma.getmaskarray(data)
+        else:
+            self._buffer[index:end] = data
+            if self._mask is not None:
+                self._mask[index:end] = False
+
+    def _is_masked(self, index):
+        return self._mask is not None and self._mask[index]
+
+    def _add_fallback(self, trace):
+        """
+        Add trace using :meth:`Trace.__add__`.
+        """
+        lt = self.get_trace()
+        self._trace = lt.__add__(
+            trace, method=self.method, fill_value=self.fill_value,
+            interpolation_samples=self.interpolation_samples,
+            sanity_checks=False)
+        self._dirty = False
+
+    def add(self, trace):
+        """
+        Merge given trace into the current trace.
+
+        See :meth:`Trace.__add__() <obspy.core.trace.Trace.__add__>` for
+        details on handling of gaps and overlaps.
+        """
+        lt = self.trace
+        npts = len(lt)
+        rt = trace.data
+        lenrt = len(rt)
+        if isinstance(rt, np.ma.masked_array) or not npts or not lenrt or \
+                trace.stats.starttime < lt.stats.starttime:
+            self._add_fallback(trace)
+            return
+        sr = lt.stats.sampling_rate
+        delta = (trace.stats.starttime - lt.stats.endtime) * sr
+        delta = int(compatibility.round_away(delta)) - 1
+        delta_endtime = lt.stats.endtime - trace.stats.endtime
+        # index of first sample of added trace
+        index = npts + delta
+        overlap = delta < 0 and delta_endtime < 0
+        contained = delta < 0 and delta_endtime >= 0
+        if overlap or contained:
+            delta = abs(delta)
+            if index < 0 or (overlap and (
+                    delta > lenrt or index + lenrt <= npts)) or \
+                    (contained and index + lenrt > npts):
+                self._add_fallback(trace)
+                return
+        self._setup_buffer(max(npts, index + lenrt))
+        buffer_ = self._buffer
+        # check whether to use the latest value to fill a gap
+        fill_value = self.fill_value
+        if fill_value == "latest" or fill_value == "interpolate":
+            if self._is_masked(npts - 1):
+                self._add_fallback(trace)
+                return
+            if fill_value == "latest":
+                fill_value = buffer_[npts - 1]
+            else:
+                fill_value = (buffer_[npts - 1], rt[0])
+        dtype = buffer_.dtype
+        if self._mask is not None:
+            # mask of samples of current trace that are covered by added trace
+            mask = self._mask[index:min(npts, index + lenrt)]
+            if not mask.any():
+                mask = None
+        else:
+            mask = None
+        if overlap:
+            # overlap
+            equal = np.equal(buffer_[index:npts], rt[:delta])
+            if mask is not None:
+                equal = np.all(equal | mask) and not np.all(mask)
+            else:
+                equal = np.all(equal)
+            if equal:
+                self._write(index, rt)
+            elif self.method == 0:
+                self._write(index, create_empty_data_chunk(
+                    delta, dtype, fill_value))
+                self._write(npts, rt[delta:])
+            elif self.method == 1 and self.interpolation_samples >= -1:
+                ls_index = npts - delta - 1
+                if ls_index < 0:
+                    ls_index = 0
+                if self._is_masked(ls_index):
+                    self._add_fallback(trace)
+                    return
+                ls = buffer_[ls_index]
+                interpolation_samples = self.interpolation_samples
+                if interpolation_samples == -1 or \
+                        interpolation_samples > delta:
+                    interpolation_samples = delta
+                if interpolation_samples >= lenrt:
+                    # contained trace
+                    return
+                rs = rt[interpolation_samples]
+                # include left and right sample (delta + 2)
+                interpolation = np.linspace(ls, rs,
+                                            interpolation_samples + 2)
+                # cut ls and rs and ensure correct data type
+                interpolation = np.require(interpolation[1:-1], dtype)
+                self._write(index, interpolation)
+                self._write(index + interpolation_samples,
+                            rt[interpolation_samples:])
+            else:
+                raise NotImplementedError
+            self._npts = index + lenrt
+        elif contained:
+            # contained trace
+            end = index + lenrt
+            equal = buffer_[index:end] == rt
+            if mask is not None:
+                equal |= mask
+            if np.all(equal):
+                # fill in missing samples
+                if mask is not None:
+                    buffer_[index:end][mask] = rt[mask]
+                    self._mask[index:end] = False
+            elif self.method == 0:
+                self._write(index, create_empty_data_chunk(
+                    lenrt, dtype, fill_value))
+            elif self.method != 1:
+                raise NotImplementedError
+        else:
+            if delta > 0:
+                # gap
+                self._write(npts, create_empty_data_chunk(
+                    delta, dtype, fill_value))
+            self._write(index, rt)
+            self._npts = index + lenrt
+        self._dirty = True
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod(exclude_empty=True)
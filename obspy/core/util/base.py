@@ -15,6 +15,7 @@ from future.utils import PY2
 
 import builtins
 import doctest
+import functools
 import glob
 import inspect
 import io
@@ -24,6 +25,7 @@ import sys
 import tempfile
 import unicodedata
 from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 import pkg_resources
@@ -637,8 +639,40 @@ def download_to_file(url, filename_or_buffer, chunk_size=1024):
                 fh.write(chunk)
 
 
+def _parallel_map(func, iterable, workers=None, executor=None):
+    """
+    Apply a function to all items of an iterable, optionally in parallel.
+
+    Results are always returned in the order of the input items.
+
+    :type func: callable
+    :param func: Function to apply to each item.
+    :type iterable: iterable
+    :param iterable: Items to apply the function to.
+    :type workers: int
+    :param workers: Number of threads to use. ``None`` or ``1`` processes all
+        items sequentially in the calling thread.
+    :param executor: Pool object providing a ``map(func, iterable)`` method,
+        e.g. a :class:`multiprocessing.Pool` or a
+        :class:`concurrent.futures.Executor`. Takes precedence over
+        ``workers``. Note that for process based pools ``func`` has to be
+        picklable.
+    :rtype: list
+    """
+    if executor is not None:
+        return list(executor.map(func, iterable))
+    if workers is not None and workers > 1:
+        pool = ThreadPool(workers)
+        try:
+            return pool.map(func, iterable)
+        finally:
+            pool.close()
+            pool.join()
+    return [func(item) for item in iterable]
+
+
 def _generic_reader(pathname_or_url=None, callback_func=None,
-                    **kwargs):
+                    workers=None, executor=None, **kwargs):
     if not isinstance(pathname_or_url, (str, native_str)):
         # not a string - we assume a file-like object
         try:
@@ -675,6 +709,15 @@ def _generic_reader(pathname_or_url=None, callback_func=None,
             elif not glob.has_magic(pathname) and not os.path.isfile(pathname):
                 raise IOError(2, "No such file or directory", pathname)
 
+        if len(pathnames) > 1 and (workers or executor):
+            results = _parallel_map(
+                functools.partial(callback_func, **kwargs), pathnames,
+                workers=workers, executor=executor)
+            generic = results[0]
+            for result in results[1:]:
+                generic.extend(result)
+            return generic
+
         generic = callback_func(pathnames[0], **kwargs)
         if len(pathnames) > 1:
             for filename in pathnames[1:]:
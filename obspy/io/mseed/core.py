@@ -9,6 +9,7 @@ from future.utils import native_str
 
 import ctypes as C  # NOQA
 import io
+import mmap
 import os
 import warnings
 from struct import pack
@@ -145,7 +146,8 @@ def __is_mseed(fp, file_size):  # NOQA
 
 def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
                 sourcename=None, reclen=None, details=False,
-                header_byteorder=None, verbose=None, **kwargs):
+                header_byteorder=None, verbose=None, use_mmap=False,
+                **kwargs):
     """
     Reads a Mini-SEED file and returns a Stream object.
 
@@ -191,6 +193,13 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
         little-endian, ``1`` or ``'>'`` for MBF or big-endian. ``'='`` is the
         native byte order. Used to enforce the header byte order. Useful in
         some rare cases where the automatic byte order detection fails.
+    :type use_mmap: bool, optional
+    :param use_mmap: If ``True`` and a filename is given, the file is memory
+        mapped and libmseed parses the records directly from the mapping
+        instead of from a copy of the whole file in memory. Only the data of
+        the selected records are decoded into the resulting arrays, so this
+        considerably reduces peak memory usage for large files, especially in
+        combination with a time or ``sourcename`` selection.
 
     .. rubric:: Example
 
@@ -305,10 +314,17 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
     # Only keep information relevant for the whole file.
     info = {'filesize': info['filesize']}
 
+    mmap_ = None
     # If it's a file name just read it.
     if isinstance(mseed_object, (str, native_str)):
-        # Read to NumPy array which is used as a buffer.
-        bfr_np = np.fromfile(mseed_object, dtype=np.int8)
+        if use_mmap:
+            # Map file into memory, libmseed parses records in place.
+            with open(mseed_object, 'rb') as fh:
+                mmap_ = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            bfr_np = np.frombuffer(mmap_, dtype=np.int8)
+        else:
+            # Read to NumPy array which is used as a buffer.
+            bfr_np = np.fromfile(mseed_object, dtype=np.int8)
     elif hasattr(mseed_object, 'read'):
         bfr_np = from_buffer(mseed_object.read(), dtype=np.int8)
 
@@ -417,6 +433,16 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
     finally:
         # Make sure to reset the verbosity.
         clibmseed.verbose = True
+        # All data has been decoded to separate arrays, so the memory mapped
+        # file can be closed.
+        if mmap_ is not None:
+            del bfr_np
+            try:
+                mmap_.close()
+            except BufferError:
+                # still referenced somewhere, will be closed when garbage
+                # collected
+                pass
 
     del selections
 
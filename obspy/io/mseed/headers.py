@@ -8,6 +8,7 @@ from future.builtins import *  # NOQA
 from future.utils import native_str
 
 import ctypes as C  # NOQA
+import threading
 import warnings
 
 import numpy as np
@@ -786,44 +787,64 @@ class _LibmseedWrapper(object):
 
     Might be a bit overengineered but it does the trick and is completely
     transparent to the user.
+
+    libmseed's logging callbacks are global, so they are only hooked up once
+    and messages are collected per thread. This makes it safe to call into
+    libmseed from multiple threads at the same time (calls via ctypes release
+    the GIL, so decoding in different threads actually runs in parallel).
     """
     def __init__(self, lib):
         self.lib = lib
-        self.verbose = True
+        self._local = threading.local()
+        # Keep references to the callbacks, otherwise they get garbage
+        # collected while still being used by libmseed.
+        self._diag_print = \
+            C.CFUNCTYPE(None, C.c_char_p)(self._log_error_or_warning)
+        self._log_print = C.CFUNCTYPE(None, C.c_char_p)(self._log_message)
+        # Hookup libmseed's logging facilities to it's Python callbacks.
+        self.lib.setupLogging(self._diag_print, self._log_print)
+
+    @property
+    def verbose(self):
+        return getattr(self._local, "verbose", True)
+
+    @verbose.setter
+    def verbose(self, value):
+        self._local.verbose = value
+
+    def _log_error_or_warning(self, msg):
+        # Collect exceptions. They cannot be raised in the callback as
+        # they could never be caught then. They are collected and raised
+        # later on.
+        messages = getattr(self._local, "messages", None)
+        if not messages:
+            return
+        _errs, _warns = messages[-1]
+        msg = msg.decode()
+        if msg.startswith("ERROR: "):
+            msg = msg[7:].strip()
+            _errs.append(msg)
+        if msg.startswith("INFO: "):
+            msg = msg[6:].strip()
+            _warns.append(msg)
+
+    def _log_message(self, msg):
+        if self.verbose:
+            print(msg[6:].strip())
 
     def __getattr__(self, item):
         func = getattr(self.lib, item)
 
         def _wrapper(*args):
-            # Collect exceptions. They cannot be raised in the callback as
-            # they could never be caught then. They are collected and raised
-            # later on.
             _errs = []
             _warns = []
-
-            def log_error_or_warning(msg):
-                msg = msg.decode()
-                if msg.startswith("ERROR: "):
-                    msg = msg[7:].strip()
-                    _errs.append(msg)
-                if msg.startswith("INFO: "):
-                    msg = msg[6:].strip()
-                    _warns.append(msg)
-
-            diag_print = \
-                C.CFUNCTYPE(None, C.c_char_p)(log_error_or_warning)
-
-            def log_message(msg):
-                if self.verbose:
-                    print(msg[6:].strip())
-            log_print = C.CFUNCTYPE(None, C.c_char_p)(log_message)
-
-            # Hookup libmseed's logging facilities to it's Python callbacks.
-            self.lib.setupLogging(diag_print, log_print)
-
+            if not hasattr(self._local, "messages"):
+                self._local.messages = []
+            self._local.messages.append((_errs, _warns))
             try:
                 return func(*args)
             finally:
+                self._local.messages.pop()
                 for _w in _warns:
                     warnings.warn(_w, InternalMSEEDWarning)
                 if _errs:
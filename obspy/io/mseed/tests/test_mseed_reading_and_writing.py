@@ -718,6 +718,39 @@ class MSEEDReadingAndWritingTestCase(unittest.TestCase):
         tr2 = read(file2)[0]
         np.testing.assert_array_equal(tr1.data, tr2.data)
 
+    def test_read_with_mmap(self):
+        """
+        Reading from a memory mapped file has to give the same results as
+        reading the file into memory, also for all encodings and byte orders
+        and in combination with time and SEED id selections.
+        """
+        for filename in ('test.mseed', 'gaps.mseed', 'two_channels.mseed',
+                         'BW.BGLD.__.EHE.D.2008.001.first_10_records'):
+            file = os.path.join(self.path, 'data', filename)
+            st = read(file)
+            self.assertEqual(st, read(file, use_mmap=True))
+            self.assertEqual(
+                read(file, headonly=True),
+                read(file, headonly=True, use_mmap=True))
+            t1 = st[0].stats.starttime + 1
+            t2 = st[0].stats.starttime + 3
+            self.assertEqual(
+                read(file, starttime=t1, endtime=t2, sourcename=st[0].id),
+                read(file, starttime=t1, endtime=t2, sourcename=st[0].id,
+                     use_mmap=True))
+        file = os.path.join(self.path, "data",
+                            "BW.BGLD.__.EHE.D.2008.001.second_record")
+        tr = read(file)[0]
+        for byteorder in ('<', '>'):
+            for encoding, dtype in ((1, "i2"), (3, "i4"), (4, "f4"),
+                                    (5, "f8"), (11, "i4")):
+                tr.data = tr.data.astype(native_str(dtype))
+                with NamedTemporaryFile() as tf:
+                    tr.write(tf.name, format="MSEED", encoding=encoding,
+                             reclen=256, byteorder=byteorder)
+                    st = read(tf.name, use_mmap=True)
+                np.testing.assert_array_equal(st[0].data, tr.data)
+
     def test_read_with_gse2_option(self):
         """
         Test that reading will still work if wrong option (of gse2)
@@ -17,7 +17,7 @@ import warnings
 
 import numpy as np
 
-from obspy import UTCDateTime
+from obspy import UTCDateTime, read
 from obspy.core import Stream, Trace
 from obspy.core.util import NamedTemporaryFile
 from obspy.io.mseed import util
@@ -548,6 +548,52 @@ class MSEEDUtilTestCase(unittest.TestCase):
             self.assertEqual(start, stream[0].stats.starttime)
             self.assertEqual(end, stream[0].stats.endtime)
 
+    def test_iter_records_and_traces(self):
+        """
+        Tests iterating over records and chunks of records gives the same
+        data as reading the full files.
+        """
+        def _summary(st):
+            st = st.copy()
+            st.merge(-1)
+            st.sort()
+            return [(tr.id, tr.stats.starttime, tr.stats.sampling_rate,
+                     tr.stats.npts, tr.data.tolist()) for tr in st]
+
+        mseed_filenames = ['BW.BGLD.__.EHE.D.2008.001.first_10_records',
+                           'fullseed.mseed', 'gaps.mseed',
+                           'two_channels.mseed', 'various_noise_records.mseed',
+                           'single_record_plus_noise_record.mseed']
+        for _i in mseed_filenames:
+            filename = os.path.join(self.path, 'data', _i)
+            stream = _read_mseed(filename)
+            expected = _summary(stream)
+            records = list(util.iter_records(filename, chunk_size=512))
+            self.assertEqual(
+                len(records),
+                sum(tr.stats.mseed.number_of_records for tr in stream))
+            self.assertEqual(_summary(Stream(traces=records)), expected)
+            for chunk_size in (256, 1000, 2 ** 20):
+                with open(filename, 'rb') as fh:
+                    chunks = list(util.iter_traces(fh, chunk_size=chunk_size))
+                self.assertEqual(_summary(sum(chunks, Stream())), expected)
+            # time and SEED id selection
+            tr = stream[0]
+            t1 = tr.stats.starttime + 0.5 * (tr.stats.endtime -
+                                             tr.stats.starttime)
+            t2 = t1 + 1
+            expected = _summary(read(filename, starttime=t1, endtime=t2,
+                                     sourcename=tr.id))
+            chunks = list(util.iter_traces(
+                filename, starttime=t1, endtime=t2, sourcename=tr.id,
+                chunk_size=1000))
+            self.assertEqual(_summary(sum(chunks, Stream())), expected)
+            for tr_ in util.iter_records(filename, starttime=t1, endtime=t2,
+                                         sourcename=tr.id):
+                self.assertEqual(tr_.id, tr.id)
+                self.assertLessEqual(tr_.stats.starttime, t2)
+                self.assertGreaterEqual(tr_.stats.endtime, t1)
+
     def test_get_timing_quality(self):
         """
         This test reads a self-made Mini-SEED file with Timing Quality
@@ -9,6 +9,8 @@ from future.utils import native_str
 
 import collections
 import ctypes as C  # NOQA
+import fnmatch
+import io
 import os
 import sys
 import warnings
@@ -25,7 +27,7 @@ from .headers import (ENCODINGS, ENDIAN, FIXED_HEADER_ACTIVITY_FLAGS,
                       FIXED_HEADER_DATA_QUAL_FLAGS,
                       FIXED_HEADER_IO_CLOCK_FLAGS, HPTMODULUS,
                       SAMPLESIZES, UNSUPPORTED_ENCODINGS, MSRecord,
-                      MS_NOERROR, clibmseed)
+                      MS_NOERROR, VALID_RECORD_LENGTHS, clibmseed)
 
 
 def get_start_and_end_time(file_or_file_object):
@@ -548,6 +550,270 @@ def get_record_information(file_or_file_object, offset=0, endian=None):
     return info
 
 
+def iter_records(file_or_file_object, starttime=None, endtime=None,
+                 sourcename=None, headonly=False, chunk_size=2 ** 20,
+                 **kwargs):
+    """
+    Iterates over the records of a MiniSEED file, decoding one record at a
+    time.
+
+    The file is read in chunks of ``chunk_size`` bytes, so memory usage stays
+    bounded independent of the file size. Records that do not match the time
+    window or SEED id selection are skipped without decoding them.
+
+    :type file_or_file_object: str or file
+    :param file_or_file_object: MiniSEED file name or open file-like object.
+    :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+    :param starttime: Only yield records with data after or at this time.
+    :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+    :param endtime: Only yield records with data before or at this time.
+    :type sourcename: str
+    :param sourcename: Only yield records with matching SEED ID (can contain
+        wildcards "?" and "*", e.g. "BW.UH2.*" or "*.??Z").
+    :type headonly: bool
+    :param headonly: Only decode the headers of the records.
+    :type chunk_size: int
+    :param chunk_size: Number of bytes to read from the file at once.
+    :param kwargs: Additional kwargs are passed on to
+        :func:`~obspy.io.mseed.core._read_mseed`, e.g. ``details``.
+    :rtype: generator of :class:`~obspy.core.trace.Trace`
+    :returns: One trace per data record. Traces are not trimmed to the
+        requested time window.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.util import get_example_file
+    >>> filename = get_example_file(
+    ...     "BW.BGLD.__.EHE.D.2008.001.first_10_records")
+    >>> for tr in iter_records(filename):  # doctest: +ELLIPSIS
+    ...     print(tr)
+    BW.BGLD..EHE | 2007-12-31T23:59:59.915000Z - ... | 200.0 Hz, 412 samples
+    BW.BGLD..EHE | 2008-01-01T00:00:01.975000Z - ... | 200.0 Hz, 412 samples
+    ...
+    BW.BGLD..EHE | 2008-01-01T00:00:18.455000Z - ... | 200.0 Hz, 412 samples
+    """
+    from .core import _read_mseed
+    for buffer_, records in _iter_record_chunks(
+            file_or_file_object, chunk_size=chunk_size,
+            starttime=starttime, endtime=endtime, sourcename=sourcename):
+        for offset, reclen in records:
+            with io.BytesIO(buffer_[offset:offset + reclen].tobytes()) as buf:
+                st = _read_mseed(buf, headonly=headonly, **kwargs)
+            for tr in st:
+                yield tr
+
+
+def iter_traces(file_or_file_object, starttime=None, endtime=None,
+                sourcename=None, headonly=False, chunk_size=2 ** 20,
+                nearest_sample=True, **kwargs):
+    """
+    Iterates over a MiniSEED file in chunks, decoding many records at a time.
+
+    The file is read and decoded in chunks of (about) ``chunk_size`` bytes,
+    only complete records are decoded together. Each chunk is returned as a
+    :class:`~obspy.core.stream.Stream` with contiguous records merged into
+    one trace, so memory usage stays bounded independent of the file size
+    while keeping the decoding overhead per record low. Traces of subsequent
+    chunks can be seamlessly merged again.
+
+    :type file_or_file_object: str or file
+    :param file_or_file_object: MiniSEED file name or open file-like object.
+    :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+    :param starttime: Only return data after or at this time.
+    :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+    :param endtime: Only return data before or at this time.
+    :type sourcename: str
+    :param sourcename: Only return data with matching SEED ID (can contain
+        wildcards "?" and "*", e.g. "BW.UH2.*" or "*.??Z").
+    :type headonly: bool
+    :param headonly: Only decode the headers of the records.
+    :type chunk_size: int
+    :param chunk_size: Number of bytes to read from the file at once.
+    :type nearest_sample: bool
+    :param nearest_sample: Only applied if ``starttime`` or ``endtime`` is
+        given. See :meth:`~obspy.core.trace.Trace.trim`.
+    :param kwargs: Additional kwargs are passed on to
+        :func:`~obspy.io.mseed.core._read_mseed`, e.g. ``details``.
+    :rtype: generator of :class:`~obspy.core.stream.Stream`
+
+    .. rubric:: Example
+
+    >>> from obspy.core.util import get_example_file
+    >>> filename = get_example_file(
+    ...     "BW.BGLD.__.EHE.D.2008.001.first_10_records")
+    >>> for st in iter_traces(filename, chunk_size=2048):
+    ...     print(st)  # doctest: +ELLIPSIS
+    1 Trace(s) in Stream:
+    BW.BGLD..EHE | 2007-12-31T23:59:59.915000Z - ... | 200.0 Hz, 1648 samples
+    1 Trace(s) in Stream:
+    BW.BGLD..EHE | 2008-01-01T00:00:08.155000Z - ... | 200.0 Hz, 1648 samples
+    1 Trace(s) in Stream:
+    BW.BGLD..EHE | 2008-01-01T00:00:16.395000Z - ... | 200.0 Hz, 824 samples
+    """
+    from .core import _read_mseed
+    for buffer_, records in _iter_record_chunks(
+            file_or_file_object, chunk_size=chunk_size,
+            starttime=starttime, endtime=endtime, sourcename=sourcename):
+        data = b"".join(buffer_[offset:offset + reclen].tobytes()
+                        for offset, reclen in records)
+        with io.BytesIO(data) as buf:
+            st = _read_mseed(buf, headonly=headonly, **kwargs)
+        if not headonly:
+            if starttime is not None:
+                st._ltrim(starttime, nearest_sample=nearest_sample)
+            if endtime is not None:
+                st._rtrim(endtime, nearest_sample=nearest_sample)
+        if st:
+            yield st
+
+
+def _iter_record_chunks(file_or_file_object, chunk_size=2 ** 20,
+                        starttime=None, endtime=None, sourcename=None):
+    """
+    Reads a MiniSEED file chunk by chunk and yields buffers with complete
+    data records together with the ``(offset, record_length)`` of all records
+    in the buffer that match the given selection.
+
+    Non-data records (e.g. full SEED control headers) and garbage in between
+    records are skipped.
+    """
+    if isinstance(file_or_file_object, (str, native_str)):
+        with open(file_or_file_object, "rb") as fh:
+            for chunk in _iter_record_chunks(
+                    fh, chunk_size=chunk_size, starttime=starttime,
+                    endtime=endtime, sourcename=sourcename):
+                yield chunk
+        return
+
+    if starttime is not None:
+        starttime = _convert_datetime_to_mstime(starttime)
+    if endtime is not None:
+        endtime = _convert_datetime_to_mstime(endtime)
+
+    fh = file_or_file_object
+    data = b""
+    eof = False
+    while True:
+        if not eof:
+            new_data = fh.read(chunk_size)
+            eof = not new_data
+            data += new_data
+        buffer_ = from_buffer(data, dtype=np.int8)
+        records = _get_record_index(buffer_)
+        if records:
+            selected = []
+            for offset, reclen, start, end, _, _, seed_id in records:
+                if starttime is not None and end < starttime:
+                    continue
+                if endtime is not None and start > endtime:
+                    continue
+                if sourcename is not None and \
+                        not fnmatch.fnmatch(seed_id, sourcename):
+                    continue
+                selected.append((offset, reclen))
+            if selected:
+                yield buffer_, selected
+            data = data[records[-1][0] + records[-1][1]:]
+            continue
+        if len(data) < 48:
+            if eof:
+                break
+            continue
+        # No complete record at start of buffer. Either we need more data or
+        # there is something else than a data record.
+        reclen = clibmseed.ms_detect(buffer_[:VALID_RECORD_LENGTHS[-1]],
+                                     min(len(buffer_),
+                                         VALID_RECORD_LENGTHS[-1]))
+        if reclen < 0 or 0 < reclen <= len(data):
+            # Not a data record (or an invalid one), skip minimal number of
+            # bytes of a record and try again.
+            data = data[128:]
+        elif eof:
+            msg = ("Last record only has %i byte(s) which is not enough to "
+                   "constitute a full record. Record will be skipped.") % (
+                len(data))
+            warnings.warn(msg)
+            break
+
+
+def _get_record_index(buffer_, offset=0):
+    """
+    Scans the headers of all MiniSEED data records in a buffer with libmseed
+    without unpacking any data samples.
+
+    Scanning stops at the first position that does not hold a complete and
+    valid data record, so e.g. a partially written record at the end of a file
+    that is still being written to is not included.
+
+    :type buffer_: :class:`numpy.ndarray` of dtype ``int8``
+    :param buffer_: Buffer with (a part of) a MiniSEED file.
+    :type offset: int
+    :param offset: Byte offset in the buffer at which to start scanning.
+    :rtype: list of tuples
+    :returns: One ``(offset, record_length, starttime, endtime,
+        sampling_rate, npts, seed_id)`` tuple per record. Start and end time
+        (time of the last sample) are in integer microseconds since epoch
+        (libmseed high precision time).
+    """
+    records = []
+    msr = clibmseed.msr_init(C.POINTER(MSRecord)())
+    try:
+        while True:
+            record = buffer_[offset: offset + VALID_RECORD_LENGTHS[-1]]
+            if len(record) < 48:
+                break
+            retcode = clibmseed.msr_parse(record, len(record), C.pointer(msr),
+                                          -1, 0, 0)
+            if retcode != MS_NOERROR:
+                break
+            m = msr.contents
+            seed_id = ".".join(
+                _decode_header_field(name, getattr(m, name))
+                for name in ("network", "station", "location", "channel"))
+            records.append((offset, m.reclen, clibmseed.msr_starttime(msr),
+                            clibmseed.msr_endtime(msr), m.samprate,
+                            m.samplecnt, seed_id))
+            offset += m.reclen
+    finally:
+        # Free memory allocated by libmseed.
+        clibmseed.msr_free(C.pointer(msr))
+    return records
+
+
+def _scan_records(buffer_, offset=0):
+    """
+    Index all MiniSEED data records in a buffer.
+
+    Like when reading a file, anything that is not a data record (e.g.
+    garbage or non-data records) is skipped in steps of the minimum record
+    length. Scanning stops at an incomplete record at the end of the buffer,
+    e.g. of a file that is still being written to.
+
+    :rtype: tuple
+    :returns: List of records as returned by :func:`_get_record_index` and
+        the position up to which the buffer was scanned.
+    """
+    records = []
+    while offset < len(buffer_):
+        new_records = _get_record_index(buffer_, offset=offset)
+        if new_records:
+            records.extend(new_records)
+            offset = new_records[-1][0] + new_records[-1][1]
+        remaining = len(buffer_) - offset
+        if remaining < 48:
+            break
+        reclen = clibmseed.ms_detect(
+            buffer_[offset:offset + VALID_RECORD_LENGTHS[-1]],
+            min(remaining, VALID_RECORD_LENGTHS[-1]))
+        if not (reclen < 0 or 0 < reclen <= remaining):
+            # incomplete record at the end
+            break
+        # not a data record (or an invalid one), skip the minimal number of
+        # bytes of a record and try again
+        offset += 128
+    return records, min(offset, len(buffer_))
+
+
 def _decode_header_field(name, content):
     """
     Helper function to decode header fields. Fairly fault tolerant and it
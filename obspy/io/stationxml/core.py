@@ -125,14 +125,21 @@ def validate_stationxml(path_or_object):
     return (True, ())
 
 
-def _read_stationxml(path_or_file_object):
+def _read_stationxml(path_or_file_object, lazy_responses=False):
     """
     Function reading a StationXML file.
 
     :param path_or_file_object: File name or file like object.
+    :type lazy_responses: bool
+    :param lazy_responses: If ``True``, the responses of all channels are
+        only kept as serialized XML while reading and are converted to
+        :class:`~obspy.core.inventory.response.Response` objects on first
+        access of the
+        :attr:`~obspy.core.inventory.channel.Channel.response` attribute of a
+        channel. This makes reading response level StationXML files a lot
+        faster and less memory hungry if only few of the responses are
+        actually needed, e.g. if mostly coordinates are used.
     """
-    root = etree.parse(path_or_file_object).getroot()
-
     # Fix the namespace as its not always the default namespace. Will need
     # to be adjusted if the StationXML format gets another revision!
     namespace = "http://www.fdsn.org/xml/station/1"
@@ -140,6 +147,21 @@ def _read_stationxml(path_or_file_object):
     def _ns(tagname):
         return "{%s}%s" % (namespace, tagname)
 
+    if lazy_responses:
+        # Serialize and drop all responses while parsing so the bulky
+        # response stages never exist as a full element tree.
+        response_loaders = {}
+        context = etree.iterparse(path_or_file_object, events=("end", ),
+                                  tag=_ns("Response"))
+        for _, element in context:
+            response_loaders[element] = _LazyResponse(
+                etree.tostring(element, with_tail=False), namespace)
+            element.clear()
+        root = context.root
+    else:
+        response_loaders = None
+        root = etree.parse(path_or_file_object).getroot()
+
     # Source and Created field must exist in a StationXML.
     source = root.find(_ns("Source")).text
     created = obspy.UTCDateTime(root.find(_ns("Created")).text)
@@ -151,7 +173,8 @@ def _read_stationxml(path_or_file_object):
 
     networks = []
     for network in root.findall(_ns("Network")):
-        networks.append(_read_network(network, _ns))
+        networks.append(_read_network(network, _ns,
+                                      response_loaders=response_loaders))
 
     inv = obspy.core.inventory.Inventory(networks=networks, source=source,
                                          sender=sender, created=created,
@@ -190,7 +213,7 @@ def _read_base_node(element, object_to_write_to, _ns):
     _read_extra(element, object_to_write_to)
 
 
-def _read_network(net_element, _ns):
+def _read_network(net_element, _ns, response_loaders=None):
     network = obspy.core.inventory.Network(net_element.get("code"))
     _read_base_node(net_element, network, _ns)
     network.total_number_of_stations = \
@@ -199,12 +222,13 @@ def _read_network(net_element, _ns):
         _tag2obj(net_element, _ns("SelectedNumberStations"), int)
     stations = []
     for station in net_element.findall(_ns("Station")):
-        stations.append(_read_station(station, _ns))
+        stations.append(_read_station(station, _ns,
+                                      response_loaders=response_loaders))
     network.stations = stations
     return network
 
 
-def _read_station(sta_element, _ns):
+def _read_station(sta_element, _ns, response_loaders=None):
     longitude = _read_floattype(sta_element, _ns("Longitude"), Longitude,
                                 datum=True)
     latitude = _read_floattype(sta_element, _ns("Latitude"), Latitude,
@@ -238,7 +262,8 @@ def _read_station(sta_element, _ns):
         # Skip empty channels.
         if not channel.items() and not channel.attrib:
             continue
-        cha = _read_channel(channel, _ns)
+        cha = _read_channel(channel, _ns,
+                            response_loaders=response_loaders)
         # Might be None in case the channel could not be parsed.
         if cha is None:
             # This is None if, and only if, one of the coordinates could not
@@ -307,11 +332,15 @@ def _read_floattype_list(parent, tag, cls, unit=False, datum=False,
     return objs
 
 
-def _read_channel(cha_element, _ns):
+def _read_channel(cha_element, _ns, response_loaders=None):
     """
     Returns either a :class:`~obspy.core.inventory.channel.Channel` object or
     ``None``.
 
+    If ``response_loaders`` (a dictionary mapping response elements to
+    :class:`_LazyResponse` objects) is given, the response is only parsed on
+    first access.
+
     It should return ``None`` if and only if it did not manage to
     successfully create a :class:`~obspy.core.inventory.channel.Channel`
     object which can only happen if one of the coordinates is not set. All the
@@ -387,11 +416,36 @@ def _read_channel(cha_element, _ns):
     # Finally parse the response.
     response = cha_element.find(_ns("Response"))
     if response is not None:
-        channel.response = _read_response(response, _ns)
-        channel.response._attempt_to_fix_units()
+        if response_loaders is not None:
+            channel._set_lazy_response(response_loaders[response])
+        else:
+            channel.response = _read_response(response, _ns)
+            channel.response._attempt_to_fix_units()
     return channel
 
 
+class _LazyResponse(object):
+    """
+    Picklable loader creating a response from its serialized StationXML
+    element, see
+    :meth:`Channel._set_lazy_response()
+    <obspy.core.inventory.channel.Channel._set_lazy_response>`.
+    """
+    def __init__(self, xml, namespace):
+        self.xml = xml
+        self.namespace = namespace
+
+    def __call__(self):
+        namespace = self.namespace
+
+        def _ns(tagname):
+            return "{%s}%s" % (namespace, tagname)
+
+        response = _read_response(etree.fromstring(self.xml), _ns)
+        response._attempt_to_fix_units()
+        return response
+
+
 def _read_response(resp_element, _ns):
     response = obspy.core.inventory.response.Response()
     response.resource_id = resp_element.attrib.get('resourceId')
@@ -17,6 +17,7 @@ import fnmatch
 import inspect
 import io
 import os
+import pickle
 import re
 import unittest
 import warnings
@@ -661,6 +662,34 @@ class StationXMLTestCase(unittest.TestCase):
         # Assert that there are three stages.
         self.assertEqual(len(response.response_stages), 3)
 
+    def test_reading_with_lazy_responses(self):
+        """
+        Tests that responses read with lazy_responses=True are only created
+        on first access and are equal to responses read directly.
+        """
+        for name in ("IRIS_single_channel_with_response.xml",
+                     "IRIS_single_channel_with_response_custom_tags.xml",
+                     "full_random_stationxml.xml"):
+            filename = os.path.join(self.data_dir, name)
+            inv = obspy.read_inventory(filename)
+            inv_lazy = obspy.read_inventory(filename, lazy_responses=True)
+            channels = [cha for net in inv_lazy for sta in net for cha in sta]
+            for cha in channels:
+                self.assertIsNone(cha._response)
+            # pickling and copying does not create the responses
+            inv_copy = pickle.loads(pickle.dumps(inv_lazy, protocol=2))
+            inv_deepcopy = inv_lazy.copy()
+            for cha in channels:
+                self.assertIsNone(cha._response)
+            self.assertEqual(inv_lazy, inv)
+            self.assertEqual(inv_copy, inv)
+            self.assertEqual(inv_deepcopy, inv)
+        # a replaced response is not overwritten by the lazily read one
+        inv = obspy.read_inventory(filename, lazy_responses=True)
+        channel = inv[0][0][0]
+        channel.response = None
+        self.assertIsNone(channel.response)
+
     def test_stationxml_with_availability(self):
         """
         A variant of StationXML has support for availability information.
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Module for handling ObsPy RingBuffer objects.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import numpy as np
+
+
+class RingBuffer(object):
+    """
+    Fixed capacity buffer keeping the most recent samples of a data stream.
+
+    Appending samples never reallocates memory. The samples are stored in a
+    preallocated array of twice the capacity, so that the buffered samples
+    are always contiguous and can be accessed as a view without copying.
+    Only when the end of the array is reached, the most recent samples are
+    moved to its start, which happens at most once per ``capacity`` appended
+    samples.
+
+    >>> import numpy as np
+    >>> from obspy.realtime.ringbuffer import RingBuffer
+    >>> buffer = RingBuffer(5, np.int32)
+    >>> buffer.append(np.arange(3, dtype=np.int32))
+    0
+    >>> buffer.append(np.arange(3, 7, dtype=np.int32))
+    2
+    >>> buffer.view()
+    array([2, 3, 4, 5, 6], dtype=int32)
+    >>> buffer.view(2)
+    array([5, 6], dtype=int32)
+
+    :type capacity: int
+    :param capacity: Maximum number of samples kept in the buffer.
+    :type dtype: numpy.dtype
+    :param dtype: Data type of the samples.
+    """
+    def __init__(self, capacity, dtype):
+        if capacity <= 0:
+            raise ValueError("Input capacity out of bounds: %s" % capacity)
+        self.capacity = int(capacity)
+        self._buffer = np.empty(2 * self.capacity, dtype=dtype)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def dtype(self):
+        return self._buffer.dtype
+
+    def clear(self):
+        """
+        Remove all samples from the buffer.
+        """
+        self._start = 0
+        self._end = 0
+
+    def append(self, data):
+        """
+        Append samples and drop the oldest samples exceeding the capacity.
+
+        :type data: numpy.ndarray
+        :param data: Samples to append, will be cast to the data type of the
+            buffer.
+        :rtype: int
+        :return: Number of samples dropped from the start of the buffer.
+        """
+        data = np.asarray(data)
+        npts = data.size
+        old_length = self._end - self._start
+        if npts >= self.capacity:
+            # new data replaces all buffered samples
+            self._buffer[:self.capacity] = data[npts - self.capacity:]
+            self._start = 0
+            self._end = self.capacity
+            return old_length + npts - self.capacity
+        if self._end + npts > self._buffer.size:
+            # move the samples still needed to the start of the buffer, source
+            # and destination never overlap because npts < capacity
+            keep = min(old_length, self.capacity - npts)
+            self._buffer[:keep] = self._buffer[self._end - keep:self._end]
+            self._start = 0
+            self._end = keep
+        self._buffer[self._end:self._end + npts] = data
+        self._end += npts
+        self._start = max(self._start, self._end - self.capacity)
+        return old_length + npts - (self._end - self._start)
+
+    def view(self, npts=None):
+        """
+        Return a view of the most recent samples without copying them.
+
+        The view is only valid until the next call to :meth:`append`.
+
+        :type npts: int, optional
+        :param npts: Number of most recent samples to return. Defaults to all
+            buffered samples.
+        :rtype: numpy.ndarray
+        """
+        start = self._start
+        if npts is not None:
+            start = max(start, self._end - max(int(npts), 0))
+        return self._buffer[start:self._end]
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
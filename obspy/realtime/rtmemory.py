@@ -61,15 +61,20 @@ class RtMemory:
         :return: NumPy :class:`~numpy.ndarray` object containing updated
             memory array (input or output).
         """
-        if data.size >= np.size(memory_array):
+        # the memory array is updated in place, so that no new arrays need to
+        # be allocated for every processed packet
+        size = np.size(memory_array)
+        if size == 0:
+            return memory_array
+        if data.size >= size:
             # data length greater than or equal to memory length
-            memory_array = data[np.size(data) - np.size(memory_array):]
+            memory_array[:] = data[data.size - size:]
         else:
             # data length less than memory length
             # shift memory
-            memory_array = memory_array[data.size:]
+            memory_array[:size - data.size] = memory_array[data.size:]
             # append data
-            memory_array = np.concatenate((memory_array, data))
+            memory_array[size - data.size:] = data
         return memory_array
 
     def update_output(self, data):
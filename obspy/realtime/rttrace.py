@@ -21,6 +21,7 @@ from obspy import Trace
 from obspy.core import Stats
 from obspy.realtime import signal
 from obspy.realtime.rtmemory import RtMemory
+from obspy.realtime.ringbuffer import RingBuffer
 
 
 # dictionary to map given type-strings to processing functions keys must be all
@@ -34,6 +35,12 @@ REALTIME_PROCESS_FUNCTIONS = {
     'tauc': (signal.tauc, 2),
     'mwpintegral': (signal.mwpintegral, 1),
     'kurtosis': (signal.kurtosis, 3),
+    'bandpass': (signal.bandpass, 1),
+    'lowpass': (signal.lowpass, 1),
+    'highpass': (signal.highpass, 1),
+    'recursive_sta_lta': (signal.recursive_sta_lta, 1),
+    'detrend': (signal.detrend, 1),
+    'taper': (signal.taper, 1),
 }
 
 
@@ -47,7 +54,9 @@ class RtTrace(Trace):
     left trimmed to maintain a specified maximum trace length.
 
     :type max_length: int, optional
-    :param max_length: maximum trace length in seconds
+    :param max_length: maximum trace length in seconds. If given, the data is
+        kept in a preallocated :class:`~obspy.realtime.ringbuffer.RingBuffer`
+        and appending data does not reallocate the whole trace.
 
     .. rubric:: Example
 
@@ -112,6 +121,8 @@ class RtTrace(Trace):
         8.78902911791...
     """
     have_appended_data = False
+    _ring_buffer = None
+    _ring_buffer_data = None
 
     @classmethod
     def rt_process_functions_to_string(cls):
@@ -261,7 +272,10 @@ class RtTrace(Trace):
                     print("%s: self.stats.starttime adjusted by: %gs"
                           % (self.__class__.__name__, diff -
                              self.stats.delta))
-        # first apply all registered processing to Trace
+        # first apply all registered processing to a copy of the Trace, one
+        # copy is enough as processing only modifies this copy
+        if self.processing:
+            trace = trace.copy()
         for proc in self.processing:
             process_name, options, rtmemory_list = proc
             # if gap or overlap, clear memory
@@ -269,7 +283,6 @@ class RtTrace(Trace):
                 for n in range(len(rtmemory_list)):
                     rtmemory_list[n] = RtMemory()
             # apply processing
-            trace = trace.copy()
             dtype = trace.data.dtype
             if hasattr(process_name, '__call__'):
                 # check if direct function call
@@ -287,6 +300,15 @@ class RtTrace(Trace):
             self.stats = Stats(header=trace.stats)
             self.have_appended_data = True
             return trace
+        # contiguous data of a trace with maximum length is simply added to
+        # the ring buffer, no need to reallocate the whole trace
+        if self.max_length is not None and not gap_or_overlap:
+            ring_buffer = self._get_ring_buffer()
+            dropped = ring_buffer.append(trace.data)
+            self._set_ring_buffer_data(ring_buffer)
+            if dropped:
+                self.stats.starttime += dropped * self.stats.delta
+            return trace
         # handle all following data sets
         # fix Trace.__add__ parameters
         # TODO: IMPORTANT? Should check for gaps and overlaps and handle
@@ -298,7 +320,7 @@ class RtTrace(Trace):
         self.data = sum_trace.data
         # left trim if data length exceeds max_length
         if self.max_length is not None:
-            max_samples = int(self.max_length * self.stats.sampling_rate + 0.5)
+            max_samples = self._get_max_samples()
             if np.size(self.data) > max_samples:
                 starttime = self.stats.starttime + \
                     (np.size(self.data) - max_samples) / \
@@ -307,6 +329,55 @@ class RtTrace(Trace):
                             fill_value=None)
         return trace
 
+    def _get_max_samples(self):
+        """
+        Return the maximum number of samples of this RtTrace.
+        """
+        return max(int(self.max_length * self.stats.sampling_rate + 0.5), 1)
+
+    def _get_ring_buffer(self):
+        """
+        Return the ring buffer holding the data of this RtTrace.
+
+        A new ring buffer is initialized with the current data if there is
+        none yet or if the data was replaced in the meantime.
+        """
+        ring_buffer = self._ring_buffer
+        if ring_buffer is None or self.data is not self._ring_buffer_data or \
+                self.data.base is not ring_buffer._buffer:
+            ring_buffer = RingBuffer(self._get_max_samples(), self.data.dtype)
+            dropped = ring_buffer.append(self.data)
+            if dropped:
+                self.stats.starttime += dropped * self.stats.delta
+            self._ring_buffer = ring_buffer
+        return ring_buffer
+
+    def _set_ring_buffer_data(self, ring_buffer):
+        """
+        Set the data of this RtTrace to a view of the given ring buffer.
+        """
+        self.data = ring_buffer.view()
+        self._ring_buffer_data = self.data
+
+    def latest(self, seconds):
+        """
+        Returns a Trace with the most recent data of this RtTrace.
+
+        The data of the returned trace is a view of the data of this RtTrace
+        and is not copied. It is only valid until data is appended again, so
+        copy it if it is needed for longer.
+
+        :type seconds: float
+        :param seconds: Length of the requested most recent data in seconds.
+        :rtype: :class:`~obspy.core.trace.Trace`
+        """
+        npts = int(seconds * self.stats.sampling_rate + 0.5)
+        npts = min(max(npts, 0), self.stats.npts)
+        header = self.stats.copy()
+        header.starttime += (self.stats.npts - npts) * self.stats.delta
+        header.npts = npts
+        return Trace(data=self.data[self.stats.npts - npts:], header=header)
+
     def register_rt_process(self, process, **options):
         """
         Adds real-time processing algorithm to processing list of this RtTrace.
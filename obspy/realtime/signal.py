@@ -26,11 +26,14 @@ from future.builtins import *  # NOQA
 
 import math
 import sys
+import warnings
 
 import numpy as np
+from scipy.signal import lfilter
 
 from obspy.core.trace import Trace, UTCDateTime
 from obspy.realtime.rtmemory import RtMemory
+from obspy.signal.filter import _get_butterworth_sos, sosfilt
 
 
 _PI = math.pi
@@ -635,3 +638,317 @@ def kurtosis(trace, win=3.0, rtmemory_list=None):
     rtmemory_k4_bar.input[0] = k4_bar_last
 
     return kappa4
+
+
+def _sosfilt(trace, sos, rtmemory_list):
+    """
+    Apply second-order sections filter keeping the filter state in memory.
+
+    The filter state is kept in the output array of the RtMemory object and
+    starts at rest, so that processing data packet by packet gives the same
+    result as filtering all data at once.
+    """
+    if not isinstance(trace, Trace):
+        msg = "trace parameter must be an obspy.core.trace.Trace object."
+        raise ValueError(msg)
+
+    if not rtmemory_list:
+        rtmemory_list = [RtMemory()]
+
+    sample = trace.data
+    if np.size(sample) < 1:
+        return sample
+
+    rtmemory = rtmemory_list[0]
+
+    # initialize memory object, two state values per section
+    if not rtmemory.initialized:
+        memory_size_input = 0
+        memory_size_output = 2 * len(sos)
+        rtmemory.initialize(np.float64, memory_size_input,
+                            memory_size_output, 0, 0)
+
+    zi = rtmemory.output.reshape(len(sos), 2)
+    new_sample, zf = sosfilt(sos, sample, zi=zi)
+    zi[:] = zf
+
+    return new_sample
+
+
+def bandpass(trace, freqmin, freqmax, corners=4, rtmemory_list=None):
+    """
+    Apply Butterworth bandpass filter to array data.
+
+    Streaming version of :func:`obspy.signal.filter.bandpass`, the filter
+    state is carried over to the next appended data.
+
+    :type trace: :class:`~obspy.core.trace.Trace`
+    :param trace:  :class:`~obspy.core.trace.Trace` object to append to this
+        RtTrace
+    :type freqmin: float
+    :param freqmin: Pass band low corner frequency.
+    :type freqmax: float
+    :param freqmax: Pass band high corner frequency.
+    :type corners: int, optional
+    :param corners: Filter corners / order (default is 4).
+    :type rtmemory_list: list of :class:`~obspy.realtime.rtmemory.RtMemory`,
+        optional
+    :param rtmemory_list: Persistent memory used by this process for specified
+        trace.
+    :rtype: NumPy :class:`numpy.ndarray`
+    :return: Processed trace data from appended Trace object.
+    """
+    fe = 0.5 * trace.stats.sampling_rate
+    low = freqmin / fe
+    high = freqmax / fe
+    # raise for some bad scenarios
+    if high - 1.0 > -1e-6:
+        msg = ("Selected high corner frequency ({}) of bandpass is at or "
+               "above Nyquist ({}). Applying a high-pass instead.").format(
+            freqmax, fe)
+        warnings.warn(msg)
+        return highpass(trace, freq=freqmin, corners=corners,
+                        rtmemory_list=rtmemory_list)
+    if low > 1:
+        msg = "Selected low corner frequency is above Nyquist."
+        raise ValueError(msg)
+    sos = _get_butterworth_sos(corners, [low, high], 'band')
+    return _sosfilt(trace, sos, rtmemory_list)
+
+
+def lowpass(trace, freq, corners=4, rtmemory_list=None):
+    """
+    Apply Butterworth lowpass filter to array data.
+
+    Streaming version of :func:`obspy.signal.filter.lowpass`, the filter
+    state is carried over to the next appended data.
+
+    :type trace: :class:`~obspy.core.trace.Trace`
+    :param trace:  :class:`~obspy.core.trace.Trace` object to append to this
+        RtTrace
+    :type freq: float
+    :param freq: Filter corner frequency.
+    :type corners: int, optional
+    :param corners: Filter corners / order (default is 4).
+    :type rtmemory_list: list of :class:`~obspy.realtime.rtmemory.RtMemory`,
+        optional
+    :param rtmemory_list: Persistent memory used by this process for specified
+        trace.
+    :rtype: NumPy :class:`numpy.ndarray`
+    :return: Processed trace data from appended Trace object.
+    """
+    fe = 0.5 * trace.stats.sampling_rate
+    f = freq / fe
+    # raise for some bad scenarios
+    if f > 1:
+        f = 1.0
+        msg = "Selected corner frequency is above Nyquist. " + \
+              "Setting Nyquist as high corner."
+        warnings.warn(msg)
+    sos = _get_butterworth_sos(corners, f, 'lowpass')
+    return _sosfilt(trace, sos, rtmemory_list)
+
+
+def highpass(trace, freq, corners=4, rtmemory_list=None):
+    """
+    Apply Butterworth highpass filter to array data.
+
+    Streaming version of :func:`obspy.signal.filter.highpass`, the filter
+    state is carried over to the next appended data.
+
+    :type trace: :class:`~obspy.core.trace.Trace`
+    :param trace:  :class:`~obspy.core.trace.Trace` object to append to this
+        RtTrace
+    :type freq: float
+    :param freq: Filter corner frequency.
+    :type corners: int, optional
+    :param corners: Filter corners / order (default is 4).
+    :type rtmemory_list: list of :class:`~obspy.realtime.rtmemory.RtMemory`,
+        optional
+    :param rtmemory_list: Persistent memory used by this process for specified
+        trace.
+    :rtype: NumPy :class:`numpy.ndarray`
+    :return: Processed trace data from appended Trace object.
+    """
+    fe = 0.5 * trace.stats.sampling_rate
+    f = freq / fe
+    # raise for some bad scenarios
+    if f > 1:
+        msg = "Selected corner frequency is above Nyquist."
+        raise ValueError(msg)
+    sos = _get_butterworth_sos(corners, f, 'highpass')
+    return _sosfilt(trace, sos, rtmemory_list)
+
+
+def recursive_sta_lta(trace, nsta, nlta, rtmemory_list=None):
+    """
+    Apply recursive STA/LTA to array data.
+
+    Streaming version of :func:`obspy.signal.trigger.recursive_sta_lta`, the
+    short and long time averages are carried over to the next appended data.
+
+    :type trace: :class:`~obspy.core.trace.Trace`
+    :param trace:  :class:`~obspy.core.trace.Trace` object to append to this
+        RtTrace
+    :type nsta: int
+    :param nsta: Length of short time average window in samples
+    :type nlta: int
+    :param nlta: Length of long time average window in samples
+    :type rtmemory_list: list of :class:`~obspy.realtime.rtmemory.RtMemory`,
+        optional
+    :param rtmemory_list: Persistent memory used by this process for specified
+        trace.
+    :rtype: NumPy :class:`numpy.ndarray`
+    :return: Processed trace data from appended Trace object.
+    """
+    if not isinstance(trace, Trace):
+        msg = "trace parameter must be an obspy.core.trace.Trace object."
+        raise ValueError(msg)
+
+    if not rtmemory_list:
+        rtmemory_list = [RtMemory()]
+
+    sample = trace.data
+    if np.size(sample) < 1:
+        return sample
+
+    rtmemory = rtmemory_list[0]
+
+    # initialize memory object, keeping sta, lta and number of samples
+    if not rtmemory.initialized:
+        memory_size_input = 0
+        memory_size_output = 3
+        rtmemory.initialize(np.float64, memory_size_input,
+                            memory_size_output, 0, 0)
+    sta_last, lta_last, count = rtmemory.output
+
+    sq = np.square(sample, dtype=np.float64)
+    if count == 0:
+        # the very first sample is not used, see recursive_sta_lta()
+        sq[0] = 0.0
+    csta = 1. / nsta
+    clta = 1. / nlta
+    sta = lfilter([csta], [1.0, csta - 1.0], sq,
+                  zi=[(1.0 - csta) * sta_last])[0]
+    lta = lfilter([clta], [1.0, clta - 1.0], sq,
+                  zi=[(1.0 - clta) * lta_last])[0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        new_sample = sta / lta
+    # no values during the first long time average window
+    new_sample[:max(int(nlta - count), 0)] = 0.0
+
+    rtmemory.output[:] = (sta[-1], lta[-1], count + np.size(sample))
+
+    return new_sample
+
+
+def detrend(trace, win=None, rtmemory_list=None):
+    """
+    Remove running mean from array data.
+
+    By default the mean of all data processed so far is removed. If ``win``
+    is given, an exponential running mean with a time constant of ``win``
+    seconds is removed instead, which follows slow drifts of the data.
+
+    :type trace: :class:`~obspy.core.trace.Trace`
+    :param trace:  :class:`~obspy.core.trace.Trace` object to append to this
+        RtTrace
+    :type win: float, optional
+    :param win: Time constant of the running mean in seconds (default is
+        ``None``, the mean of all data).
+    :type rtmemory_list: list of :class:`~obspy.realtime.rtmemory.RtMemory`,
+        optional
+    :param rtmemory_list: Persistent memory used by this process for specified
+        trace.
+    :rtype: NumPy :class:`numpy.ndarray`
+    :return: Processed trace data from appended Trace object.
+    """
+    if not isinstance(trace, Trace):
+        msg = "trace parameter must be an obspy.core.trace.Trace object."
+        raise ValueError(msg)
+
+    if not rtmemory_list:
+        rtmemory_list = [RtMemory()]
+
+    sample = trace.data
+    if np.size(sample) < 1:
+        return sample
+
+    rtmemory = rtmemory_list[0]
+
+    # initialize memory object, keeping sum (or mean) and number of samples
+    if not rtmemory.initialized:
+        memory_size_input = 0
+        memory_size_output = 2
+        rtmemory.initialize(np.float64, memory_size_input,
+                            memory_size_output, 0, 0)
+    last, count = rtmemory.output
+
+    sample = np.asarray(sample, dtype=np.float64)
+    if win is None:
+        sum_ = last + np.cumsum(sample)
+        mean = sum_ / np.arange(count + 1, count + np.size(sample) + 1)
+        rtmemory.output[:] = (sum_[-1], count + np.size(sample))
+    else:
+        c_1 = trace.stats.delta / float(win)
+        a1 = 1.0 - c_1
+        if count == 0:
+            # start the running mean at the first sample
+            last = sample[0]
+        mean = lfilter([c_1], [1.0, -a1], sample, zi=[a1 * last])[0]
+        rtmemory.output[:] = (mean[-1], count + np.size(sample))
+
+    return sample - mean
+
+
+def taper(trace, width, rtmemory_list=None):
+    """
+    Taper the beginning of the data stream.
+
+    The first ``width`` seconds of the data stream are multiplied with a
+    cosine ramp, e.g. to suppress the transient response of following
+    filters. As the memory is re-initialized after gaps or overlaps, the data
+    following a gap is tapered again.
+
+    :type trace: :class:`~obspy.core.trace.Trace`
+    :param trace:  :class:`~obspy.core.trace.Trace` object to append to this
+        RtTrace
+    :type width: float
+    :param width: Length of the taper in seconds.
+    :type rtmemory_list: list of :class:`~obspy.realtime.rtmemory.RtMemory`,
+        optional
+    :param rtmemory_list: Persistent memory used by this process for specified
+        trace.
+    :rtype: NumPy :class:`numpy.ndarray`
+    :return: Processed trace data from appended Trace object.
+    """
+    if not isinstance(trace, Trace):
+        msg = "trace parameter must be an obspy.core.trace.Trace object."
+        raise ValueError(msg)
+
+    if not rtmemory_list:
+        rtmemory_list = [RtMemory()]
+
+    sample = trace.data
+    if np.size(sample) < 1:
+        return sample
+
+    rtmemory = rtmemory_list[0]
+
+    # initialize memory object, keeping the number of samples
+    if not rtmemory.initialized:
+        memory_size_input = 0
+        memory_size_output = 1
+        rtmemory.initialize(np.float64, memory_size_input,
+                            memory_size_output, 0, 0)
+    count = int(rtmemory.output[0])
+    rtmemory.output[0] = count + np.size(sample)
+
+    npts = int(width * trace.stats.sampling_rate + 0.5)
+    if count >= npts:
+        return sample
+    index = np.arange(count, min(count + np.size(sample), npts))
+    new_sample = np.array(sample, dtype=np.float64)
+    new_sample[:len(index)] *= 0.5 * (1.0 - np.cos(np.pi * index / npts))
+
+    return new_sample
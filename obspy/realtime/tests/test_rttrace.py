@@ -16,6 +16,7 @@ from obspy import Trace
 from obspy.core.stream import read
 from obspy.realtime import RtTrace
 from obspy.realtime.rtmemory import RtMemory
+from obspy.realtime.ringbuffer import RingBuffer
 import obspy.signal.filter
 
 
@@ -174,6 +175,84 @@ class RtTraceTestCase(unittest.TestCase):
         for trace in traces:
             rtr.append(trace)
 
+    def test_append_max_length(self):
+        """
+        Data of a RtTrace with maximum length is kept in a ring buffer.
+        """
+        tr = read()[0]
+        rtr = RtTrace(max_length=10)
+        for trace in tr / 30:
+            rtr.append(trace)
+        # the result equals the trimmed input trace
+        expected = tr.slice(tr.stats.endtime - 10 + tr.stats.delta)
+        self.assertEqual(rtr.stats.npts, 1000)
+        self.assertEqual(rtr.stats.starttime, expected.stats.starttime)
+        self.assertEqual(rtr.stats.endtime, tr.stats.endtime)
+        np.testing.assert_array_equal(rtr.data, expected.data)
+        # appending does not reallocate the data
+        buffer = rtr._ring_buffer._buffer
+        rtr.append(Trace(data=np.ones(10, dtype=tr.data.dtype),
+                         header={'starttime': tr.stats.endtime +
+                                 tr.stats.delta, 'sampling_rate': 100.0,
+                                 'network': 'BW', 'station': 'RJOB',
+                                 'channel': 'EHZ'}))
+        self.assertIs(rtr.data.base, buffer)
+        self.assertEqual(rtr.stats.npts, 1000)
+        np.testing.assert_array_equal(rtr.data[-10:], 1)
+        np.testing.assert_array_equal(rtr.data[:-10], expected.data[10:])
+        # most recent data as view
+        latest = rtr.latest(0.5)
+        self.assertEqual(latest.stats.npts, 50)
+        self.assertEqual(latest.stats.endtime, rtr.stats.endtime)
+        self.assertIs(latest.data.base, buffer)
+        self.assertEqual(rtr.latest(100).stats.npts, 1000)
+        # replaced data is used for the next append
+        rtr.data = rtr.data[-20:].copy()
+        rtr.stats.starttime = rtr.stats.endtime - 19 * rtr.stats.delta
+        endtime = rtr.stats.endtime
+        rtr.append(Trace(data=np.zeros(10, dtype=tr.data.dtype),
+                         header={'starttime': endtime + tr.stats.delta,
+                                 'sampling_rate': 100.0, 'network': 'BW',
+                                 'station': 'RJOB', 'channel': 'EHZ'}))
+        self.assertEqual(rtr.stats.npts, 30)
+        np.testing.assert_array_equal(rtr.data[10:20], 1)
+        np.testing.assert_array_equal(rtr.data[20:], 0)
+
+    def test_ring_buffer(self):
+        """
+        Tests appending to a RingBuffer.
+        """
+        buffer = RingBuffer(4, np.float64)
+        self.assertEqual(len(buffer), 0)
+        expected = np.array([])
+        for i in range(1, 7):
+            data = np.arange(i, dtype=np.float64) + len(expected)
+            expected = np.concatenate((expected, data))
+            dropped = buffer.append(data)
+            self.assertEqual(dropped, max(len(expected) - 4, 0) -
+                             max(len(expected) - len(data) - 4, 0))
+            np.testing.assert_array_equal(buffer.view(), expected[-4:])
+            np.testing.assert_array_equal(buffer.view(2), expected[-2:])
+        self.assertEqual(len(buffer), 4)
+        buffer.clear()
+        self.assertEqual(len(buffer), 0)
+        self.assertRaises(ValueError, RingBuffer, 0, np.float64)
+
+    def test_rtmemory_update_in_place(self):
+        """
+        RtMemory arrays are updated without reallocation.
+        """
+        memory = RtMemory()
+        memory.initialize(np.float64, 3, 0)
+        array = memory.input
+        memory.update_input(np.array([1.0, 2.0]))
+        np.testing.assert_array_equal(memory.input, [0.0, 1.0, 2.0])
+        memory.update_input(np.array([3.0, 4.0, 5.0, 6.0]))
+        np.testing.assert_array_equal(memory.input, [4.0, 5.0, 6.0])
+        self.assertIs(memory.input, array)
+        memory.update_output(np.array([1.0]))
+        self.assertEqual(memory.output.size, 0)
+
     def test_missing_or_wrong_argument_in_rt_process(self):
         """
         Tests handling of missing/wrong arguments.
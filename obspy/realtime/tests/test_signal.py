@@ -14,6 +14,8 @@ import numpy as np
 from obspy import read
 from obspy.core.stream import Stream
 from obspy.realtime import RtTrace, signal
+from obspy.signal.filter import bandpass, highpass, lowpass
+from obspy.signal.trigger import recursive_sta_lta
 
 
 # some debug flags
@@ -230,6 +232,86 @@ class RealTimeSignalTestCase(unittest.TestCase):
         np.testing.assert_almost_equal(self.filt_trace_data,
                                        self.rt_trace.data)
 
+    def test_butterworth_filters(self):
+        """
+        Testing streaming bandpass, lowpass and highpass filters.
+        """
+        df = self.orig_trace.stats.sampling_rate
+        for process, options, func in (
+                ('bandpass', {'freqmin': 0.01, 'freqmax': 1.0}, bandpass),
+                ('lowpass', {'freq': 0.5, 'corners': 2}, lowpass),
+                ('highpass', {'freq': 0.05}, highpass)):
+            trace = self.orig_trace.copy()
+            # filtering manual
+            self.filt_trace_data = func(trace.data, df=df, **options)
+            # filtering real time
+            process_list = [(process, options)]
+            self._run_rt_process(process_list)
+            # check results
+            np.testing.assert_allclose(self.filt_trace_data,
+                                       self.rt_trace.data, rtol=1e-10,
+                                       atol=1e-10 * np.abs(trace.data).max())
+
+    def test_recursive_sta_lta(self):
+        """
+        Testing streaming recursive STA/LTA.
+        """
+        trace = self.orig_trace.copy()
+        options = {'nsta': 50, 'nlta': 500}
+        # filtering manual
+        self.filt_trace_data = recursive_sta_lta(trace.data, **options)
+        # filtering real time
+        process_list = [('recursive_sta_lta', options)]
+        self._run_rt_process(process_list)
+        # check results
+        np.testing.assert_allclose(self.filt_trace_data,
+                                   self.rt_trace.data, rtol=1e-8)
+
+    def test_detrend(self):
+        """
+        Testing streaming removal of the running mean.
+        """
+        trace = self.orig_trace.copy()
+        # filtering manual
+        npts = np.arange(1, len(trace) + 1)
+        self.filt_trace_data = trace.data - np.cumsum(trace.data) / npts
+        # filtering real time
+        process_list = [('detrend', {})]
+        self._run_rt_process(process_list)
+        # check results
+        np.testing.assert_allclose(self.filt_trace_data,
+                                   self.rt_trace.data, rtol=1e-8,
+                                   atol=1e-8 * np.abs(trace.data).max())
+        # exponential running mean
+        process_list = [('detrend', {'win': 10.0})]
+        self._run_rt_process(process_list)
+        c_1 = trace.stats.delta / 10.0
+        mean = trace.data[0]
+        for i in (0, 100, 5000, len(trace) - 1):
+            mean = trace.data[0]
+            for value in trace.data[1:i + 1]:
+                mean = (1.0 - c_1) * mean + c_1 * value
+            self.assertAlmostEqual(self.rt_trace.data[i],
+                                   trace.data[i] - mean, 6)
+
+    def test_taper(self):
+        """
+        Testing streaming taper of the data stream start.
+        """
+        trace = self.orig_trace.copy()
+        width = 1.3 * self.orig_trace_chunks[0].stats.npts * trace.stats.delta
+        npts = int(width * trace.stats.sampling_rate + 0.5)
+        # filtering manual
+        self.filt_trace_data = trace.data.copy()
+        self.filt_trace_data[:npts] *= \
+            0.5 * (1.0 - np.cos(np.pi * np.arange(npts) / npts))
+        # filtering real time
+        process_list = [('taper', {'width': width})]
+        self._run_rt_process(process_list)
+        # check results
+        np.testing.assert_almost_equal(self.filt_trace_data,
+                                       self.rt_trace.data)
+
     def test_combined(self):
         """
         Testing combining integrate and differentiate functions.
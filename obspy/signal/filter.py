@@ -22,6 +22,7 @@ from __future__ import (absolute_import, division, print_function,
 from future.builtins import *  # NOQA
 
 import warnings
+from collections import OrderedDict
 
 import numpy as np
 from scipy.fftpack import hilbert
@@ -36,6 +37,51 @@ except ImportError:
     from ._sosfilt import _zpk2sos as zpk2sos
 
 
+# cache of the most recently used Butterworth filter designs, see
+# _get_butterworth_sos()
+_SOS_CACHE = OrderedDict()
+_SOS_CACHE_MAXSIZE = 256
+
+
+def _get_butterworth_sos(corners, wn, btype):
+    """
+    Design a digital Butterworth filter as second-order sections.
+
+    Filter designs are cached, so that filtering many traces with the same
+    filter (and sampling rate) does not redesign the filter for every trace.
+
+    :param corners: Filter corners / order.
+    :param wn: Corner frequency or list of two corner frequencies, normalized
+        to Nyquist frequency.
+    :param btype: Type of filter, see :func:`scipy.signal.iirfilter`.
+    :rtype: :class:`numpy.ndarray`
+    :return: Second-order sections of the filter. Must not be modified.
+    """
+    key = (corners, tuple(np.atleast_1d(wn).tolist()), btype)
+    # Retrieve and insert again to get LRU behaviour.
+    try:
+        sos = _SOS_CACHE.pop(key)
+    except KeyError:
+        z, p, k = iirfilter(corners, wn, btype=btype, ftype='butter',
+                            output='zpk')
+        sos = zpk2sos(z, p, k)
+    _SOS_CACHE[key] = sos
+    while len(_SOS_CACHE) > _SOS_CACHE_MAXSIZE:
+        _SOS_CACHE.popitem(last=False)
+    return sos
+
+
+def _sosfilt_zerophase(sos, data):
+    """
+    Apply filter once forwards and once backwards along the last axis.
+    """
+    firstpass = sosfilt(sos, data)
+    # explicit contiguous copy, much faster for 2-D data than letting
+    # sosfilt() handle the reversed view
+    firstpass = np.ascontiguousarray(firstpass[..., ::-1])
+    return sosfilt(sos, firstpass)[..., ::-1]
+
+
 def bandpass(data, freqmin, freqmax, df, corners=4, zerophase=False):
     """
     Butterworth-Bandpass Filter.
@@ -46,7 +92,8 @@ def bandpass(data, freqmin, freqmax, df, corners=4, zerophase=False):
     and :func:`scipy.signal.sosfilt` (for applying the filter).
 
     :type data: numpy.ndarray
-    :param data: Data to filter.
+    :param data: Data to filter. Multiple traces of equal length can be
+        filtered at once by passing a 2-D array with one trace per row.
     :param freqmin: Pass band low corner frequency.
     :param freqmax: Pass band high corner frequency.
     :param df: Sampling rate in Hz.
@@ -70,12 +117,9 @@ def bandpass(data, freqmin, freqmax, df, corners=4, zerophase=False):
     if low > 1:
         msg = "Selected low corner frequency is above Nyquist."
         raise ValueError(msg)
-    z, p, k = iirfilter(corners, [low, high], btype='band',
-                        ftype='butter', output='zpk')
-    sos = zpk2sos(z, p, k)
+    sos = _get_butterworth_sos(corners, [low, high], 'band')
     if zerophase:
-        firstpass = sosfilt(sos, data)
-        return sosfilt(sos, firstpass[::-1])[::-1]
+        return _sosfilt_zerophase(sos, data)
     else:
         return sosfilt(sos, data)
 
@@ -90,7 +134,8 @@ def bandstop(data, freqmin, freqmax, df, corners=4, zerophase=False):
     and :func:`scipy.signal.sosfilt` (for applying the filter).
 
     :type data: numpy.ndarray
-    :param data: Data to filter.
+    :param data: Data to filter. Multiple traces of equal length can be
+        filtered at once by passing a 2-D array with one trace per row.
     :param freqmin: Stop band low corner frequency.
     :param freqmax: Stop band high corner frequency.
     :param df: Sampling rate in Hz.
@@ -112,12 +157,9 @@ def bandstop(data, freqmin, freqmax, df, corners=4, zerophase=False):
     if low > 1:
         msg = "Selected low corner frequency is above Nyquist."
         raise ValueError(msg)
-    z, p, k = iirfilter(corners, [low, high],
-                        btype='bandstop', ftype='butter', output='zpk')
-    sos = zpk2sos(z, p, k)
+    sos = _get_butterworth_sos(corners, [low, high], 'bandstop')
     if zerophase:
-        firstpass = sosfilt(sos, data)
-        return sosfilt(sos, firstpass[::-1])[::-1]
+        return _sosfilt_zerophase(sos, data)
     else:
         return sosfilt(sos, data)
 
@@ -132,7 +174,8 @@ def lowpass(data, freq, df, corners=4, zerophase=False):
     and :func:`scipy.signal.sosfilt` (for applying the filter).
 
     :type data: numpy.ndarray
-    :param data: Data to filter.
+    :param data: Data to filter. Multiple traces of equal length can be
+        filtered at once by passing a 2-D array with one trace per row.
     :param freq: Filter corner frequency.
     :param df: Sampling rate in Hz.
     :param corners: Filter corners / order.
@@ -149,12 +192,9 @@ def lowpass(data, freq, df, corners=4, zerophase=False):
         msg = "Selected corner frequency is above Nyquist. " + \
               "Setting Nyquist as high corner."
         warnings.warn(msg)
-    z, p, k = iirfilter(corners, f, btype='lowpass', ftype='butter',
-                        output='zpk')
-    sos = zpk2sos(z, p, k)
+    sos = _get_butterworth_sos(corners, f, 'lowpass')
     if zerophase:
-        firstpass = sosfilt(sos, data)
-        return sosfilt(sos, firstpass[::-1])[::-1]
+        return _sosfilt_zerophase(sos, data)
     else:
         return sosfilt(sos, data)
 
@@ -169,7 +209,8 @@ def highpass(data, freq, df, corners=4, zerophase=False):
     and :func:`scipy.signal.sosfilt` (for applying the filter).
 
     :type data: numpy.ndarray
-    :param data: Data to filter.
+    :param data: Data to filter. Multiple traces of equal length can be
+        filtered at once by passing a 2-D array with one trace per row.
     :param freq: Filter corner frequency.
     :param df: Sampling rate in Hz.
     :param corners: Filter corners / order.
@@ -184,12 +225,9 @@ def highpass(data, freq, df, corners=4, zerophase=False):
     if f > 1:
         msg = "Selected corner frequency is above Nyquist."
         raise ValueError(msg)
-    z, p, k = iirfilter(corners, f, btype='highpass', ftype='butter',
-                        output='zpk')
-    sos = zpk2sos(z, p, k)
+    sos = _get_butterworth_sos(corners, f, 'highpass')
     if zerophase:
-        firstpass = sosfilt(sos, data)
-        return sosfilt(sos, firstpass[::-1])[::-1]
+        return _sosfilt_zerophase(sos, data)
     else:
         return sosfilt(sos, data)
 
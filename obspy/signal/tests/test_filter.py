@@ -16,8 +16,9 @@ import numpy as np
 import scipy.signal as sg
 
 from obspy import read
-from obspy.signal.filter import (bandpass, highpass, lowpass, envelope,
-                                 lowpass_cheby_2)
+from obspy.signal import filter as filter_module
+from obspy.signal.filter import (bandpass, bandstop, highpass, lowpass,
+                                 envelope, lowpass_cheby_2)
 
 
 class FilterTestCase(unittest.TestCase):
@@ -281,6 +282,45 @@ class FilterTestCase(unittest.TestCase):
                     np.testing.assert_allclose(got, expected, rtol=1e-3,
                                                atol=0.9)
 
+    def test_butterworth_filters_2d_data(self):
+        """
+        Filtering a 2-D array has to give the same results as filtering each
+        row separately.
+        """
+        st = read()
+        data = np.vstack([tr.data for tr in st])
+        df = st[0].stats.sampling_rate
+        for func, kwargs in ((bandpass, dict(freqmin=1, freqmax=5)),
+                             (bandstop, dict(freqmin=1, freqmax=5)),
+                             (lowpass, dict(freq=5)),
+                             (highpass, dict(freq=1))):
+            for zerophase in (False, True):
+                got = func(data, df=df, zerophase=zerophase, **kwargs)
+                self.assertEqual(got.shape, data.shape)
+                for row, tr in zip(got, st):
+                    expected = func(tr.data, df=df, zerophase=zerophase,
+                                    **kwargs)
+                    np.testing.assert_array_equal(row, expected)
+
+    def test_filter_design_cache(self):
+        """
+        Only the least recently used filter designs are dropped from the
+        cache.
+        """
+        cache = filter_module._SOS_CACHE
+        cache.clear()
+        maxsize = filter_module._SOS_CACHE_MAXSIZE
+        get_sos = filter_module._get_butterworth_sos
+        first = get_sos(4, 0.1, 'lowpass')
+        for i in range(maxsize + 10):
+            get_sos(4, 0.2 + i * 1e-4, 'lowpass')
+            # keep using the first design
+            self.assertIs(get_sos(4, 0.1, 'lowpass'), first)
+        self.assertEqual(len(cache), maxsize)
+        self.assertNotIn((4, (0.2, ), 'lowpass'), cache)
+        self.assertIn((4, (0.2 + (maxsize + 9) * 1e-4, ), 'lowpass'), cache)
+        cache.clear()
+
 
 def suite():
     return unittest.makeSuite(FilterTestCase, 'test')
@@ -106,16 +106,21 @@ def get_ray_paths(inventory, catalog, phase_list=['P'],
     else:
         model = taup_model
 
+    # compute the paths to all stations at once for every source
+    if stlats:
+        event_arrivals = [
+            model.get_ray_paths_geo_bulk(
+                evdepth_km, evlat, evlon, stlats, stlons,
+                phase_list=phase_list, resample=True)
+            for evlat, evlon, evdepth_km in zip(evlats, evlons, evdepths)]
+
     # now loop through all stations and source combinations
     r_earth = model.model.radius_of_planet
     greatcircles = []
-    for stlat, stlon, stlabel in zip(stlats, stlons, stlabels):
-        for evlat, evlon, evdepth_km, time, magnitude, event_id, origin_id \
-                in zip(evlats, evlons, evdepths, times, magnitudes, event_ids,
-                       origin_ids):
-            arrivals = model.get_ray_paths_geo(
-                    evdepth_km, evlat, evlon, stlat, stlon,
-                    phase_list=phase_list, resample=True)
+    for i, stlabel in enumerate(stlabels):
+        for j, (time, magnitude, event_id, origin_id) in enumerate(
+                zip(times, magnitudes, event_ids, origin_ids)):
+            arrivals = event_arrivals[j][i]
             if len(arrivals) == 0:
                 continue
 
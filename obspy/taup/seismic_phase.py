@@ -1034,6 +1034,247 @@ class SeismicPhase(object):
                 self._settings["max_recursion"]))
         return arrivals
 
+    def calc_time_many(self, degrees):
+        """
+        Calculate arrival times for this phase for many distances at once.
+
+        Gives the same results as calling :meth:`calc_time` for every
+        distance but all arrivals are refined together, shooting all rays of
+        a refinement step through the model at once.
+
+        :param degrees: Epicentral distances in degrees.
+        :type degrees: :class:`~numpy.ndarray`
+        :returns: One list of arrivals per distance, each in the same order as
+            returned by :meth:`calc_time`.
+        :rtype: list of list of :class:`~obspy.taup.helper_classes.Arrival`
+        """
+        degrees = np.asarray(degrees, dtype=np.float64)
+        index, search_dist, ray_num = self._find_arrival_rays(degrees)
+        time, purist_dist, ray_param, ray_param_index, degenerate = \
+            self._refine_arrivals(search_dist, ray_num,
+                                  REFINE_DIST_RADIAN_TOL,
+                                  self._settings["max_recursion"])
+        arrivals = [[] for _ in range(len(degrees))]
+        for i, t, d, p, p_index, degen in zip(
+                index, time, purist_dist, ray_param, ray_param_index,
+                degenerate):
+            # degenerate arrivals are created with zero angles, see
+            # linear_interp_arrival()
+            angles = (0, 0) if degen else ()
+            arrivals[i].append(Arrival(
+                self, float(degrees[i]), t, d, p, p_index, self.name,
+                self.purist_name, self.source_depth, self.receiver_depth,
+                *angles))
+        return arrivals
+
+    def _find_arrival_rays(self, degrees):
+        """
+        Find the ray parameter intervals bracketing the given distances.
+
+        Vectorized version of the C inner loop used in :meth:`calc_time`.
+
+        :returns: Index of distance, search distance in radians and ray number
+            for every arrival, in the order :meth:`calc_time` creates them.
+        """
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64),
+                 np.empty(0, dtype=np.int64))
+        if self.dist is None or len(self.dist) < 2 or not len(degrees):
+            return empty
+        temp_deg = np.abs(degrees)
+        while True:
+            too_large = temp_deg > 360.0
+            if not too_large.any():
+                break
+            temp_deg[too_large] -= 360.0
+        temp_deg = np.where(temp_deg > 180.0, 360.0 - temp_deg, temp_deg)
+        rad_dist = temp_deg * math.pi / 180.0
+
+        # All search distances with their sort keys.
+        index = []
+        search_dist = []
+        order = []
+        n = 0
+        while True:
+            valid = n * 2.0 * math.pi + rad_dist <= self.max_distance
+            if not valid.any():
+                break
+            idx = np.nonzero(valid)[0]
+            index.append(idx)
+            search_dist.append(n * 2 * math.pi + rad_dist[idx])
+            order.append(np.full(len(idx), 2 * n))
+            idx = np.nonzero(valid & (temp_deg != 180.0))[0]
+            index.append(idx)
+            search_dist.append((n + 1) * 2.0 * math.pi - rad_dist[idx])
+            order.append(np.full(len(idx), 2 * n + 1))
+            n += 1
+        if not index:
+            return empty
+        index = np.concatenate(index)
+        search_dist = np.concatenate(search_dist)
+        order = np.concatenate(order)
+
+        count = len(self.dist)
+        dist_a = self.dist[:-1]
+        dist_b = self.dist[1:]
+        allowed = np.ones(count - 1, dtype=np.bool_)
+        if count > 2:
+            allowed &= self.ray_param[:-1] != self.ray_param[1:]
+        not_last = np.arange(1, count) != count - 1
+        # Work in chunks to limit the size of the boolean matrices.
+        chunk = max(1, 2 ** 20 // (count - 1))
+        rows = []
+        ray_nums = []
+        for start in range(0, len(search_dist), chunk):
+            sd = search_dist[start:start + chunk, np.newaxis]
+            match = (dist_a - sd) * (sd - dist_b) >= 0
+            match &= ~((sd == dist_b) & not_last)
+            match &= allowed
+            row, ray_num = np.nonzero(match)
+            rows.append(row + start)
+            ray_nums.append(ray_num)
+        rows = np.concatenate(rows)
+        ray_num = np.concatenate(ray_nums)
+        sort = np.lexsort((ray_num, order[rows], index[rows]))
+        rows = rows[sort]
+        return index[rows], search_dist[rows], ray_num[sort]
+
+    def _refine_arrivals(self, search_dist, ray_num, tolerance,
+                         recursion_limit):
+        """
+        Vectorized version of :meth:`refine_arrival`.
+
+        :returns: Time, purist distance, ray parameter, ray parameter index
+            and a flag for degenerate arrivals.
+        """
+        n = len(search_dist)
+        result = [np.empty(n), np.empty(n), np.empty(n),
+                  np.empty(n, dtype=np.int64), np.zeros(n, dtype=np.bool_)]
+        if not n:
+            return result
+        left = (self.time[ray_num], self.dist[ray_num],
+                self.ray_param[ray_num], ray_num)
+        right = (self.time[ray_num + 1], self.dist[ray_num + 1],
+                 self.ray_param[ray_num + 1], ray_num)
+        active = np.arange(n)
+        no_shoot = self.name.endswith('kmps') or any(
+            phase in self.name for phase in ['Pdiff', 'Sdiff', 'Pn', 'Sn'])
+        while True:
+            sd = search_dist[active]
+            new_estimate = self._linear_interp_arrivals(sd, left, right)
+            if recursion_limit <= 0 or no_shoot:
+                for res, value in zip(result, new_estimate):
+                    res[active] = value
+                return result
+            try:
+                shoot = self._shoot_rays(new_estimate[2])
+            except (IndexError, LookupError, SlownessModelError) as e:
+                raise_from(RuntimeError('Please contact the developers. This '
+                                        'error should not occur.'), e)
+            go_left = (left[1] - sd) * (sd - shoot[1]) > 0
+            done = np.abs(shoot[1] - new_estimate[1]) < tolerance
+            # search between left and shoot or between shoot and right
+            left = tuple(np.where(go_left, l_, s_)
+                         for l_, s_ in zip(left, shoot))
+            right = tuple(np.where(go_left, s_, r_)
+                          for s_, r_ in zip(shoot, right))
+            if done.any():
+                final = self._linear_interp_arrivals(
+                    sd[done], [x[done] for x in left],
+                    [x[done] for x in right])
+                for res, value in zip(result, final):
+                    res[active[done]] = value
+            if done.all():
+                return result
+            keep = ~done
+            active = active[keep]
+            left = [x[keep] for x in left]
+            right = [x[keep] for x in right]
+            recursion_limit -= 1
+
+    def _linear_interp_arrivals(self, search_dist, left, right):
+        """
+        Vectorized version of :meth:`linear_interp_arrival`.
+
+        ``left`` and ``right`` are tuples of time, purist distance, ray
+        parameter and ray parameter index arrays.
+        """
+        left_time, left_dist, left_ray_param, left_index = left
+        right_time, right_dist, right_ray_param, _ = right
+        with np.errstate(divide='ignore', invalid='ignore'):
+            time = ((search_dist - left_dist) / (right_dist - left_dist) *
+                    (right_time - left_time)) + left_time
+            ray_param = ((search_dist - right_dist) /
+                         (left_dist - right_dist) *
+                         (left_ray_param - right_ray_param)) + right_ray_param
+        same = left_dist == search_dist
+        degenerate = (left_index == 0) & (search_dist == self.dist[0])
+        interpolated = ~(same | degenerate)
+        if np.isnan(time[interpolated]).any():
+            i = np.nonzero(interpolated & np.isnan(time))[0][0]
+            msg = ('Time is NaN, search=%f leftDist=%f leftTime=%f '
+                   'rightDist=%f rightTime=%f')
+            raise RuntimeError(msg % (search_dist[i], left_dist[i],
+                                      left_time[i], right_dist[i],
+                                      right_time[i]))
+        time = np.where(same, left_time, time)
+        ray_param = np.where(same, left_ray_param, ray_param)
+        dist = np.where(same, left_dist, search_dist)
+        time[degenerate] = self.time[0]
+        ray_param[degenerate] = self.ray_param[0]
+        index = np.where(degenerate, 0, left_index)
+        return time, dist, ray_param, index, degenerate
+
+    def _shoot_rays(self, ray_param):
+        """
+        Vectorized version of :meth:`shoot_ray`.
+
+        :returns: Time, purist distance, ray parameter and ray parameter index
+            arrays.
+        """
+        if (any(phase in self.name
+                for phase in ['Pdiff', 'Sdiff', 'Pn', 'Sn']) or
+                self.name.endswith('kmps')):
+            raise SlownessModelError('Unable to shoot ray in non-body waves')
+
+        outside = (ray_param < self.min_ray_param) | \
+            (self.max_ray_param < ray_param)
+        if outside.any():
+            msg = 'Ray param %f is outside range for this phase: min=%f max=%f'
+            raise SlownessModelError(msg % (ray_param[outside][0],
+                                            self.min_ray_param,
+                                            self.max_ray_param))
+
+        # First index i with self.ray_param[i + 1] < ray_param, as in
+        # shoot_ray().
+        cummin = np.minimum.accumulate(self.ray_param[1:])
+        ray_param_index = np.minimum(
+            np.searchsorted(-cummin, -ray_param, side='right'),
+            len(cummin) - 1)
+
+        tau_model = self.tau_model
+        s_mod = tau_model.s_mod
+
+        # counter for passes through each branch. 0 is P and 1 is S.
+        times_branches = self.calc_branch_mult(tau_model)
+        time = np.zeros(len(ray_param))
+        dist = np.zeros(len(ray_param))
+        ray_param = np.asarray(ray_param, dtype=np.float64)
+
+        # Sum the branches with the appropriate multiplier.
+        for j in range(tau_model.tau_branches.shape[1]):
+            for k, is_p_wave in enumerate((s_mod.p_wave, s_mod.s_wave)):
+                if times_branches[k, j] == 0:
+                    continue
+                br = tau_model.get_tau_branch(j, is_p_wave)
+                top_layer = s_mod.layer_number_below(br.top_depth, is_p_wave)
+                bot_layer = s_mod.layer_number_above(br.bot_depth, is_p_wave)
+                td = br.calc_time_dist(s_mod, top_layer, bot_layer, ray_param,
+                                       allow_turn_in_layer=True)
+                time += times_branches[k, j] * td['time']
+                dist += times_branches[k, j] * td['dist']
+
+        return time, dist, ray_param, ray_param_index
+
     def calc_pierce(self, degrees):
         """
         Calculate pierce points for this phase.
@@ -1765,8 +1765,9 @@ class SlownessModel(object):
             out_layers = out.p_layers if is_p_wave else out.s_layers
             out_layers[layer_num] = bot_layer
             out_layers = np.insert(out_layers, layer_num, top_layer)
-            # Fix critical layers since we added a slowness layer.
-            out_critical_depths = self.critical_depths
+            # Fix critical layers since we added a slowness layer. Only
+            # modify the copy, the model itself may be shared.
+            out_critical_depths = out.critical_depths
             _fix_critical_depths(out_critical_depths, layer_num, is_p_wave)
             if is_p_wave:
                 out_p_layers = out_layers
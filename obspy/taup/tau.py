@@ -22,6 +22,7 @@ from .taup_path import TauPPath
 from .taup_pierce import TauPPierce
 from .taup_time import TauPTime
 from .taup_geo import calc_dist, add_geo_to_arrivals
+from .travel_time_grid import TravelTimeGrid
 from .utils import parse_phase_list
 import obspy.geodetics.base as geodetics
 
@@ -572,7 +573,7 @@ class TauPyModel(object):
     """
 
     def __init__(self, model="iasp91", verbose=False, planet_flattening=0.0,
-                 cache=None):
+                 cache=None, travel_time_grid=None):
         """
         Loads an already created TauPy model.
 
@@ -589,11 +590,22 @@ class TauPyModel(object):
         :param cache: An object to use to cache models split at source depths.
             Generating results requires splitting a model at the source depth,
             which may be expensive. The cache allows faster calculation when
-            multiple results are requested for the same source depth. The
-            dictionary must be ordered, otherwise the LRU cache will not
-            behave correctly. If ``False`` is specified, then no cache will be
-            used.
-        :type cache: :class:`collections.OrderedDict` or bool
+            multiple results are requested for the same source depth. A
+            :class:`~obspy.taup.tau_model.DepthCache` allows configuring the
+            cache size, sharing depth corrected models between processes via
+            a directory and reports cache hits and misses. A plain dictionary
+            must be ordered, otherwise the LRU cache will not behave
+            correctly. If ``False`` is specified, then no cache will be used.
+        :type cache: :class:`~obspy.taup.tau_model.DepthCache`,
+            :class:`collections.OrderedDict` or bool
+        :param travel_time_grid: Precomputed grid of first arrivals (or the
+            filename of a saved grid) to interpolate travel times from. If
+            given, :meth:`get_travel_times` requests for phases contained in
+            the grid return the first arrival of every phase, interpolated
+            from the grid where its estimated error is small enough and
+            calculated exactly otherwise.
+        :type travel_time_grid:
+            :class:`~obspy.taup.travel_time_grid.TravelTimeGrid` or str
 
         Usage:
 
@@ -609,6 +621,16 @@ class TauPyModel(object):
         self.verbose = verbose
         self.model = TauModel.from_file(model, cache=cache)
         self.planet_flattening = planet_flattening
+        if travel_time_grid is not None and \
+                not isinstance(travel_time_grid, TravelTimeGrid):
+            travel_time_grid = TravelTimeGrid.load(travel_time_grid)
+        if travel_time_grid is not None and travel_time_grid.model_name != \
+                self.model.s_mod.v_mod.model_name:
+            msg = ("Travel time grid was created for model '%s' but this is "
+                   "model '%s'." % (travel_time_grid.model_name,
+                                    self.model.s_mod.v_mod.model_name))
+            raise ValueError(msg)
+        self.travel_time_grid = travel_time_grid
 
     def get_travel_times(self, source_depth_in_km, distance_in_degree=None,
                          phase_list=("ttall",), receiver_depth_in_km=0.0):
@@ -630,7 +652,21 @@ class TauPyModel(object):
             corresponding phase name, ray parameter, takeoff angle, etc. as
             attributes.
         :rtype: :class:`Arrivals`
+
+        .. note::
+
+            If the model has a ``travel_time_grid`` containing all requested
+            phases (at the requested receiver depth), only the first arrival
+            of every phase is returned and it is interpolated from the grid if
+            possible, see
+            :class:`~obspy.taup.travel_time_grid.TravelTimeGrid`.
         """
+        grid = self.travel_time_grid
+        if grid is not None and grid.covers(phase_list, receiver_depth_in_km):
+            return grid.get_travel_times(
+                self, source_depth_in_km, distance_in_degree,
+                phase_list=phase_list,
+                receiver_depth_in_km=receiver_depth_in_km)
         # Accessing the arrivals not just by list indices but by phase name
         # might be useful, but also difficult: several arrivals can have the
         # same phase.
@@ -640,6 +676,56 @@ class TauPyModel(object):
         return Arrivals(sorted(tt.arrivals, key=lambda x: x.time),
                         model=self.model)
 
+    def get_travel_times_bulk(self, source_depth_in_km, distance_in_degree,
+                              phase_list=("ttall",), receiver_depth_in_km=0.0):
+        """
+        Return travel times of every given phase for many distances at once.
+
+        Gives the same results as calling :meth:`get_travel_times` for every
+        distance (and source depth) but is a lot faster for many distances as
+        phases are only set up once per source depth and the arrivals for all
+        distances are calculated together.
+
+        :param source_depth_in_km: Source depth in km. Either a single depth
+            used for all distances or one depth per distance.
+        :type source_depth_in_km: float or array-like
+        :param distance_in_degree: Epicentral distances in degrees.
+        :type distance_in_degree: array-like
+        :param phase_list: List of phases for which travel times should be
+            calculated. If this is empty, all phases in arrivals object
+            will be used.
+        :type phase_list: list of str
+        :param receiver_depth_in_km: Receiver depth in km
+        :type receiver_depth_in_km: float
+
+        :return: One :class:`Arrivals` object per distance.
+        :rtype: list of :class:`Arrivals`
+
+        >>> from obspy.taup import TauPyModel
+        >>> model = TauPyModel("iasp91")
+        >>> for arrivals in model.get_travel_times_bulk(
+        ...         10, [20, 40, 60], phase_list=["P"]):
+        ...     print("%.2f" % arrivals[0].time)
+        272.68
+        454.74
+        606.67
+        """
+        depths, distances = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(source_depth_in_km, dtype=np.float64)),
+            np.atleast_1d(np.asarray(distance_in_degree, dtype=np.float64)))
+        if distances.ndim != 1:
+            msg = "Distances and source depths must be one-dimensional."
+            raise ValueError(msg)
+        arrivals = [None] * len(distances)
+        for depth in np.unique(depths):
+            index = np.nonzero(depths == depth)[0]
+            tt = TauPTime(self.model, phase_list, float(depth), None,
+                          receiver_depth_in_km)
+            for i, arrivals_ in zip(index,
+                                    tt.calc_time_many(distances[index])):
+                arrivals[i] = Arrivals(arrivals_, model=self.model)
+        return arrivals
+
     def get_pierce_points(self, source_depth_in_km, distance_in_degree,
                           phase_list=("ttall",), receiver_depth_in_km=0.0):
         """
@@ -869,6 +955,134 @@ class TauPyModel(object):
 
         return arrivals
 
+    def get_pierce_points_geo_bulk(self, source_depth_in_km,
+                                   source_latitude_in_deg,
+                                   source_longitude_in_deg,
+                                   receiver_latitude_in_deg,
+                                   receiver_longitude_in_deg,
+                                   phase_list=("ttall",), resample=False):
+        """
+        Return pierce points with geographical info for many receivers.
+
+        Gives the same results as calling :meth:`get_pierce_points_geo` for
+        every receiver but is a lot faster for many receivers as the phases
+        are only set up once and the arrivals for all receivers are
+        calculated together.
+
+        :param source_depth_in_km: Source depth in km
+        :type source_depth_in_km: float
+        :param source_latitude_in_deg: Source latitude in degrees
+        :type source_latitude_in_deg: float
+        :param source_longitude_in_deg: Source longitude in degrees
+        :type source_longitude_in_deg: float
+        :param receiver_latitude_in_deg: Receiver latitudes in degrees
+        :type receiver_latitude_in_deg: array-like
+        :param receiver_longitude_in_deg: Receiver longitudes in degrees
+        :type receiver_longitude_in_deg: array-like
+        :param phase_list: List of phases for which travel times should be
+            calculated. If this is empty, all phases in arrivals object
+            will be used.
+        :type phase_list: list of str
+        :param resample: adds sample points to allow for easy cartesian
+                         interpolation. This is especially useful for phases
+                         like Pdiff.
+        :type resample: boolean
+        :return: One :class:`Arrivals` object per receiver.
+        :rtype: list of :class:`Arrivals`
+        """
+        return self._get_geo_bulk(
+            TauPPierce, "calc_pierce_many", source_depth_in_km,
+            source_latitude_in_deg, source_longitude_in_deg,
+            receiver_latitude_in_deg, receiver_longitude_in_deg, phase_list,
+            resample)
+
+    def get_ray_paths_geo_bulk(self, source_depth_in_km,
+                               source_latitude_in_deg,
+                               source_longitude_in_deg,
+                               receiver_latitude_in_deg,
+                               receiver_longitude_in_deg,
+                               phase_list=("ttall",), resample=False):
+        """
+        Return ray paths with geographical info for many receivers.
+
+        Gives the same results as calling :meth:`get_ray_paths_geo` for every
+        receiver but is a lot faster for many receivers as the phases are only
+        set up once and the arrivals for all receivers are calculated
+        together.
+
+        :param source_depth_in_km: Source depth in km
+        :type source_depth_in_km: float
+        :param source_latitude_in_deg: Source latitude in degrees
+        :type source_latitude_in_deg: float
+        :param source_longitude_in_deg: Source longitude in degrees
+        :type source_longitude_in_deg: float
+        :param receiver_latitude_in_deg: Receiver latitudes in degrees
+        :type receiver_latitude_in_deg: array-like
+        :param receiver_longitude_in_deg: Receiver longitudes in degrees
+        :type receiver_longitude_in_deg: array-like
+        :param phase_list: List of phases for which travel times should be
+            calculated. If this is empty, all phases in arrivals object
+            will be used.
+        :type phase_list: list of str
+        :param resample: adds sample points to allow for easy cartesian
+                         interpolation. This is especially useful for phases
+                         like Pdiff.
+        :type resample: boolean
+        :return: One :class:`Arrivals` object per receiver.
+        :rtype: list of :class:`Arrivals`
+
+        >>> from obspy.taup import TauPyModel
+        >>> model = TauPyModel("iasp91")
+        >>> for arrivals in model.get_ray_paths_geo_bulk(
+        ...         10, 0, 0, [0, 30], [40, 60],
+        ...         phase_list=["P"]):  # doctest: +SKIP
+        ...     path = arrivals[0].path
+        ...     print("%.1f %.1f" % (path["lat"][-1], path["lon"][-1]))
+        0.0 40.0
+        30.0 60.0
+        """
+        return self._get_geo_bulk(
+            TauPPath, "calc_path_many", source_depth_in_km,
+            source_latitude_in_deg, source_longitude_in_deg,
+            receiver_latitude_in_deg, receiver_longitude_in_deg, phase_list,
+            resample)
+
+    def _get_geo_bulk(self, calculator, method, source_depth_in_km,
+                      source_latitude_in_deg, source_longitude_in_deg,
+                      receiver_latitude_in_deg, receiver_longitude_in_deg,
+                      phase_list, resample):
+        receiver_lats, receiver_lons = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(receiver_latitude_in_deg,
+                                     dtype=np.float64)),
+            np.atleast_1d(np.asarray(receiver_longitude_in_deg,
+                                     dtype=np.float64)))
+        if receiver_lats.ndim != 1:
+            msg = "Receiver latitudes and longitudes must be one-dimensional."
+            raise ValueError(msg)
+        distances = np.array([
+            calc_dist(source_latitude_in_deg, source_longitude_in_deg,
+                      lat, lon, self.model.radius_of_planet,
+                      self.planet_flattening)
+            for lat, lon in zip(receiver_lats, receiver_lons)])
+        calc = calculator(self.model, phase_list, source_depth_in_km, None)
+        arrivals = [Arrivals(arrivals_, model=self.model)
+                    for arrivals_ in getattr(calc, method)(distances)]
+
+        if not geodetics.HAS_GEOGRAPHICLIB:
+            msg = "Not able to evaluate positions of points. " + \
+                  "Arrivals objects will not be modified. " + \
+                  "Install the Python module 'geographiclib' to solve " + \
+                  "this issue."
+            warnings.warn(msg)
+            return arrivals
+        return [add_geo_to_arrivals(arrivals_, source_latitude_in_deg,
+                                    source_longitude_in_deg, lat, lon,
+                                    self.model.radius_of_planet,
+                                    self.planet_flattening,
+                                    resample=resample)
+                for arrivals_, lat, lon in zip(arrivals, receiver_lats,
+                                               receiver_lons)]
+
 
 def plot_travel_times(source_depth, phase_list=("ttbasic",), min_degrees=0,
                       max_degrees=180, npoints=50, model='iasp91',
@@ -9,8 +9,11 @@ from future.builtins import *  # NOQA
 from future.utils import native_str
 
 from collections import OrderedDict
+import hashlib
 import os
-from copy import deepcopy
+import pickle
+import tempfile
+from copy import copy, deepcopy
 from itertools import count
 from math import pi
 
@@ -22,6 +25,151 @@ from .tau_branch import TauBranch
 from .velocity_model import VelocityModel
 
 
+# Models loaded from files in this process, keyed by filename and file
+# modification time/size. Depth correction only modifies copies of a model,
+# so one model can be shared by every TauPyModel using it. Only the most
+# recently used models are kept, see clear_model_registry() to free them.
+_MODEL_REGISTRY = OrderedDict()
+_MODEL_REGISTRY_SIZE = 8
+
+
+def clear_model_registry():
+    """
+    Forget all models loaded from files.
+
+    Models are only deserialized once per file and process and then shared
+    by all :class:`~obspy.taup.tau.TauPyModel` objects using them. Existing
+    models are not affected, new ones load their file again.
+    """
+    _MODEL_REGISTRY.clear()
+
+
+class DepthCache(object):
+    """
+    LRU cache for tau models corrected for different source depths.
+
+    Correcting a tau model for a source depth is expensive, so
+    :class:`TauModel` keeps the most recently used depth corrected models in
+    a cache. The cache can be shared between models (entries are keyed by a
+    hash of the model and the depth). If a directory is given, all depth
+    corrected models are also stored there (as pickle files) and models not
+    in memory are loaded from there, which allows e.g. multiple worker
+    processes to reuse the depth corrections of each other or of previous
+    runs.
+
+    :param maxsize: Maximum number of depth corrected models kept in memory.
+    :type maxsize: int
+    :param directory: Directory to store depth corrected models in. Will be
+        created if it does not exist. Only use directories no untrusted
+        parties can write to, as the files are unpickled when loading.
+    :type directory: str
+
+    The ``hits``, ``disk_hits`` and ``misses`` attributes count lookups
+    answered from memory, answered from the directory and lookups that
+    required a new depth correction.
+
+    >>> from obspy.taup import TauPyModel
+    >>> from obspy.taup.tau_model import DepthCache
+    >>> cache = DepthCache(maxsize=1000)
+    >>> model = TauPyModel("iasp91", cache=cache)
+    >>> arrivals = model.get_travel_times(10, 20, phase_list=["P"])
+    >>> arrivals = model.get_travel_times(10, 40, phase_list=["P"])
+    >>> print(cache.hits, cache.misses)
+    1 1
+    """
+    def __init__(self, maxsize=128, directory=None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        if directory is not None and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        """
+        Remove all models from memory and reset the counters.
+
+        Files in the cache directory are not touched.
+        """
+        self._cache.clear()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _get_filename(self, key):
+        model_hash, depth = key
+        return os.path.join(self.directory,
+                            "%s_%r.pickle" % (model_hash, float(depth)))
+
+    def get(self, key):
+        """
+        Return the cached model for a key or ``None``.
+
+        :param key: Model hash and source depth.
+        :type key: tuple
+        """
+        # Retrieve and later insert again to get LRU cache behaviour.
+        try:
+            value = self._cache.pop(key)
+        except KeyError:
+            value = None
+            if self.directory is not None:
+                try:
+                    with open(self._get_filename(key), "rb") as fh:
+                        value = pickle.load(fh)
+                except Exception:
+                    # Not there yet or (partially) broken file.
+                    value = None
+            if value is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        else:
+            self.hits += 1
+        self._insert(key, value)
+        return value
+
+    def put(self, key, value):
+        """
+        Add a model to the cache (and to the cache directory).
+
+        :param key: Model hash and source depth.
+        :type key: tuple
+        :param value: Depth corrected model.
+        :type value: :class:`TauModel`
+        """
+        self._insert(key, value)
+        if self.directory is None:
+            return
+        # Write to a temporary file first and move it to the final place, so
+        # other processes never read partially written files.
+        fd, tmp_filename = tempfile.mkstemp(dir=self.directory,
+                                            suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.rename(tmp_filename, self._get_filename(key))
+        except OSError:
+            # e.g. file was written by another process in the meantime on
+            # Windows
+            pass
+        finally:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+
+    def _insert(self, key, value):
+        self._cache[key] = value
+        # Pop first key-value pairs until at most maxsize elements are still
+        # in the cache.
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+
 class TauModel(object):
     """
     Provides storage of all the TauBranches comprising a model.
@@ -58,16 +206,24 @@ class TauModel(object):
         # happens to fall on a real discontinuity then it is not included.
         self.no_discon_depths = []
 
-        if cache is None:
-            self._depth_cache = OrderedDict()
-        elif cache is not False:
-            self._depth_cache = cache
-        else:
-            self._depth_cache = None
+        self._set_depth_cache(cache)
+        self._hash = None
 
         if not skip_calc:
             self.calc_tau_inc_from()
 
+    def _set_depth_cache(self, cache):
+        if cache is None:
+            self._depth_cache = DepthCache()
+        elif cache is False:
+            self._depth_cache = None
+        elif isinstance(cache, DepthCache):
+            self._depth_cache = cache
+        else:
+            # Any ordered mapping to store the cached models in.
+            self._depth_cache = DepthCache()
+            self._depth_cache._cache = cache
+
     def calc_tau_inc_from(self):
         """
         Calculates tau for each branch within a slowness model.
@@ -221,22 +377,31 @@ class TauModel(object):
         return self.load_from_depth_cache(depth)
 
     def load_from_depth_cache(self, depth):
-        # Very simple and straightforward LRU cache implementation.
         if self._depth_cache is not None:
-            # Retrieve and later insert again to get LRU cache behaviour.
-            try:
-                value = self._depth_cache.pop(depth)
-            except KeyError:
+            key = (self._get_hash(), depth)
+            value = self._depth_cache.get(key)
+            if value is None:
                 value = self._load_from_depth_cache(depth)
-            self._depth_cache[depth] = value
-            # Pop first key-value pairs until at most 128 elements are still
-            # in the cache.
-            while len(self._depth_cache) > 128:
-                self._depth_cache.popitem(last=False)
+                self._depth_cache.put(key, value)
             return value
         else:
             return self._load_from_depth_cache(depth)
 
+    def _get_hash(self):
+        """
+        Hash identifying the model, used as key for cached depth corrections.
+        """
+        if self._hash is None:
+            sha1 = hashlib.sha1()
+            sha1.update(str(self.s_mod.v_mod.model_name).encode("utf-8"))
+            sha1.update(repr((self.radius_of_planet, self.source_depth,
+                              self.is_spherical)).encode("utf-8"))
+            for arr in (self.ray_params, self.s_mod.v_mod.layers,
+                        self.s_mod.p_layers, self.s_mod.s_layers):
+                sha1.update(np.ascontiguousarray(arr).tobytes())
+            self._hash = sha1.hexdigest()
+        return self._hash
+
     def _load_from_depth_cache(self, depth):
         depth_corrected = self.split_branch(depth)
         depth_corrected.source_depth = depth
@@ -254,7 +419,8 @@ class TauModel(object):
         # boundary, then just return original model.
         for tb in self.tau_branches[0]:
             if tb.top_depth == depth or tb.bot_depth == depth:
-                return deepcopy(self)
+                # Do not copy the depth cache along with the model.
+                return deepcopy(self, {id(self._depth_cache): None})
         # Depth is not a branch boundary, so must modify the tau model.
         index_p = -1
         p_wave_ray_param = -1
@@ -632,9 +798,36 @@ class TauModel(object):
 
     @staticmethod
     def from_file(model_name, cache=None):
+        """
+        Load a model by name or filename.
+
+        Every file is only deserialized once per process, all returned models
+        for a file share the same data (depth correction works on copies).
+        Only the cache for depth corrected models is specific to each
+        returned model. The data of the most recently used files stays in
+        memory until :func:`clear_model_registry` is called.
+        """
         if os.path.exists(model_name):
             filename = model_name
         else:
             filename = os.path.join(os.path.dirname(__file__), "data",
                                     model_name.lower() + ".npz")
-        return TauModel.deserialize(filename, cache=cache)
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            # Let deserialization raise the usual error.
+            return TauModel.deserialize(filename, cache=cache)
+        key = (os.path.abspath(filename), stat.st_mtime, stat.st_size)
+        # Retrieve and insert again to get LRU behaviour.
+        try:
+            base_model = _MODEL_REGISTRY.pop(key)
+        except KeyError:
+            base_model = TauModel.deserialize(filename, cache=False)
+            # Compute the hash only once for all models sharing the data.
+            base_model._get_hash()
+        _MODEL_REGISTRY[key] = base_model
+        while len(_MODEL_REGISTRY) > _MODEL_REGISTRY_SIZE:
+            _MODEL_REGISTRY.popitem(last=False)
+        model = copy(base_model)
+        model._set_depth_cache(cache)
+        return model
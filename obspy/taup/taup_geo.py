@@ -177,19 +177,13 @@ def add_geo_to_arrivals(arrivals, source_latitude_in_deg,
             arrival.azimuth = az_arr
 
             if arrival.pierce is not None:
-                geo_pierce = np.empty(arrival.pierce.shape, dtype=TimeDistGeo)
-
-                for i, pierce_point in enumerate(arrival.pierce):
-                    signed_dist = np.degrees(sign * pierce_point['dist'])
-                    pos = line.ArcPosition(signed_dist)
-                    geo_pierce[i] = (pierce_point['p'], pierce_point['time'],
-                                     pierce_point['dist'],
-                                     pierce_point['depth'],
-                                     pos['lat2'], pos['lon2'])
-                arrival.pierce = geo_pierce
+                signed_dists = np.degrees(sign * arrival.pierce['dist'])
+                arrival.pierce = _add_geo_to_points(arrival.pierce,
+                                                    signed_dists, line)
 
             # choose whether we need to resample the trace
             if arrival.path is not None:
+                signed_dists = np.degrees(sign * arrival.path['dist'])
                 if resample:
                     rplanet = radius_of_planet_in_km
                     # compute approximate distance between sampling points
@@ -197,73 +191,12 @@ def add_geo_to_arrivals(arrivals, source_latitude_in_deg,
                     radii = rplanet - arrival.path['depth']
                     rmean = np.sqrt(radii[1:] * radii[:-1])
                     diff_dists = rmean * np.diff(arrival.path['dist'])
-                    npts_extra = np.floor(diff_dists / mindist).astype(np.int)
-
-                    # count number of extra points and initialize array
-                    npts_old = len(arrival.path)
-                    npts_new = int(npts_old + np.sum(npts_extra))
-                    geo_path = np.empty(npts_new, dtype=TimeDistGeo)
-
-                    # now loop through path, adding extra points
-                    i_new = 0
-                    for i_old, path_point in enumerate(arrival.path):
-                        # first add the original point at the new index
-                        dist = np.degrees(sign * path_point['dist'])
-                        pos = line.ArcPosition(dist)
-                        geo_path[i_new] = (path_point['p'], path_point['time'],
-                                           path_point['dist'],
-                                           path_point['depth'],
-                                           pos['lat2'], pos['lon2'])
-                        i_new += 1
-
-                        if i_old > npts_old - 2:
-                            continue
-
-                        # now check if we need to add new points
-                        npts_new = npts_extra[i_old]
-                        if npts_new > 0:
-                            # if yes, distribute them linearly between the old
-                            # and the next point
-                            next_point = arrival.path[i_old + 1]
-                            dist_next = np.degrees(sign * next_point['dist'])
-                            dists_new = np.linspace(dist, dist_next,
-                                                    npts_new + 2)[1: -1]
-
-                            # now get all interpolated parameters
-                            xs = [dist, dist_next]
-                            ys = [path_point['p'], next_point['p']]
-                            p_interp = np.interp(dists_new, xs, ys)
-                            ys = [path_point['time'], next_point['time']]
-                            time_interp = np.interp(dists_new, xs, ys)
-                            ys = [path_point['depth'], next_point['depth']]
-                            depth_interp = np.interp(dists_new, xs, ys)
-                            pos_interp = [line.ArcPosition(dist_new)
-                                          for dist_new in dists_new]
-                            lat_interp = [point['lat2']
-                                          for point in pos_interp]
-                            lon_interp = [point['lon2']
-                                          for point in pos_interp]
-
-                            # add them to geo_path
-                            for i_extra in range(npts_new):
-                                geo_path[i_new] = (p_interp[i_extra],
-                                                   time_interp[i_extra],
-                                                   dists_new[i_extra],
-                                                   depth_interp[i_extra],
-                                                   lat_interp[i_extra],
-                                                   lon_interp[i_extra])
-                                i_new += 1
-
-                    arrival.path = geo_path
+                    npts_extra = np.floor(diff_dists / mindist).astype(int)
+                    path, signed_dists = _resample_path(
+                        arrival.path, signed_dists, npts_extra)
                 else:
-                    geo_path = np.empty(arrival.path.shape, dtype=TimeDistGeo)
-                    for i, path_point in enumerate(arrival.path):
-                        signed_dist = np.degrees(sign * path_point['dist'])
-                        pos = line.ArcPosition(signed_dist)
-                        geo_path[i] = (path_point['p'], path_point['time'],
-                                       path_point['dist'], path_point['depth'],
-                                       pos['lat2'], pos['lon2'])
-                    arrival.path = geo_path
+                    path = arrival.path
+                arrival.path = _add_geo_to_points(path, signed_dists, line)
     else:
         # geographiclib is not installed ...
         # and  obspy/geodetics does not help much
@@ -272,3 +205,118 @@ def add_geo_to_arrivals(arrivals, source_latitude_in_deg,
         raise ImportError(msg)
 
     return arrivals
+
+
+def _arc_positions(line, distances):
+    """
+    Calculate the positions of points along a geodesic.
+
+    On a spherical planet the great circle positions are computed for all
+    points at once, on an ellipsoid every point has to be computed by
+    geographiclib.
+
+    :param line: Geodesic starting at the source.
+    :type line: :class:`geographiclib.geodesicline.GeodesicLine`
+    :param distances: Arc lengths along the geodesic in degrees.
+    :type distances: :class:`numpy.ndarray`
+    :returns: Latitudes and longitudes of the points in degrees.
+    :rtype: tuple of two :class:`numpy.ndarray`
+    """
+    distances = np.asarray(distances, dtype=np.float64)
+    if line.f != 0.0:
+        positions = [line.ArcPosition(dist) for dist in distances]
+        lats = np.array([pos['lat2'] for pos in positions], dtype=np.float64)
+        lons = np.array([pos['lon2'] for pos in positions], dtype=np.float64)
+        return lats, lons
+    sin_lat1, cos_lat1 = _sincosd(line.lat1)
+    sin_azi1, cos_azi1 = _sincosd(line.azi1)
+    sin_dists, cos_dists = _sincosd(distances)
+    sin_lat2 = sin_lat1 * cos_dists + cos_lat1 * sin_dists * cos_azi1
+    lats = np.degrees(np.arctan2(
+        sin_lat2, np.hypot(cos_lat1 * cos_dists -
+                           sin_lat1 * sin_dists * cos_azi1,
+                           sin_dists * sin_azi1)))
+    lons = line.lon1 + np.degrees(np.arctan2(
+        sin_azi1 * sin_dists * cos_lat1, cos_dists - sin_lat1 * sin_lat2))
+    # same longitude range as geographiclib
+    lons = (lons + 180.) % 360. - 180.
+    return lats, lons
+
+
+def _sincosd(x):
+    """
+    Sine and cosine of angles in degrees.
+
+    Exact for multiples of 90 degrees, like the corresponding function of
+    geographiclib.
+    """
+    x = np.fmod(x, 360.)
+    quadrant = np.round(x / 90.)
+    x = np.radians(x - 90. * quadrant)
+    sin, cos = np.sin(x), np.cos(x)
+    quadrant = quadrant.astype(int) % 4
+    sin, cos = (np.choose(quadrant, [sin, cos, -sin, -cos]),
+                np.choose(quadrant, [cos, -sin, -cos, sin]))
+    # avoid negative zeros
+    return sin + 0., cos + 0.
+
+
+def _add_geo_to_points(points, distances, line):
+    """
+    Return a copy of pierce points or path points with positions added.
+
+    :param points: Points along the ray.
+    :type points: :class:`numpy.ndarray` of
+        :class:`~obspy.taup.helper_classes.TimeDist`
+    :param distances: Signed arc lengths of the points from the source in
+        degrees.
+    :type distances: :class:`numpy.ndarray`
+    :param line: Geodesic starting at the source.
+    :type line: :class:`geographiclib.geodesicline.GeodesicLine`
+    :rtype: :class:`numpy.ndarray` of
+        :class:`~obspy.taup.helper_classes.TimeDistGeo`
+    """
+    geo_points = np.empty(points.shape, dtype=TimeDistGeo)
+    for name in points.dtype.names:
+        geo_points[name] = points[name]
+    geo_points['lat'], geo_points['lon'] = _arc_positions(line, distances)
+    return geo_points
+
+
+def _resample_path(path, distances, npts_extra):
+    """
+    Add points linearly distributed between the points of a ray path.
+
+    :param path: Points along the ray.
+    :type path: :class:`numpy.ndarray` of
+        :class:`~obspy.taup.helper_classes.TimeDist`
+    :param distances: Signed arc lengths of the points from the source in
+        degrees.
+    :type distances: :class:`numpy.ndarray`
+    :param npts_extra: Number of points to add after each but the last
+        point.
+    :type npts_extra: :class:`numpy.ndarray`
+    :returns: The resampled path and the signed distances of its points.
+    """
+    npts_old = len(path)
+    # index of the original points in the resampled path
+    index_old = np.arange(npts_old) + np.concatenate(
+        [[0], np.cumsum(npts_extra)]).astype(int)
+    new_path = np.empty(npts_old + int(np.sum(npts_extra)), dtype=path.dtype)
+    new_distances = np.empty(len(new_path), dtype=np.float64)
+    new_path[index_old] = path
+    new_distances[index_old] = distances
+
+    for i_old in np.nonzero(npts_extra)[0]:
+        # distribute the new points linearly between the old and the next
+        # point
+        npts_new = npts_extra[i_old]
+        new = slice(index_old[i_old] + 1, index_old[i_old] + 1 + npts_new)
+        xs = distances[i_old:i_old + 2]
+        dists_new = np.linspace(xs[0], xs[1], npts_new + 2)[1:-1]
+        for name in ('p', 'time', 'depth'):
+            new_path[name][new] = np.interp(dists_new, xs,
+                                            path[name][i_old:i_old + 2])
+        new_path['dist'][new] = dists_new
+        new_distances[new] = dists_new
+    return new_path, new_distances
@@ -32,3 +32,19 @@ class TauPPath(TauPPierce):
         self.degrees = degrees
         for phase in self.phases:
             self.arrivals += phase.calc_path(degrees)
+
+    def calc_path_many(self, degrees):
+        """
+        Calculate the ray paths for many distances at once.
+
+        :param degrees: Epicentral distances in degrees.
+        :type degrees: :class:`~numpy.ndarray`
+        :returns: One list of arrivals with ray paths per distance, each
+            sorted by time.
+        :rtype: list of list of :class:`~obspy.taup.helper_classes.Arrival`
+        """
+        arrivals = self.calc_time_many(degrees)
+        for arrivals_ in arrivals:
+            for arrival in arrivals_:
+                arrival.phase.calc_path_from_arrival(arrival)
+        return arrivals
@@ -80,3 +80,19 @@ class TauPPierce(TauPTime):
         """
         for phase in self.phases:
             self.arrivals += phase.calc_pierce(degrees)
+
+    def calc_pierce_many(self, degrees):
+        """
+        Calculate the pierce points for many distances at once.
+
+        :param degrees: Epicentral distances in degrees.
+        :type degrees: :class:`~numpy.ndarray`
+        :returns: One list of arrivals with pierce points per distance, each
+            sorted by time.
+        :rtype: list of list of :class:`~obspy.taup.helper_classes.Arrival`
+        """
+        arrivals = self.calc_time_many(degrees)
+        for arrivals_ in arrivals:
+            for arrival in arrivals_:
+                arrival.phase.calc_pierce_from_arrival(arrival)
+        return arrivals
@@ -108,3 +108,22 @@ class TauPTime(object):
         # Sort them.
         self.arrivals = sorted(self.arrivals,
                                key=lambda arrivals: arrivals.time)
+
+    def calc_time_many(self, degrees):
+        """
+        Calculate the arrival times for many distances at once.
+
+        :param degrees: Epicentral distances in degrees.
+        :type degrees: :class:`~numpy.ndarray`
+        :returns: One list of arrivals per distance, each sorted by time.
+        :rtype: list of list of :class:`~obspy.taup.helper_classes.Arrival`
+        """
+        self.depth_correct(self.source_depth, self.receiver_depth)
+        self.recalc_phases()
+        arrivals = [[] for _ in range(len(degrees))]
+        for phase in self.phases:
+            for arrivals_, phase_arrivals in zip(
+                    arrivals, phase.calc_time_many(degrees)):
+                arrivals_ += phase_arrivals
+        return [sorted(arrivals_, key=lambda arrival: arrival.time)
+                for arrivals_ in arrivals]
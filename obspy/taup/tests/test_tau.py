@@ -20,6 +20,8 @@ import numpy as np
 from obspy.core.util.misc import TemporaryWorkingDirectory
 from obspy.taup import TauPyModel
 from obspy.taup.tau import Arrivals
+from obspy.taup.tau_model import (DepthCache, _MODEL_REGISTRY,
+                                  clear_model_registry)
 from obspy.taup.taup_create import build_taup_model
 import obspy.geodetics.base as geodetics
 
@@ -1003,6 +1005,157 @@ class TauPyModelTestCase(unittest.TestCase):
         with self.assertRaises(TypeError):
             arrivals *= [2, ]
 
+    def test_get_travel_times_bulk(self):
+        """
+        Tests that travel times for many distances at once are the same as
+        the ones calculated for every single distance.
+        """
+        model = TauPyModel(model='iasp91')
+        distances = [0, 0.5, 25.3, 97.0, 155.5, 180, 210, 400, -30]
+        depths = [10, 10, 0, 300, 10, 655, 10, 300, 0]
+        for phase_list in (("ttall", ), ["P", "Pdiff", "Pn", "3kmps"]):
+            bulk = model.get_travel_times_bulk(depths, distances,
+                                               phase_list=phase_list)
+            self.assertEqual(len(bulk), len(distances))
+            for depth, distance, arrivals in zip(depths, distances, bulk):
+                self.assertTrue(isinstance(arrivals, Arrivals))
+                expected = model.get_travel_times(depth, distance,
+                                                  phase_list=phase_list)
+                self.assertEqual(len(arrivals), len(expected))
+                for arr, exp in zip(arrivals, expected):
+                    self.assertEqual(arr.name, exp.name)
+                    self.assertEqual(arr.distance, exp.distance)
+                    self.assertEqual(arr.source_depth, exp.source_depth)
+                    self.assertEqual(arr.ray_param_index,
+                                     exp.ray_param_index)
+                    for attr in ("time", "ray_param", "purist_dist",
+                                 "takeoff_angle", "incident_angle"):
+                        self.assertAlmostEqual(getattr(arr, attr),
+                                               getattr(exp, attr), 9)
+        # a single depth for all distances
+        bulk = model.get_travel_times_bulk(10, [20, 40], phase_list=["P"])
+        self.assertEqual(len(bulk), 2)
+        self.assertAlmostEqual(bulk[0][0].time, 272.676, 3)
+        self.assertRaises(ValueError, model.get_travel_times_bulk, 10,
+                          [[20, 40]])
+
+    @unittest.skipIf(not geodetics.GEOGRAPHICLIB_VERSION_AT_LEAST_1_34,
+                     'test needs geographiclib >= 1.34')
+    def test_get_ray_paths_and_pierce_points_geo_bulk(self):
+        """
+        Bulk ray paths and pierce points are the same as calculated for every
+        receiver on its own.
+        """
+        receivers = [(0.0, 40.0), (-30.0, 170.0), (60.0, -100.0),
+                     (10.0, 20.5)]
+        phase_list = ["P", "PKIKP", "Pdiff", "SS"]
+        for flattening in (0.0, 1 / 298.257223563):
+            m = TauPyModel(model="iasp91", planet_flattening=flattening)
+            for method, attr in (("get_ray_paths_geo", "path"),
+                                 ("get_pierce_points_geo", "pierce")):
+                bulk = getattr(m, method + "_bulk")(
+                    33.0, 10.0, 20.0, [lat for lat, _ in receivers],
+                    [lon for _, lon in receivers], phase_list=phase_list,
+                    resample=True)
+                self.assertEqual(len(bulk), len(receivers))
+                for arrivals, (lat, lon) in zip(bulk, receivers):
+                    expected = getattr(m, method)(
+                        33.0, 10.0, 20.0, lat, lon, phase_list=phase_list,
+                        resample=True)
+                    self.assertEqual([arr.name for arr in arrivals],
+                                     [arr.name for arr in expected])
+                    for arr, exp in zip(arrivals, expected):
+                        self.assertEqual(arr.time, exp.time)
+                        self.assertEqual(arr.azimuth, exp.azimuth)
+                        np.testing.assert_array_equal(getattr(arr, attr),
+                                                      getattr(exp, attr))
+        # the great circle positions match geographiclib
+        m = TauPyModel(model="iasp91")
+        arr = m.get_ray_paths_geo(33.0, 10.0, 20.0, 60.0, -100.0,
+                                  phase_list=["SS"])[0]
+        m = TauPyModel(model="iasp91", planet_flattening=1e-12)
+        exp = m.get_ray_paths_geo(33.0, 10.0, 20.0, 60.0, -100.0,
+                                  phase_list=["SS"])[0]
+        np.testing.assert_allclose(arr.path['lat'], exp.path['lat'],
+                                   atol=1e-6)
+        np.testing.assert_allclose(arr.path['lon'], exp.path['lon'],
+                                   atol=1e-6)
+
+    def test_depth_cache(self):
+        """
+        Tests cache size, counters and sharing via a cache directory.
+        """
+        cache = DepthCache(maxsize=2)
+        m = TauPyModel(model="iasp91", cache=cache)
+        ref = TauPyModel(model="iasp91", cache=False)
+        for depth in (10, 20, 10, 30, 10):
+            arrivals = m.get_travel_times(depth, 50, phase_list=["P"])
+            expected = ref.get_travel_times(depth, 50, phase_list=["P"])
+            self.assertEqual(arrivals[0].time, expected[0].time)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.disk_hits, cache.misses),
+                         (2, 0, 3))
+        # a cache can be shared between different models
+        m2 = TauPyModel(model="ak135", cache=cache)
+        m2.get_travel_times(10, 50, phase_list=["P"])
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+        with TemporaryWorkingDirectory():
+            cache = DepthCache(directory="depth_cache")
+            m = TauPyModel(model="iasp91", cache=cache)
+            expected = m.get_travel_times(10, 50, phase_list=["P"])
+            self.assertEqual(len(os.listdir("depth_cache")), 1)
+            # e.g. another process using the same directory
+            other = DepthCache(directory="depth_cache")
+            m = TauPyModel(model="iasp91", cache=other)
+            arrivals = m.get_travel_times(10, 50, phase_list=["P"])
+            self.assertEqual(arrivals[0].time, expected[0].time)
+            self.assertEqual((other.hits, other.disk_hits, other.misses),
+                             (0, 1, 0))
+            m.get_travel_times(10, 60, phase_list=["P"])
+            self.assertEqual((other.hits, other.disk_hits, other.misses),
+                             (1, 1, 0))
+
+    def test_model_registry(self):
+        """
+        Models loaded from the same file share their data but not their
+        depth caches.
+        """
+        m1 = TauPyModel(model="iasp91")
+        m2 = TauPyModel(model="iasp91", cache=False)
+        self.assertIsNot(m1.model, m2.model)
+        self.assertIs(m1.model.tau_branches, m2.model.tau_branches)
+        self.assertIs(m1.model.s_mod, m2.model.s_mod)
+        self.assertIsNotNone(m1.model._depth_cache)
+        self.assertIsNone(m2.model._depth_cache)
+        self.assertIsNot(TauPyModel(model="iasp91").model._depth_cache,
+                         m1.model._depth_cache)
+        # depth correction does not modify the shared model
+        ray_params = m1.model.ray_params.copy()
+        critical_depths = m1.model.s_mod.critical_depths.copy()
+        for depth in (0.0, 35.0, 123.4):
+            a1 = m1.get_travel_times(depth, 50, phase_list=["P", "S"])
+            a2 = m2.get_travel_times(depth, 50, phase_list=["P", "S"])
+            self.assertEqual([a.time for a in a1], [a.time for a in a2])
+        np.testing.assert_array_equal(m1.model.ray_params, ray_params)
+        np.testing.assert_array_equal(m1.model.s_mod.critical_depths,
+                                      critical_depths)
+        # the registry only keeps the most recently used models
+        for name in ("ak135", "prem", "jb", "pwdk", "sp6", "1066a", "1066b"):
+            TauPyModel(model=name, cache=False)
+        self.assertIs(TauPyModel(model="iasp91").model.s_mod,
+                      m1.model.s_mod)
+        TauPyModel(model="herrin", cache=False)
+        self.assertEqual(len(_MODEL_REGISTRY), 8)
+        clear_model_registry()
+        self.assertEqual(len(_MODEL_REGISTRY), 0)
+        self.assertIsNot(TauPyModel(model="iasp91").model.s_mod,
+                         m1.model.s_mod)
+        # cached models at branch boundaries do not carry a copy of the cache
+        self.assertIsNone(m1.model.depth_correct(35.0)._depth_cache)
+
     def test_regional_models(self):
         """
         Tests small regional models as this used to not work.
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests the TravelTimeGrid class.
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import io
+import unittest
+
+import numpy as np
+
+from obspy.core.util.base import NamedTemporaryFile
+from obspy.taup.tau import TauPyModel
+from obspy.taup.travel_time_grid import InterpolatedArrival, TravelTimeGrid
+
+
+class TravelTimeGridTestCase(unittest.TestCase):
+    """
+    Test suite for the TravelTimeGrid class.
+    """
+    def setUp(self):
+        self.model = TauPyModel('iasp91')
+        self.phases = ["P", "PKiKP", "S"]
+        # coarse grid to keep the test fast, so allow larger errors
+        self.grid = TravelTimeGrid.build(
+            self.model, depths=[0, 50, 100], distances=np.arange(0, 181, 5),
+            phase_list=self.phases, max_error=1.0)
+
+    def test_interpolated_travel_times(self):
+        """
+        Interpolated first arrivals are close to the exact first arrivals.
+        """
+        model = TauPyModel('iasp91', travel_time_grid=self.grid)
+        for depth, distance in ((10, 20.5), (33.3, 55.5), (75, 123.4),
+                                (0, 0.3), (100, 180), (20, 240)):
+            arrivals = model.get_travel_times(depth, distance,
+                                              phase_list=self.phases)
+            expected = {}
+            for arr in self.model.get_travel_times(depth, distance,
+                                                   phase_list=self.phases):
+                expected.setdefault(arr.name, arr)
+            self.assertEqual(sorted(arr.name for arr in arrivals),
+                             sorted(expected))
+            for arr in arrivals:
+                exp = expected[arr.name]
+                self.assertEqual(arr.distance, distance)
+                self.assertAlmostEqual(arr.time, exp.time, delta=1.5)
+                self.assertAlmostEqual(arr.ray_param, exp.ray_param,
+                                       delta=0.05 * exp.ray_param + 1)
+        arrivals = model.get_travel_times(10, 55.5, phase_list=["P"])
+        self.assertTrue(isinstance(arrivals[0], InterpolatedArrival))
+        self.assertIsNone(arrivals[0].phase)
+        # outside of the grid exact first arrivals are calculated
+        arrivals = model.get_travel_times(300, 20.5, phase_list=["P"])
+        self.assertEqual(len(arrivals), 1)
+        self.assertFalse(isinstance(arrivals[0], InterpolatedArrival))
+        # phases not in the grid use the normal calculation
+        arrivals = model.get_travel_times(10, 20.5, phase_list=["P", "PP"])
+        for arr in arrivals:
+            self.assertFalse(isinstance(arr, InterpolatedArrival))
+
+    def test_phase_distance_limit(self):
+        """
+        Phases missing somewhere in a cell are calculated exactly.
+        """
+        # PKP only exists between about 145 and 176 degrees, so it is
+        # missing at all corners and the center of the cell from 90 to 180
+        # degrees
+        grid = TravelTimeGrid.build(self.model, depths=[0, 10],
+                                    distances=[0, 90, 180],
+                                    phase_list=["P", "PKP"])
+        model = TauPyModel('iasp91', travel_time_grid=grid)
+        self.assertTrue(np.isnan(grid.data["time"][:, 1:, 1]).all())
+        for distance in (150, 176):
+            arrivals = model.get_travel_times(5, distance, phase_list=["PKP"])
+            expected = self.model.get_travel_times(5, distance,
+                                                   phase_list=["PKP"])
+            self.assertEqual(len(arrivals), 1)
+            self.assertFalse(isinstance(arrivals[0], InterpolatedArrival))
+            self.assertEqual(arrivals[0].time, expected[0].time)
+        # close to the end of P
+        for distance in (97.9, 98.4):
+            arrivals = self.model.get_travel_times(5, distance,
+                                                   phase_list=["P"])
+            self.assertEqual(
+                [arr.time for arr in model.get_travel_times(
+                    5, distance, phase_list=["P"])],
+                [arr.time for arr in arrivals])
+
+    def test_interpolate(self):
+        """
+        Tests vectorized interpolation and the error bound.
+        """
+        result, valid = self.grid.interpolate([10, 10, 500], [55.5, 400, 20])
+        self.assertEqual(result.shape, (3, len(self.phases)))
+        # all phases at 55.5 and 40 (400 - 360) degrees are fine, 500 km depth
+        # is outside the grid
+        np.testing.assert_array_equal(valid[:2], True)
+        np.testing.assert_array_equal(valid[2], False)
+        self.assertTrue(np.isnan(result["time"][2]).all())
+        expected = self.model.get_travel_times(10, 40, phase_list=["P"])
+        self.assertAlmostEqual(result["time"][1, 0], expected[0].time,
+                               delta=self.grid.max_error)
+        # no cell is interpolated with a zero error bound
+        result, valid = self.grid.interpolate(10, 55.5, max_error=-1)
+        self.assertFalse(valid.any())
+
+    def test_save_and_load(self):
+        """
+        Grids can be written and read again as npz files.
+        """
+        buf = io.BytesIO()
+        self.grid.save(buf)
+        buf.seek(0)
+        grid = TravelTimeGrid.load(buf)
+        self.assertEqual(grid.model_name, self.grid.model_name)
+        self.assertEqual(grid.phase_names, self.grid.phase_names)
+        np.testing.assert_array_equal(grid.depths, self.grid.depths)
+        np.testing.assert_array_equal(grid.distances, self.grid.distances)
+        for field in grid.data.dtype.names:
+            np.testing.assert_array_equal(grid.data[field],
+                                          self.grid.data[field])
+        np.testing.assert_array_equal(grid.error, self.grid.error)
+        # load from file when initializing the model
+        with NamedTemporaryFile(suffix=".npz") as tf:
+            self.grid.save(tf.name)
+            model = TauPyModel('iasp91', travel_time_grid=tf.name)
+        self.assertEqual(model.travel_time_grid.phase_names, self.phases)
+        # grids only work with the model they were created for
+        self.assertRaises(ValueError, TauPyModel, 'ak135',
+                          travel_time_grid=self.grid)
+
+
+def suite():
+    return unittest.makeSuite(TravelTimeGridTestCase, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
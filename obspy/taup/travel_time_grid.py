@@ -0,0 +1,373 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Precomputed grids of first arrivals for fast interpolated travel times.
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+from future.utils import native_str
+
+import numpy as np
+
+from .helper_classes import Arrival
+from .taup_time import TauPTime
+from .utils import parse_phase_list
+
+
+GridArrival = np.dtype([
+    (native_str('time'), np.float_),
+    (native_str('ray_param'), np.float_),
+    (native_str('takeoff_angle'), np.float_),
+    (native_str('incident_angle'), np.float_),
+    (native_str('purist_dist'), np.float_),
+])
+
+
+class InterpolatedArrival(Arrival):
+    """
+    Arrival interpolated from a
+    :class:`~obspy.taup.travel_time_grid.TravelTimeGrid`.
+
+    In contrast to a normal
+    :class:`~obspy.taup.helper_classes.Arrival` it is not connected to a
+    :class:`~obspy.taup.seismic_phase.SeismicPhase`, so ``phase`` and
+    ``ray_param_index`` are ``None`` and pierce points or ray paths can not
+    be calculated for it. The ``purist_name`` is always the phase name.
+    """
+    def __init__(self, distance, time, purist_dist, ray_param, name,
+                 source_depth, receiver_depth, takeoff_angle,
+                 incident_angle):
+        self.phase = None
+        self.distance = distance
+        self.time = time
+        self.purist_dist = purist_dist
+        self.ray_param = ray_param
+        self.ray_param_index = None
+        self.name = name
+        self.purist_name = name
+        self.source_depth = source_depth
+        self.receiver_depth = receiver_depth
+        self.takeoff_angle = takeoff_angle
+        self.incident_angle = incident_angle
+        self.pierce = None
+        self.path = None
+
+    def __str__(self):
+        return "%s phase arrival at %.3f seconds (interpolated)" % (
+            self.name, self.time)
+
+
+class TravelTimeGrid(object):
+    """
+    Grid of first arrivals of some phases for interpolated travel times.
+
+    Holds travel time, ray parameter, takeoff and incident angle and purist
+    distance of the first arrival of every phase on a grid of source depths
+    and epicentral distances. Values in between are bilinearly interpolated
+    which is orders of magnitude faster than calculating the arrivals.
+
+    For every grid cell, the interpolation error of the travel time is
+    estimated while creating the grid by comparing the interpolated and the
+    exactly calculated travel time at the center of the cell. Cells with a
+    larger estimated error than ``max_error`` or in which a phase is missing
+    at any corner or at the center are not interpolated, the arrivals of
+    such phases are calculated exactly.
+
+    Grids are created with :meth:`build` and can be saved to and loaded from
+    numpy ``.npz`` files. Passing a grid to
+    :class:`~obspy.taup.tau.TauPyModel` makes
+    :meth:`~obspy.taup.tau.TauPyModel.get_travel_times` use it.
+
+    >>> from obspy.taup import TauPyModel
+    >>> from obspy.taup.travel_time_grid import TravelTimeGrid
+    >>> model = TauPyModel("iasp91")
+    >>> grid = TravelTimeGrid.build(model, depths=[0, 10, 20, 30],
+    ...                             distances=range(30, 91, 2),
+    ...                             phase_list=["P"])
+    >>> model = TauPyModel("iasp91", travel_time_grid=grid)
+    >>> arrivals = model.get_travel_times(15, 55.5, phase_list=["P"])
+    >>> print(arrivals[0])  # doctest: +ELLIPSIS
+    P phase arrival at 574.1... seconds (interpolated)
+    """
+    def __init__(self, model_name, phase_names, depths, distances, data,
+                 error, receiver_depth=0.0, max_error=0.1):
+        """
+        :param model_name: Name of the velocity model of the grid.
+        :type model_name: str
+        :param phase_names: Names of the phases in the grid.
+        :type phase_names: list of str
+        :param depths: Increasing source depths of the grid in km.
+        :type depths: :class:`~numpy.ndarray`
+        :param distances: Increasing epicentral distances of the grid in
+            degrees, between 0 and 180.
+        :type distances: :class:`~numpy.ndarray`
+        :param data: First arrivals of all phases at all grid points, NaN if
+            a phase does not exist at a grid point.
+        :type data: :class:`~numpy.ndarray` (dtype = :const:`GridArrival`,
+            shape = ``(len(depths), len(distances), len(phase_names))``)
+        :param error: Estimated travel time interpolation error in seconds of
+            all phases in all grid cells, infinite if the cell can not be
+            interpolated (e.g. because the phase is missing somewhere).
+        :type error: :class:`~numpy.ndarray` (shape =
+            ``(len(depths) - 1, len(distances) - 1, len(phase_names))``)
+        :param receiver_depth: Receiver depth in km.
+        :type receiver_depth: float
+        :param max_error: Maximum estimated travel time interpolation error in
+            seconds. Cells with larger errors are not interpolated.
+        :type max_error: float
+        """
+        self.model_name = model_name
+        self.phase_names = list(phase_names)
+        self.depths = np.asarray(depths, dtype=np.float64)
+        self.distances = np.asarray(distances, dtype=np.float64)
+        self.data = data
+        self.error = error
+        self.receiver_depth = float(receiver_depth)
+        self.max_error = max_error
+        if len(self.depths) < 2 or len(self.distances) < 2:
+            msg = "Grid needs at least two depths and two distances."
+            raise ValueError(msg)
+        if np.any(np.diff(self.depths) <= 0) or \
+                np.any(np.diff(self.distances) <= 0):
+            msg = "Depths and distances of the grid must be increasing."
+            raise ValueError(msg)
+        if self.distances[0] < 0 or self.distances[-1] > 180:
+            msg = "Distances of the grid must be between 0 and 180 degrees."
+            raise ValueError(msg)
+        shape = (len(self.depths), len(self.distances), len(self.phase_names))
+        if data.shape != shape or \
+                error.shape != (shape[0] - 1, shape[1] - 1, shape[2]):
+            msg = "Shape of grid data does not match depths/distances/phases."
+            raise ValueError(msg)
+
+    def __str__(self):
+        return ("Travel time grid for model '%s' with %d phases, source "
+                "depths %g - %g km (%d), distances %g - %g degree (%d)" % (
+                    self.model_name, len(self.phase_names), self.depths[0],
+                    self.depths[-1], len(self.depths), self.distances[0],
+                    self.distances[-1], len(self.distances)))
+
+    def _repr_pretty_(self, p, cycle):
+        p.text(str(self))
+
+    @classmethod
+    def build(cls, model, depths, distances, phase_list=("ttbasic", ),
+              receiver_depth_in_km=0.0, max_error=0.1):
+        """
+        Calculate a new grid.
+
+        :param model: Model to calculate the grid for.
+        :type model: :class:`~obspy.taup.tau.TauPyModel`
+        :param depths: Source depths of the grid in km.
+        :type depths: array-like
+        :param distances: Epicentral distances of the grid in degrees,
+            between 0 and 180.
+        :type distances: array-like
+        :param phase_list: List of phases to include in the grid.
+        :type phase_list: list of str
+        :param receiver_depth_in_km: Receiver depth in km
+        :type receiver_depth_in_km: float
+        :param max_error: Maximum estimated travel time interpolation error in
+            seconds. Cells with larger errors are not interpolated.
+        :type max_error: float
+        :rtype: :class:`TravelTimeGrid`
+        """
+        depths = np.unique(np.asarray(depths, dtype=np.float64))
+        distances = np.unique(np.asarray(distances, dtype=np.float64))
+        phase_names = sorted(parse_phase_list(phase_list))
+
+        def _first_arrivals(depths_, distances_):
+            data = np.empty((len(depths_), len(distances_), len(phase_names)),
+                            dtype=GridArrival)
+            for field in GridArrival.names:
+                data[field] = np.nan
+            for i, depth in enumerate(depths_):
+                bulk = model.get_travel_times_bulk(
+                    depth, distances_, phase_list=phase_names,
+                    receiver_depth_in_km=receiver_depth_in_km)
+                for j, arrivals in enumerate(bulk):
+                    # arrivals are sorted by time, so keep the first ones
+                    for arrival in reversed(arrivals):
+                        k = phase_names.index(arrival.name)
+                        data[i, j, k] = (
+                            arrival.time, arrival.ray_param,
+                            arrival.takeoff_angle, arrival.incident_angle,
+                            arrival.purist_dist)
+            return data
+
+        data = _first_arrivals(depths, distances)
+        # Exact travel times at the cell centers for the error estimate.
+        centers = _first_arrivals((depths[:-1] + depths[1:]) / 2.0,
+                                  (distances[:-1] + distances[1:]) / 2.0)
+        time = data["time"]
+        corners = np.stack([time[:-1, :-1], time[:-1, 1:], time[1:, :-1],
+                            time[1:, 1:]])
+        with np.errstate(invalid='ignore'):
+            error = np.abs(corners.mean(axis=0) - centers["time"])
+        # Phases missing anywhere might still exist somewhere else in the
+        # cell, e.g. close to the distance limit of the phase.
+        error[np.isnan(error)] = np.inf
+        model_name = model.model.s_mod.v_mod.model_name
+        return cls(model_name, phase_names, depths, distances, data, error,
+                   receiver_depth=receiver_depth_in_km, max_error=max_error)
+
+    def save(self, filename):
+        """
+        Save grid to a numpy ``.npz`` file.
+
+        :param filename: Filename or file-like object to write to.
+        """
+        np.savez_compressed(
+            filename, model_name=np.array(self.model_name),
+            phase_names=np.array(self.phase_names), depths=self.depths,
+            distances=self.distances, data=self.data, error=self.error,
+            receiver_depth=np.array(self.receiver_depth),
+            max_error=np.array(self.max_error))
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Load grid from a numpy ``.npz`` file written by :meth:`save`.
+
+        :param filename: Filename or file-like object to read from.
+        :rtype: :class:`TravelTimeGrid`
+        """
+        with np.load(filename) as npz:
+            return cls(
+                model_name=str(npz["model_name"]),
+                phase_names=[str(name) for name in npz["phase_names"]],
+                depths=npz["depths"], distances=npz["distances"],
+                data=npz["data"], error=npz["error"],
+                receiver_depth=float(npz["receiver_depth"]),
+                max_error=float(npz["max_error"]))
+
+    def interpolate(self, source_depth_in_km, distance_in_degree,
+                    max_error=None):
+        """
+        Interpolate the first arrivals of all phases in the grid.
+
+        :param source_depth_in_km: Source depths in km.
+        :type source_depth_in_km: float or array-like
+        :param distance_in_degree: Epicentral distances in degrees.
+        :type distance_in_degree: float or array-like
+        :param max_error: Maximum estimated travel time interpolation error in
+            seconds, defaults to ``max_error`` of the grid.
+        :type max_error: float
+        :returns: Interpolated arrivals of shape ``(N, len(phase_names))`` for
+            ``N`` given depths/distances (broadcast against each other) and a
+            boolean array of the same shape which is ``True`` where the
+            interpolation is valid. Arrivals are NaN where they are not
+            valid.
+        :rtype: tuple of :class:`~numpy.ndarray` (dtype =
+            :const:`GridArrival`) and :class:`~numpy.ndarray` (dtype = bool)
+        """
+        if max_error is None:
+            max_error = self.max_error
+        depths, distances = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(source_depth_in_km, dtype=np.float64)),
+            np.atleast_1d(np.asarray(distance_in_degree, dtype=np.float64)))
+        depths = depths.ravel()
+        distances = np.abs(distances.ravel()) % 360.0
+        distances = np.where(distances > 180.0, 360.0 - distances, distances)
+
+        inside = ((depths >= self.depths[0]) & (depths <= self.depths[-1]) &
+                  (distances >= self.distances[0]) &
+                  (distances <= self.distances[-1]))
+        i = np.clip(np.searchsorted(self.depths, depths, side="right") - 1,
+                    0, len(self.depths) - 2)
+        j = np.clip(np.searchsorted(self.distances, distances,
+                                    side="right") - 1,
+                    0, len(self.distances) - 2)
+        u = ((depths - self.depths[i]) /
+             (self.depths[i + 1] - self.depths[i]))[:, np.newaxis]
+        v = ((distances - self.distances[j]) /
+             (self.distances[j + 1] - self.distances[j]))[:, np.newaxis]
+
+        result = np.empty((len(depths), len(self.phase_names)),
+                          dtype=GridArrival)
+        for field in GridArrival.names:
+            values = self.data[field]
+            result[field] = (
+                (1 - u) * (1 - v) * values[i, j] +
+                (1 - u) * v * values[i, j + 1] +
+                u * (1 - v) * values[i + 1, j] +
+                u * v * values[i + 1, j + 1])
+        valid = inside[:, np.newaxis] & (self.error[i, j] <= max_error)
+        for field in GridArrival.names:
+            result[field][~valid] = np.nan
+        return result, valid
+
+    def get_travel_times(self, model, source_depth_in_km, distance_in_degree,
+                         phase_list=None, receiver_depth_in_km=0.0):
+        """
+        Return the first arrival of every given phase.
+
+        Arrivals are interpolated from the grid where possible and calculated
+        exactly otherwise.
+
+        :param model: Model to calculate arrivals with that can not be
+            interpolated.
+        :type model: :class:`~obspy.taup.tau.TauPyModel`
+        :param source_depth_in_km: Source depth in km
+        :type source_depth_in_km: float
+        :param distance_in_degree: Epicentral distance in degrees.
+        :type distance_in_degree: float
+        :param phase_list: List of phases, defaults to all phases of the
+            grid. All phases must be part of the grid.
+        :type phase_list: list of str
+        :param receiver_depth_in_km: Receiver depth in km, must be the
+            receiver depth of the grid.
+        :type receiver_depth_in_km: float
+        :rtype: :class:`~obspy.taup.tau.Arrivals`
+        """
+        from .tau import Arrivals
+        phase_names = self.phase_names if phase_list is None \
+            else parse_phase_list(phase_list)
+        if not self.covers(phase_names, receiver_depth_in_km):
+            msg = "Phases or receiver depth are not covered by the grid."
+            raise ValueError(msg)
+        result, valid = self.interpolate(source_depth_in_km,
+                                         distance_in_degree)
+        result, valid = result[0], valid[0]
+        arrivals = []
+        exact = []
+        for name in phase_names:
+            k = self.phase_names.index(name)
+            if not valid[k]:
+                exact.append(name)
+            else:
+                arrivals.append(InterpolatedArrival(
+                    distance_in_degree, result[k]["time"],
+                    result[k]["purist_dist"], result[k]["ray_param"], name,
+                    source_depth_in_km, receiver_depth_in_km,
+                    result[k]["takeoff_angle"], result[k]["incident_angle"]))
+        if exact:
+            tt = TauPTime(model.model, exact, source_depth_in_km,
+                          distance_in_degree, receiver_depth_in_km)
+            tt.run()
+            names = set()
+            for arrival in tt.arrivals:
+                if arrival.name not in names:
+                    names.add(arrival.name)
+                    arrivals.append(arrival)
+        return Arrivals(sorted(arrivals, key=lambda x: x.time),
+                        model=model.model)
+
+    def covers(self, phase_list, receiver_depth_in_km=0.0):
+        """
+        Check if the grid contains all given phases at the receiver depth.
+
+        :param phase_list: List of phases.
+        :type phase_list: list of str
+        :param receiver_depth_in_km: Receiver depth in km
+        :type receiver_depth_in_km: float
+        :rtype: bool
+        """
+        return (float(receiver_depth_in_km) == self.receiver_depth and
+                set(parse_phase_list(phase_list)).issubset(self.phase_names))
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)